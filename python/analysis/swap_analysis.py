@@ -35,7 +35,7 @@ class DexAnalyzer:
                 GROUP BY factory_address
                 HAVING COUNT(*) >= %(min_swaps)s
             """
-            with self.db.sql.db.get_connection() as conn:
+            with self.db.sql.db.connection() as conn:
                 factory_df = pd.read_sql(factory_query, conn, params={
                     'chain': chain,
                     'min_swaps': min_swaps
@@ -106,7 +106,7 @@ class DexAnalyzer:
         query += " ORDER BY s.timestamp ASC"
             
         # Execute query and return DataFrame
-        with self.db.sql.db.get_connection() as conn:
+        with self.db.sql.db.connection() as conn:
             df = pd.read_sql(query, conn, params=params)
 
         if df.empty:
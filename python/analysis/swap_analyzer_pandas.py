@@ -47,7 +47,7 @@ class SwapAnalyzerPandas:
         query += " ORDER BY timestamp ASC"
         
         # Use the database operator to execute the query
-        with self.db.sql.db.get_connection() as conn:
+        with self.db.sql.db.connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query, params)
             results = cursor.fetchall()
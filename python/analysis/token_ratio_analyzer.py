@@ -69,7 +69,7 @@ class TokenRatioAnalyzer:
         query += " ORDER BY timestamp ASC"
         
         # Execute query and create DataFrame
-        with self.db.sql.db.get_connection() as conn:
+        with self.db.sql.db.connection() as conn:
             df = pd.read_sql_query(query, conn, params=params)
             
         if df.empty:
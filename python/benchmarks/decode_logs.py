@@ -0,0 +1,176 @@
+# python/benchmarks/decode_logs.py
+"""
+Compare log decoding throughput: the per-log decode EVMDecoder used to do
+against the precompiled DecodePlan.
+
+Record a corpus of mainnet logs once (raw eth_getLogs JSON from
+Settings.ETHEREUM_ENDPOINT), then replay it as often as needed. Logs are
+decoded against the common ERC20/DEX events below; logs for other events
+are skipped and counted.
+
+    python benchmarks/decode_logs.py --record --blocks 50
+    python benchmarks/decode_logs.py --rounds 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+# Add the python directory to PYTHONPATH
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PYTHON_DIR)
+
+from eth_abi.codec import ABICodec
+from eth_abi.registry import registry
+from config import Settings
+from chains.evm_models.rpc import AsyncRPCClient, format_log
+from chains.evm_models.processing.logs.decoder import EVMDecoder
+from chains.evm_models.processing.logs.decode_plan import DecodePlan
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mainnet_logs.json')
+
+
+def _event(name, *inputs):
+    return {
+        "type": "event",
+        "name": name,
+        "inputs": [{"name": n, "type": t, "indexed": indexed} for n, t, indexed in inputs]
+    }
+
+
+EVENT_ABIS = [
+    _event("Transfer", ("from", "address", True), ("to", "address", True), ("value", "uint256", False)),
+    _event("Approval", ("owner", "address", True), ("spender", "address", True), ("value", "uint256", False)),
+    _event("Deposit", ("dst", "address", True), ("wad", "uint256", False)),
+    _event("Withdrawal", ("src", "address", True), ("wad", "uint256", False)),
+    _event("Sync", ("reserve0", "uint112", False), ("reserve1", "uint112", False)),
+    _event("Swap", ("sender", "address", True), ("amount0In", "uint256", False), ("amount1In", "uint256", False),
+           ("amount0Out", "uint256", False), ("amount1Out", "uint256", False), ("to", "address", True)),
+    _event("Swap", ("sender", "address", True), ("recipient", "address", True), ("amount0", "int256", False),
+           ("amount1", "int256", False), ("sqrtPriceX96", "uint160", False), ("liquidity", "uint128", False), ("tick", "int24", False)),
+]
+
+
+def legacy_decode(abi_codec, log, event_sig):
+    """
+    EVMDecoder._decode_log as it was before decode plans, kept as the baseline.
+    """
+    try:
+        topics = log.get("topics", [])
+        if len(topics) < 1:
+            return {"event": "Unknown", "raw_log": log}
+        if not event_sig.input_types:
+            return {"event": event_sig.event_name}
+
+        topics = topics[1:]
+        data = log.get("data", "0x")
+        result = {"event": event_sig.event_name, "parameters": {}}
+
+        input_names = event_sig.input_names
+        input_descriptions = [i.get("description", "") for i in event_sig.inputs]
+
+        topic_index = 0
+        for input_type, is_indexed, input_name, description in zip(
+            event_sig.input_types, event_sig.indexed_inputs, input_names, input_descriptions
+        ):
+            if not is_indexed:
+                continue
+            if topic_index >= len(topics):
+                break
+            topic = topics[topic_index]
+            topic_index += 1
+            if input_type in ["bytes", "string"]:
+                value = topic.hex()
+            else:
+                try:
+                    value = abi_codec.decode([input_type], bytes.fromhex(topic.hex()))[0]
+                except Exception as e:
+                    value = f"DecodeError: {str(e)}"
+            result["parameters"][input_name] = {
+                "value": value, "type": input_type, "indexed": True, "description": description if description else None
+            }
+
+        if data != "0x":
+            non_indexed_info = [
+                (t, name, desc)
+                for t, idx, name, desc in zip(event_sig.input_types, event_sig.indexed_inputs, input_names, input_descriptions)
+                if not idx
+            ]
+            try:
+                values = abi_codec.decode([t for t, _, _ in non_indexed_info], bytes.fromhex(data.hex()))
+                for (input_type, name, description), value in zip(non_indexed_info, values):
+                    result["parameters"][name] = {
+                        "value": value, "type": input_type, "indexed": False, "description": description if description else None
+                    }
+            except Exception as e:
+                result["data_decode_error"] = str(e)
+        return result
+    except Exception as e:
+        return {"event": event_sig.event_name, "decode_error": str(e), "raw_log": log}
+
+
+async def record(corpus: str, blocks: int):
+    rpc = AsyncRPCClient('ethereum', Settings.ETHEREUM_ENDPOINT)
+    try:
+        latest = int(await rpc.request("eth_blockNumber"), 16)
+        logs = await rpc.request("eth_getLogs", [{"fromBlock": hex(latest - blocks + 1), "toBlock": hex(latest)}])
+    finally:
+        await rpc.close()
+    with open(corpus, 'w') as f:
+        json.dump(logs, f)
+    print(f"Recorded {len(logs)} logs from blocks {latest - blocks + 1}-{latest} to {corpus}")
+
+
+def replay(corpus: str, rounds: int):
+    with open(corpus) as f:
+        logs = [format_log(log) for log in json.load(f)]
+
+    signatures = {}
+    for abi in EVENT_ABIS:
+        event_sig = EVMDecoder.get_event_signature(abi)
+        signatures[event_sig.signature_hash] = event_sig
+    known = [(log, signatures[log["topics"][0].hex()]) for log in logs if log["topics"] and log["topics"][0].hex() in signatures]
+    print(f"{len(known)} of {len(logs)} logs match a benchmark event")
+    if not known:
+        return
+
+    abi_codec = ABICodec(registry)
+    plans = {signature: DecodePlan(event_sig, abi_codec) for signature, event_sig in signatures.items()}
+    mismatches = sum(
+        legacy_decode(abi_codec, log, event_sig) != plans[event_sig.signature_hash].decode(log)
+        for log, event_sig in known
+    )
+    if mismatches:
+        print(f"warning: {mismatches} logs decoded differently")
+
+    runs = (
+        ('per-log decode', lambda log, event_sig: legacy_decode(abi_codec, log, event_sig)),
+        ('decode plan', lambda log, event_sig: plans[event_sig.signature_hash].decode(log)),
+    )
+    for name, decode in runs:
+        started = time.perf_counter()
+        for _ in range(rounds):
+            for log, event_sig in known:
+                decode(log, event_sig)
+        elapsed = time.perf_counter() - started
+        print(f"{name:>15}: {len(known) * rounds / elapsed:,.0f} logs/sec")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS)
+    parser.add_argument('--record', action='store_true', help='Fetch a fresh corpus instead of replaying')
+    parser.add_argument('--blocks', type=int, default=50, help='Blocks to record, ending at the head')
+    parser.add_argument('--rounds', type=int, default=3, help='Passes over the corpus per decoder')
+    args = parser.parse_args()
+
+    if args.record:
+        asyncio.run(record(args.corpus, args.blocks))
+    else:
+        replay(args.corpus, args.rounds)
+
+
+if __name__ == '__main__':
+    main()
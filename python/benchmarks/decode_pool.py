@@ -0,0 +1,79 @@
+# python/benchmarks/decode_pool.py
+"""
+Measure log decoding throughput of DecodePool across worker counts, against
+decoding in the event loop (0 workers).
+
+Replays the corpus recorded by decode_logs.py, decoding the logs that match
+its benchmark events in blocks of --block-size logs, one block at a time
+like LogProcessor does.
+
+    python benchmarks/decode_logs.py --record --blocks 50
+    python benchmarks/decode_pool.py --workers 1 2 4 8 --rounds 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+# Add the python directory to PYTHONPATH
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PYTHON_DIR)
+
+from eth_abi.codec import ABICodec
+from eth_abi.registry import registry
+from chains.evm_models.rpc import format_log
+from chains.evm_models.processing.logs.decoder import EVMDecoder
+from chains.evm_models.processing.logs.decode_plan import DecodePlan
+from chains.evm_models.processing.logs.decode_pool import DecodePool
+from decode_logs import DEFAULT_CORPUS, EVENT_ABIS
+
+
+def load_items(corpus: str) -> list:
+    with open(corpus) as f:
+        logs = [format_log(log) for log in json.load(f)]
+    abi_codec = ABICodec(registry)
+    plans = {}
+    for abi in EVENT_ABIS:
+        event_sig = EVMDecoder.get_event_signature(abi)
+        plans[event_sig.signature_hash] = DecodePlan(event_sig, abi_codec)
+    items = [(log, plans[log["topics"][0].hex()]) for log in logs if log["topics"] and log["topics"][0].hex() in plans]
+    print(f"{len(items)} of {len(logs)} logs match a benchmark event")
+    return items
+
+
+async def run(pool: DecodePool, items: list, block_size: int, rounds: int) -> float:
+    # Warm up the workers so process start-up is not measured
+    await pool.decode(items[:block_size])
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for start in range(0, len(items), block_size):
+            await pool.decode(items[start:start + block_size])
+    return len(items) * rounds / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8], help='Worker counts to compare')
+    parser.add_argument('--block-size', type=int, default=1000, help='Logs decoded per call, like one block')
+    parser.add_argument('--chunk-size', type=int, default=250, help='Logs sent to a worker at a time')
+    parser.add_argument('--rounds', type=int, default=3, help='Passes over the corpus per worker count')
+    args = parser.parse_args()
+
+    items = load_items(args.corpus)
+    if not items:
+        return
+    for workers in [0] + args.workers:
+        pool = DecodePool(workers=workers, chunk_size=args.chunk_size, min_logs=0)
+        try:
+            throughput = asyncio.run(run(pool, items, args.block_size, args.rounds))
+        finally:
+            pool.close()
+        name = 'event loop' if workers == 0 else f'{workers} workers'
+        print(f"{name:>12}: {throughput:,.0f} logs/sec")
+
+
+if __name__ == '__main__':
+    main()
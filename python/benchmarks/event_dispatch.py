@@ -0,0 +1,87 @@
+# python/benchmarks/event_dispatch.py
+"""
+Compare routing decoded events to their processor: re-hashing the signature
+from the decoded parameters per event, as EventProcessor used to, against
+the topic0 dispatch table.
+
+Replays the corpus recorded by decode_logs.py, decoded against its benchmark
+events, so Transfers and Approvals that no processor handles are routed
+alongside the Swaps and Syncs that are.
+
+    python benchmarks/decode_logs.py --record --blocks 50
+    python benchmarks/event_dispatch.py --rounds 20
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add the python directory to PYTHONPATH
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PYTHON_DIR)
+
+from eth_abi.codec import ABICodec
+from eth_abi.registry import registry
+from chains.evm_models.rpc import format_log
+from chains.evm_models.processing.events.event_processor import EventProcessor
+from chains.evm_models.processing.logs.decoder import EVMDecoder
+from chains.evm_models.processing.logs.decode_plan import DecodePlan
+from decode_logs import DEFAULT_CORPUS, EVENT_ABIS
+
+
+def load_events(corpus: str) -> list:
+    with open(corpus) as f:
+        logs = [format_log(log) for log in json.load(f)]
+    abi_codec = ABICodec(registry)
+    plans = {}
+    for abi in EVENT_ABIS:
+        plan = DecodePlan(EVMDecoder.get_event_signature(abi), abi_codec)
+        plans[(plan.topic0, sum(plan.event_sig.indexed_inputs))] = plan
+    events = []
+    for log in logs:
+        plan = log["topics"] and plans.get((log["topics"][0].hex(), len(log["topics"]) - 1))
+        if plan:
+            events.append(plan.decode(log))
+    return events
+
+
+def legacy_resolve(processor: EventProcessor, event: dict):
+    """
+    EventProcessor._process_single_event's routing before the dispatch table, kept as the baseline.
+    """
+    event_name = event["event"]
+    if event_name in processor.event_mapping:
+        return processor.event_mapping[event_name], processor.get_signature(event)
+    return None
+
+
+def measure(resolve, events: list, rounds: int) -> tuple:
+    """Returns (events per second, events routed to a processor)."""
+    started = time.perf_counter()
+    for _ in range(rounds):
+        routed = sum(1 for event in events if resolve(event) is not None)
+    return len(events) * rounds / (time.perf_counter() - started), routed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS)
+    parser.add_argument('--rounds', type=int, default=10, help='Passes over the corpus per router')
+    args = parser.parse_args()
+
+    events = load_events(args.corpus)
+    if not events:
+        print(f"No benchmark events in {args.corpus}, record it with decode_logs.py --record")
+        return
+    # Routing never touches the database, processors are only built for their protocol maps
+    processor = EventProcessor(None, 'ethereum')
+    print(f"{len(events)} decoded events, {len(processor.dispatch)} signatures in the dispatch table")
+
+    for name, resolve in (('re-hash', lambda event: legacy_resolve(processor, event)), ('topic0 table', processor.resolve)):
+        throughput, routed = measure(resolve, events, args.rounds)
+        print(f"{name:>12}: {throughput:>12,.0f} events/sec, {routed} routed to a processor")
+
+
+if __name__ == '__main__':
+    main()
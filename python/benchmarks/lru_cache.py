@@ -0,0 +1,94 @@
+# python/benchmarks/lru_cache.py
+"""
+Compare get/set cost of LRUCache against the BoundedCache it replaced.
+
+BoundedCache is reproduced below as it was: FIFO eviction and a
+datetime.now() call on every get and set. Keys are drawn from a skewed
+distribution so a small hot set dominates, like event signatures and ABIs.
+
+    python benchmarks/lru_cache.py --ops 1000000 --keys 5000 --size 1000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+# Add the python directory to PYTHONPATH
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PYTHON_DIR)
+
+from chains.evm_models.cache import LRUCache
+
+
+class BoundedCache:
+    def __init__(self, max_size=500, ttl_hours=24):
+        self.max_size = max_size
+        self.ttl = timedelta(hours=ttl_hours)
+        self.cache = OrderedDict()
+
+    def get(self, key):
+        if key not in self.cache:
+            return None
+        value, timestamp = self.cache[key]
+        if datetime.now() - timestamp > self.ttl:
+            del self.cache[key]
+            return None
+        return value
+
+    def set(self, key, value):
+        if len(self.cache) >= self.max_size:
+            self.cache.popitem(last=False)  # Remove oldest item
+        self.cache[key] = (value, datetime.now())
+
+
+def make_keys(ops: int, keys: int):
+    rng = random.Random(42)
+    return [f'0x{int(rng.paretovariate(1.2)) % keys:064x}' for _ in range(ops)]
+
+
+def run(cache, stream) -> tuple:
+    """Read-through access: get, then set on a miss. Returns (seconds, hit rate)."""
+    hits = 0
+    started = time.perf_counter()
+    for key in stream:
+        if cache.get(key) is None:
+            cache.set(key, key)
+        else:
+            hits += 1
+    return time.perf_counter() - started, hits / len(stream)
+
+
+def run_sets(cache, stream) -> float:
+    started = time.perf_counter()
+    for key in stream:
+        cache.set(key, key)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--ops', type=int, default=1_000_000)
+    parser.add_argument('--keys', type=int, default=5000, help='Distinct keys in the access stream')
+    parser.add_argument('--size', type=int, default=1000, help='Cache capacity')
+    args = parser.parse_args()
+
+    stream = make_keys(args.ops, args.keys)
+    caches = (
+        ('BoundedCache', lambda: BoundedCache(max_size=args.size, ttl_hours=24)),
+        ('LRUCache', lambda: LRUCache(max_size=args.size, ttl=86400)),
+        ('LRUCache no TTL', lambda: LRUCache(max_size=args.size)),
+    )
+    for name, factory in caches:
+        elapsed, hit_rate = run(factory(), stream)
+        set_elapsed = run_sets(factory(), stream)
+        print(
+            f"{name:>16}: read-through {elapsed / args.ops * 1e9:,.0f} ns/op (hit rate {hit_rate:.1%}), "
+            f"set {set_elapsed / args.ops * 1e9:,.0f} ns/op"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+# python/benchmarks/raw_codecs.py
+"""
+Compare the raw archive codecs on real blocks: stored bytes per block and
+encode/decode time per block.
+
+Record a corpus of full mainnet blocks once (eth_getBlockByNumber with
+transactions from Settings.ETHEREUM_ENDPOINT), then replay it. The zstd
+dictionary is trained on the first --train blocks and every codec is
+measured on the remaining ones, so the dictionary never sees the blocks it
+is scored on.
+
+    python benchmarks/raw_codecs.py --record --blocks 300
+    python benchmarks/raw_codecs.py --train 100
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+# Add the python directory to PYTHONPATH
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PYTHON_DIR)
+
+from config import Settings
+from chains.evm_models.rpc import AsyncRPCClient
+from database.mongodb.codecs import GzipJSONCodec, ZstdMsgpackCodec
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mainnet_blocks.json')
+
+
+async def record(corpus: str, blocks: int):
+    rpc = AsyncRPCClient('ethereum', Settings.ETHEREUM_ENDPOINT)
+    try:
+        latest = int(await rpc.request("eth_blockNumber"), 16)
+        numbers = range(latest - blocks + 1, latest + 1)
+        fetched = await rpc.batch([("eth_getBlockByNumber", [hex(number), True]) for number in numbers])
+    finally:
+        await rpc.close()
+    with open(corpus, 'w') as f:
+        json.dump(fetched, f)
+    print(f"Recorded {len(fetched)} blocks {numbers[0]}-{numbers[-1]} to {corpus}")
+
+
+def measure(codec, blocks: list) -> tuple:
+    """Returns (bytes per block, encode µs per block, decode µs per block)."""
+    started = time.perf_counter()
+    encoded = [codec.encode('ethereum', block) for block in blocks]
+    encode_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    decoded = [codec.decode(data, dict_id) for data, dict_id in encoded]
+    decode_time = time.perf_counter() - started
+
+    if decoded != blocks:
+        print(f"warning: {codec.name} did not round-trip the corpus")
+    size = sum(len(data) for data, _ in encoded)
+    return size / len(blocks), encode_time / len(blocks) * 1e6, decode_time / len(blocks) * 1e6
+
+
+def replay(corpus: str, train: int, level: int):
+    with open(corpus) as f:
+        blocks = json.load(f)
+    if len(blocks) <= train:
+        print(f"Corpus has {len(blocks)} blocks, record more than --train {train}")
+        return
+    training, blocks = blocks[:train], blocks[train:]
+    raw = sum(len(json.dumps(block)) for block in blocks) / len(blocks)
+    print(f"{len(blocks)} blocks measured, {raw:,.0f} bytes of JSON per block")
+
+    trained = ZstdMsgpackCodec(None, level=level, dict_samples=train)
+    for block in training:
+        trained.encode('ethereum', block)
+
+    codecs = (
+        ('gzip-json', GzipJSONCodec()),
+        ('zstd-msgpack', ZstdMsgpackCodec(None, level=level, dict_samples=0)),
+        ('zstd-msgpack+dict', trained),
+    )
+    for name, codec in codecs:
+        size, encode_us, decode_us = measure(codec, blocks)
+        print(f"{name:>18}: {size:>10,.0f} bytes/block ({raw / size:4.1f}x), "
+              f"encode {encode_us:>8,.0f} µs/block, decode {decode_us:>8,.0f} µs/block")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS)
+    parser.add_argument('--record', action='store_true', help='Fetch a fresh corpus instead of replaying')
+    parser.add_argument('--blocks', type=int, default=300, help='Blocks to record, ending at the head')
+    parser.add_argument('--train', type=int, default=100, help='Blocks the zstd dictionary is trained on')
+    parser.add_argument('--level', type=int, default=Settings.ZSTD_LEVEL, help='zstd compression level')
+    args = parser.parse_args()
+
+    if args.record:
+        asyncio.run(record(args.corpus, args.blocks))
+    else:
+        replay(args.corpus, args.train, args.level)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,238 @@
+# python/benchmarks/sql_backends.py
+"""
+Check the asyncpg ingest backend (SQL_BACKEND=asyncpg) against psycopg2 on
+the Postgres in Settings.POSTGRES_CONFIG, and time both.
+
+The same synthetic blocks, transactions, swaps and syncs are written
+through each backend's operations under a scratch chain of its own, then
+written again to check replays are skipped. The rows each backend left are
+read back and compared, then the newest blocks are rolled back and the
+range checkpointed through both, and compared again. The scratch
+partitions and checkpoints are dropped afterwards, so no real chain data
+is touched. Exits with status 1 when the backends disagree or an
+operation fails.
+
+    python benchmarks/sql_backends.py --blocks 20 --transactions 200 --events 100
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add the python directory to PYTHONPATH
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PYTHON_DIR)
+
+from database import SQLDatabase, AsyncSQLDatabase, PartitionManager, run_sql
+from database.sql.operator import SQLOperator, AsyncSQLOperator
+from database.sql.partitions import TIME_PARTITIONED_TABLES
+from chains.evm_models.processing.blocks.transaction_columns import extract_transaction_columns
+from chains.evm_models.processing.events.batch import EventWriteBatch
+from chains.evm_models.processing.events.models import TokenSwap, TokenSync
+
+BACKENDS = ('psycopg2', 'asyncpg')
+CHAINS = {backend: f'check_{backend}' for backend in BACKENDS}
+START_TIMESTAMP = 1700000000
+ROLLBACK = 3  # Newest blocks rolled back
+
+
+def make_blocks(blocks: int, transactions: int) -> list:
+    """
+    Synthetic blocks 12 seconds apart, with transaction dicts as eth_getBlockByNumber returns them.
+    """
+    made = []
+    for number in range(blocks):
+        made.append({
+            'number': number,
+            'hash': f'0x{number + 1:064x}',
+            'parentHash': f'0x{number:064x}',
+            'timestamp': START_TIMESTAMP + 12 * number,
+            'transactions': [
+                {
+                    'hash': f'0x{number:032x}{i:032x}',
+                    'from': f'0x{i:040x}',
+                    # Every tenth transaction creates a contract
+                    'to': None if i % 10 == 0 else f'0x{number:040x}',
+                    'value': hex(i * 10 ** 18),
+                    'gas': hex(21000 + i),
+                    'gasPrice': hex(30 * 10 ** 9),
+                    'chainId': '0x1',
+                }
+                for i in range(transactions)
+            ],
+        })
+    return made
+
+
+def make_events(chain: str, block: dict, events: int) -> EventWriteBatch:
+    swap = TokenSwap(
+        amount0=-1.5, amount1=3000.25, isAmount0In=True,
+        token0_address='0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2', token1_address='0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48',
+        contract_address='0xB4e16d0168e52d35CaCD2c6185b44281Ec28C9Dc',
+        token0_name='Wrapped Ether', token1_name='USD Coin', token0_symbol='WETH', token1_symbol='USDC',
+        factory_address='0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f'
+    )
+    sync = TokenSync(
+        reserve0=15000.5, reserve1=45000000.75,
+        token0_address=swap.token0_address, token1_address=swap.token1_address,
+        token0_name=swap.token0_name, token1_name=swap.token1_name,
+        token0_symbol=swap.token0_symbol, token1_symbol=swap.token1_symbol,
+        factory_address=swap.factory_address
+    )
+    batch = EventWriteBatch(chain)
+    transactions = block['transactions']
+    for i in range(min(events, len(transactions))):
+        tx_hash = transactions[i]['hash']
+        batch.add_swap(swap, swap.contract_address, tx_hash, 2 * i, block['timestamp'])
+        batch.add_sync(sync, swap.contract_address, tx_hash, 2 * i + 1, block['timestamp'])
+    return batch
+
+
+class Check:
+    """
+    Runs the ingest operations of one backend under its scratch chain, timing each kind.
+    """
+    def __init__(self, backend: str, operator):
+        self.backend = backend
+        self.chain = CHAINS[backend]
+        self.operator = operator
+        self.timings = {}
+        self.failures = []
+
+    async def run(self, name: str, operation, *args):
+        started = time.perf_counter()
+        result = await run_sql(operation, *args)
+        self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - started
+        if result is False:
+            self.failures.append(name)
+        return result
+
+    async def write(self, blocks: list, events: int):
+        insert = self.operator.insert
+        for block in blocks:
+            number, timestamp = block['number'], block['timestamp']
+            await self.run('insert_block', insert.block.insert_block, self.chain, number, block['hash'], block['parentHash'], timestamp)
+            columns = extract_transaction_columns(block['transactions'], self.chain, number, timestamp, 1)
+            await self.run('transactions', insert.evm.transactions, self.chain, columns, number)
+            batch = make_events(self.chain, block, events)
+            await self.run('swaps_and_syncs', insert.evm.swaps_and_syncs, self.chain, batch.swaps, batch.syncs)
+
+    async def roll_back(self, blocks: list):
+        orphaned = blocks[-ROLLBACK:]
+        await self.run(
+            'rollback_blocks', self.operator.insert.block.rollback_blocks, self.chain,
+            [block['hash'] for block in orphaned],
+            {transaction['hash'] for block in orphaned for transaction in block['transactions']},
+            min(block['timestamp'] for block in orphaned)
+        )
+
+    async def checkpoint(self, blocks: list):
+        first, last = blocks[0]['number'], blocks[-1]['number']
+        await self.run('checkpoint', self.operator.insert.backfill.checkpoint, self.chain, first, last)
+        checkpoints = await self.run('query_checkpoints', self.operator.query.backfill.query_checkpoints, self.chain, first, last)
+        return [(row['range_start'], row['range_end']) for row in checkpoints or []]
+
+    async def latest_block(self):
+        return await self.run('query_latest_block_number', self.operator.query.block.query_latest_block_number, self.chain)
+
+
+def snapshot(db: SQLDatabase, chain: str) -> dict:
+    """
+    The rows a chain has in each table split by time, without the chain column, sorted.
+    """
+    rows = {}
+    with db.transaction() as cursor:
+        for table in TIME_PARTITIONED_TABLES:
+            cursor.execute(f"SELECT * FROM {table} WHERE chain = %s", (chain,))
+            rows[table] = sorted(
+                tuple(value for column, value in row.items() if column != 'chain')
+                for row in cursor.fetchall()
+            )
+    return rows
+
+
+def compare(stage: str, snapshots: dict) -> bool:
+    expected, actual = (snapshots[backend] for backend in BACKENDS)
+    matched = True
+    for table in TIME_PARTITIONED_TABLES:
+        if expected[table] != actual[table]:
+            matched = False
+            missing = len(set(expected[table]) - set(actual[table]))
+            extra = len(set(actual[table]) - set(expected[table]))
+            print(f"{stage}: {table} differs, {len(expected[table])} psycopg2 rows against {len(actual[table])} asyncpg rows "
+                  f"({missing} missing, {extra} extra)")
+        else:
+            print(f"{stage}: {table} matches, {len(expected[table])} rows")
+    return matched
+
+
+def drop_scratch(db: SQLDatabase):
+    with db.transaction() as cursor:
+        for chain in CHAINS.values():
+            for table in TIME_PARTITIONED_TABLES:
+                cursor.execute(f"DROP TABLE IF EXISTS {table}_{chain}")
+        cursor.execute("DELETE FROM backfill_checkpoints WHERE chain = ANY(%s)", (list(CHAINS.values()),))
+
+
+async def check(blocks: int, transactions: int, events: int) -> bool:
+    db = SQLDatabase()
+    async_db = AsyncSQLDatabase()
+    checks = {
+        'psycopg2': Check('psycopg2', SQLOperator(db)),
+        'asyncpg': Check('asyncpg', AsyncSQLOperator(async_db, db)),
+    }
+    made = make_blocks(blocks, transactions)
+    matched = True
+    try:
+        drop_scratch(db)
+        for chain in CHAINS.values():
+            PartitionManager(db, chain).ensure_range(made[0]['timestamp'], made[-1]['timestamp'] + 1)
+
+        for stage in ('write', 'replay'):
+            for current in checks.values():
+                await current.write(made, events)
+            matched &= compare(stage, {backend: snapshot(db, current.chain) for backend, current in checks.items()})
+
+        latest = {backend: await current.latest_block() for backend, current in checks.items()}
+        print(f"latest block: {latest}")
+        matched &= len(set(latest.values())) == 1
+
+        for current in checks.values():
+            await current.roll_back(made)
+        matched &= compare('rollback', {backend: snapshot(db, current.chain) for backend, current in checks.items()})
+
+        checkpoints = {backend: await current.checkpoint(made) for backend, current in checks.items()}
+        print(f"checkpoints: {checkpoints}")
+        matched &= len({tuple(ranges) for ranges in checkpoints.values()}) == 1
+
+        for operation in checks['psycopg2'].timings:
+            times = '  '.join(f"{backend} {current.timings.get(operation, 0.0) * 1e3:>9,.1f} ms" for backend, current in checks.items())
+            print(f"{operation:>26}: {times}")
+        for backend, current in checks.items():
+            if current.failures:
+                matched = False
+                print(f"{backend} operations failed: {sorted(set(current.failures))}")
+    finally:
+        drop_scratch(db)
+        await async_db.close()
+        db.close()
+    return matched
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--blocks', type=int, default=20)
+    parser.add_argument('--transactions', type=int, default=200, help='Transactions per block')
+    parser.add_argument('--events', type=int, default=100, help='Swaps and syncs per block')
+    args = parser.parse_args()
+    if args.blocks <= ROLLBACK:
+        parser.error(f"--blocks must be over {ROLLBACK}, the newest {ROLLBACK} are rolled back")
+
+    matched = asyncio.run(check(args.blocks, args.transactions, args.events))
+    print("backends match" if matched else "backends differ")
+    sys.exit(0 if matched else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+# python/benchmarks/swap_writes.py
+"""
+Compare swap/sync write throughput: one INSERT + commit per event against
+the per-block batch (one execute_values transaction per block).
+
+Runs against the Postgres in Settings.POSTGRES_CONFIG. Rows are written
+under a 'benchmark' chain whose partitions are created for the run and
+dropped afterwards, so no real chain data is touched.
+
+    python benchmarks/swap_writes.py --blocks 20 --events 400
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add the python directory to PYTHONPATH
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PYTHON_DIR)
+
+from database import SQLDatabase, SQLInsertOperations
+from chains.evm_models.processing.events.batch import EventWriteBatch
+from chains.evm_models.processing.events.models import TokenSwap, TokenSync
+
+CHAIN = 'benchmark'
+TABLES = ('evm_swaps', 'evm_syncs')
+
+
+def make_events(block: int, events: int):
+    swap = TokenSwap(
+        amount0=-1.5, amount1=3000.25, isAmount0In=True,
+        token0_address='0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2', token1_address='0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48',
+        contract_address='0xB4e16d0168e52d35CaCD2c6185b44281Ec28C9Dc',
+        token0_name='Wrapped Ether', token1_name='USD Coin', token0_symbol='WETH', token1_symbol='USDC',
+        factory_address='0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f'
+    )
+    sync = TokenSync(
+        reserve0=15000.5, reserve1=45000000.75,
+        token0_address=swap.token0_address, token1_address=swap.token1_address,
+        token0_name=swap.token0_name, token1_name=swap.token1_name,
+        token0_symbol=swap.token0_symbol, token1_symbol=swap.token1_symbol,
+        factory_address=swap.factory_address
+    )
+    for i in range(events):
+        yield swap, sync, f'0x{block:032x}{i:032x}', i
+
+
+def run_per_event(insert, blocks: int, events: int) -> int:
+    rows = 0
+    for block in range(blocks):
+        for swap, sync, tx_hash, log_index in make_events(block, events):
+            insert.evm.swap(CHAIN, swap, swap.contract_address, tx_hash, log_index, 0)
+            insert.evm.sync(CHAIN, sync, swap.contract_address, tx_hash, log_index + events, 0)
+            rows += 2
+    return rows
+
+
+def run_batched(insert, blocks: int, events: int) -> int:
+    rows = 0
+    for block in range(blocks):
+        batch = EventWriteBatch(CHAIN)
+        for swap, sync, tx_hash, log_index in make_events(block, events):
+            batch.add_swap(swap, swap.contract_address, tx_hash, log_index, 0)
+            batch.add_sync(sync, swap.contract_address, tx_hash, log_index + events, 0)
+        rows += len(batch)
+        insert.evm.swaps_and_syncs(CHAIN, batch.swaps, batch.syncs)
+    return rows
+
+
+def reset_partitions(db: SQLDatabase):
+    with db.transaction() as cursor:
+        for table in TABLES:
+            cursor.execute(f"DROP TABLE IF EXISTS {table}_{CHAIN}")
+            cursor.execute(f"CREATE TABLE {table}_{CHAIN} PARTITION OF {table} FOR VALUES IN ('{CHAIN}')")
+
+
+def drop_partitions(db: SQLDatabase):
+    with db.transaction() as cursor:
+        for table in TABLES:
+            cursor.execute(f"DROP TABLE IF EXISTS {table}_{CHAIN}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--blocks', type=int, default=20)
+    parser.add_argument('--events', type=int, default=400, help='Swaps (and as many syncs) per block')
+    args = parser.parse_args()
+
+    db = SQLDatabase()
+    insert = SQLInsertOperations(db)
+
+    try:
+        for name, run in (('per-event commit', run_per_event), ('per-block batch', run_batched)):
+            reset_partitions(db)
+            started = time.perf_counter()
+            rows = run(insert, args.blocks, args.events)
+            elapsed = time.perf_counter() - started
+            print(f"{name:>18}: {rows} rows in {elapsed:.2f}s, {rows / elapsed:,.0f} rows/sec")
+    finally:
+        drop_partitions(db)
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+# python/benchmarks/transaction_ingest.py
+"""
+Compare the evm_transactions ingest stage on a recorded mainnet block:
+building tuples per transaction on a per-block thread pool and loading
+them with execute_values, as BlockProcessor used to, against column-wise
+extraction loaded with binary COPY through the stage table.
+
+Record the most recent block with at least --transactions transactions
+(eth_getBlockByNumber with transactions from Settings.ETHEREUM_ENDPOINT)
+once, then replay it. Extraction and COPY encoding are always measured,
+--postgres also loads the block into the Postgres in
+Settings.POSTGRES_CONFIG, under a 'benchmark' chain whose partition is
+created for the run and dropped afterwards.
+
+    python benchmarks/transaction_ingest.py --record --transactions 500
+    python benchmarks/transaction_ingest.py --rounds 200 --postgres
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+
+# Add the python directory to PYTHONPATH
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PYTHON_DIR)
+
+from config import Settings
+from chains.utils import decode_hex, normalize_hex
+from chains.evm_models.rpc import AsyncRPCClient
+from chains.evm_models.processing.blocks.transaction_columns import extract_transaction_columns
+from database.sql.copy import encode_binary_copy, column_records
+from database.sql.queries import INSERT_EVM_TRANSACTIONS, EVM_TRANSACTION_COPY_COLUMNS
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mainnet_transaction_block.json')
+CHAIN = 'benchmark'
+CHAIN_ID = 1
+
+get_hash = itemgetter('hash')
+get_from = itemgetter('from')
+get_to = itemgetter('to')
+get_value = itemgetter('value')
+get_gas = itemgetter('gas')
+get_gas_price = itemgetter('gasPrice')
+get_chain_id = itemgetter('chainId')
+
+
+async def record(corpus: str, transactions: int, scan: int):
+    rpc = AsyncRPCClient('ethereum', Settings.ETHEREUM_ENDPOINT)
+    try:
+        latest = int(await rpc.request("eth_blockNumber"), 16)
+        for end in range(latest, latest - scan, -10):
+            fetched = await rpc.batch([("eth_getBlockByNumber", [hex(number), True]) for number in range(end, end - 10, -1)])
+            block = next((block for block in fetched if len(block['transactions']) >= transactions), None)
+            if block is not None:
+                break
+        else:
+            print(f"No block with {transactions} transactions in the last {scan} blocks")
+            return
+    finally:
+        await rpc.close()
+    with open(corpus, 'w') as f:
+        json.dump(block, f)
+    print(f"Recorded block {int(block['number'], 16)} with {len(block['transactions'])} transactions to {corpus}")
+
+
+def legacy_rows(transactions: list, block_number: int, timestamp: int) -> list:
+    """
+    BlockProcessor.process_transactions before the columnar stage, kept as the baseline.
+    """
+    def batch_rows(batch):
+        return [
+            (
+                block_number,
+                CHAIN,
+                normalize_hex(get_hash(transaction)),
+                get_chain_id(transaction) if 'chainId' in transaction else CHAIN_ID,
+                get_from(transaction),
+                get_to(transaction),
+                decode_hex(get_value(transaction)),
+                decode_hex(get_gas(transaction)) * decode_hex(get_gas_price(transaction)),
+                timestamp
+            )
+            for transaction in batch
+        ]
+
+    batches = [transactions[i:i + 1000] for i in range(0, len(transactions), 1000)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(batch_rows, batch) for batch in batches]
+        return [row for future in futures for row in future.result()]
+
+
+def columnar(transactions: list, block_number: int, timestamp: int) -> dict:
+    return extract_transaction_columns(transactions, CHAIN, block_number, timestamp, CHAIN_ID)
+
+
+def copy_stream(columns: dict) -> bytes:
+    return encode_binary_copy(
+        [(kind, columns[name]) for name, kind in EVM_TRANSACTION_COPY_COLUMNS], len(columns['transaction_hash'])
+    )
+
+
+def measure(run, rounds: int) -> float:
+    """Returns µs per block."""
+    started = time.perf_counter()
+    for _ in range(rounds):
+        run()
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+def measure_postgres(transactions: list, block_number: int, timestamp: int, rounds: int):
+    from psycopg2.extras import execute_values
+    from database import SQLDatabase, SQLInsertOperations
+
+    db = SQLDatabase()
+    insert = SQLInsertOperations(db)
+
+    def reset_partition():
+        with db.transaction() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS evm_transactions_{CHAIN}")
+            cursor.execute(f"CREATE TABLE evm_transactions_{CHAIN} PARTITION OF evm_transactions FOR VALUES IN ('{CHAIN}')")
+
+    def load_legacy():
+        # chainId decoded here only, the old rows passed the hex string through
+        rows = [row[:3] + (decode_hex(row[3]),) + row[4:] for row in legacy_rows(transactions, block_number, timestamp)]
+        with db.transaction() as cursor:
+            execute_values(cursor, INSERT_EVM_TRANSACTIONS, rows, page_size=1000)
+
+    def load_columnar():
+        insert.evm.transactions(CHAIN, columnar(transactions, block_number, timestamp), block_number)
+
+    try:
+        for name, load in (('execute_values', load_legacy), ('binary COPY', load_columnar)):
+            # Each round inserts the block anew, conflicts would skip the writes
+            elapsed = 0.0
+            for _ in range(rounds):
+                reset_partition()
+                started = time.perf_counter()
+                load()
+                elapsed += time.perf_counter() - started
+            print(f"{name:>22}: {elapsed / rounds * 1e3:>10,.2f} ms/block, {len(transactions) * rounds / elapsed:>10,.0f} rows/sec")
+    finally:
+        with db.transaction() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS evm_transactions_{CHAIN}")
+        db.close()
+
+
+def replay(corpus: str, rounds: int, postgres: bool):
+    with open(corpus) as f:
+        block = json.load(f)
+    transactions = block['transactions']
+    block_number, timestamp = int(block['number'], 16), int(block['timestamp'], 16)
+    print(f"Block {block_number}, {len(transactions)} transactions")
+
+    columns = columnar(transactions, block_number, timestamp)
+    legacy = legacy_rows(transactions, block_number, timestamp)
+    rows = list(column_records([(kind, columns[name]) for name, kind in EVM_TRANSACTION_COPY_COLUMNS], len(transactions)))
+    if rows != [row[:3] + (decode_hex(row[3]),) + row[4:] for row in legacy]:
+        print("warning: columnar extraction does not match the tuple rows")
+
+    runs = (
+        ('tuples, per-block pool', lambda: legacy_rows(transactions, block_number, timestamp)),
+        ('columnar extraction', lambda: columnar(transactions, block_number, timestamp)),
+        ('COPY encoding', lambda: copy_stream(columns)),
+    )
+    for name, run in runs:
+        print(f"{name:>22}: {measure(run, rounds):>10,.0f} µs/block")
+    print(f"{'COPY stream':>22}: {len(copy_stream(columns)):>10,} bytes")
+
+    if postgres:
+        measure_postgres(transactions, block_number, timestamp, max(1, rounds // 10))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS)
+    parser.add_argument('--record', action='store_true', help='Fetch a fresh block instead of replaying')
+    parser.add_argument('--transactions', type=int, default=500, help='Minimum transactions in the recorded block')
+    parser.add_argument('--scan', type=int, default=500, help='Blocks back from the head searched when recording')
+    parser.add_argument('--rounds', type=int, default=100, help='Passes over the block per stage')
+    parser.add_argument('--postgres', action='store_true', help='Also time the load into Postgres')
+    args = parser.parse_args()
+
+    if args.record:
+        asyncio.run(record(args.corpus, args.transactions, args.scan))
+    else:
+        replay(args.corpus, args.rounds, args.postgres)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,47 +1,15 @@
 from ..evm_models.evm_querier import EVMQuerier
 from config import Settings
-import requests
-import json
-from web3 import Web3
 class BaseChainQuerier(EVMQuerier):
     """
     Base-specific querier implementation.
     """
+    explorer_url = "https://api.basescan.org/api"
+    explorer_api_key = Settings.BASESCAN_API_KEY
+
     def __init__(self):
         super().__init__(
             network_name="base",
             http_endpoint=Settings.BASE_ENDPOINT,
             ws_endpoint=Settings.BASE_WEBSOCKET_ENDPOINT
         )
-
-    async def get_contract_abi(self, contract_address):
-        """
-        Override to use Basescan API instead of Etherscan
-        """
-        # Similar to EVMQuerier.get_contract_abi but use Basescan
-        self.logger.debug(f"Fetching ABI for contract {contract_address}")
-        try:
-            checksum_address = Web3.to_checksum_address(contract_address)
-            url = "https://api.basescan.org/api"
-            params = {
-                'module': 'contract',
-                'action': 'getabi',
-                'address': contract_address,
-                'apikey': Settings.BASESCAN_API_KEY
-            }
-            response = requests.get(url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                if data["status"] == "1":
-                    abi = json.loads(data["result"])
-                    return abi
-                else:
-                    #self.logger.error(f"Failed to fetch ABI: {data['message']}")
-                    return None
-            else:
-                #self.logger.error(f"Failed to fetch ABI: {response.status_code}")
-                return None
-        except Exception as e:
-            #self.logger.error(f"Failed to fetch ABI: {e}")
-            return None
-    
\ No newline at end of file
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
+from collections import deque
 import asyncio
+import contextlib
+import itertools
 import json
 import websockets
 import logging
@@ -18,15 +21,32 @@ class BaseWebSocketHandler(ABC):
         self.retry_attempts = 5
         self.retry_delay = 5
         self.shutting_down = False  # Add flag to track intentional shutdown
+        self.request_timeout = 30
+        self.max_pending_fetches = 16  # Fetches allowed in flight while waiting on the oldest
+
+        # Multiplexing state: responses are routed to pending requests by id,
+        # everything else (subscription notifications) goes on the queue
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._notifications = asyncio.Queue()
+        self._reader_task = None
+        self._connected = asyncio.Event()
+        # Set by the reader when the socket fails, with the error that ended it
+        self._disconnected = asyncio.Event()
+        self._reader_error = None
         self.logger.info(f"Initializing WebSocketHandler for {network}")
 
     async def connect(self):
         """
-        Establish a WebSocket connection with retry logic.
+        Establish a WebSocket connection with retry logic and start the reader.
         """
         for attempt in range(self.retry_attempts):
             try:
                 self.connection = await websockets.connect(self.websocket_url)
+                self._reader_task = asyncio.create_task(self._read_loop(self.connection))
+                self._reader_error = None
+                self._disconnected.clear()
+                self._connected.set()
                 self.logger.info(f"Connected to WebSocket: {self.network}")
                 return
             except Exception as e:
@@ -34,29 +54,118 @@ class BaseWebSocketHandler(ABC):
                 await asyncio.sleep(self.retry_delay)
         raise ConnectionError("Max retries reached. Unable to connect to WebSocket.")
 
+    async def _read_loop(self, connection):
+        """
+        Single reader for the socket. Replies are matched to their request by
+        id, subscription notifications are queued for receive().
+        """
+        try:
+            async for raw in connection:
+                message = json.loads(raw)
+                request_id = message.get("id") if isinstance(message, dict) else None
+                future = self._pending.pop(request_id, None) if request_id is not None else None
+                if future is not None:
+                    if not future.done():
+                        future.set_result(message)
+                elif request_id is not None:
+                    # Reply to a request that already timed out
+                    self.logger.debug(f"Dropping unmatched response {request_id} on {self.network}")
+                else:
+                    self._notifications.put_nowait(message)
+            error = websockets.ConnectionClosed(None, None)
+        except websockets.ConnectionClosed as e:
+            error = e
+        except Exception as e:
+            self.logger.error(f"WebSocket reader failed for {self.network}: {e}")
+            error = e
+        finally:
+            if self.connection is connection:
+                self._connected.clear()
+
+        # Fail outstanding requests and wake receive() so it can reconnect
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+        if self.connection is connection:
+            self._reader_error = error
+            self._disconnected.set()
+
+    async def request(self, message: dict) -> dict:
+        """
+        Send a request over the socket and wait for the reply with the same id.
+        Any number of requests may be outstanding at once.
+        """
+        request_id = next(self._ids)
+        message = {**message, "id": request_id}
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self.connection.send(json.dumps(message))
+            return await asyncio.wait_for(future, timeout=self.request_timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
     async def subscribe(self):
         """
-        Send the subscription message to the WebSocket.
+        Send the subscription message to the WebSocket and wait for it to be acknowledged.
         """
         subscription_message = self.get_subscription_message()
-        await self.connection.send(json.dumps(subscription_message))
+        await self.request(subscription_message)
         self.logger.info(f"Subscribed to {self.network} updates.")
 
+    async def _fetch(self, parsed_message):
+        """
+        Fetch full data for a notification, retrying across reconnects so heads aren't dropped.
+        """
+        for attempt in range(self.retry_attempts):
+            await self._connected.wait()
+            try:
+                return await self.fetch_full_data(parsed_message)
+            except (websockets.ConnectionClosed, asyncio.TimeoutError) as e:
+                self.logger.warning(f"Fetch of {parsed_message} on {self.network} failed (attempt {attempt + 1}): {e}")
+                await asyncio.sleep(self.retry_delay)
+        raise ConnectionError(f"Unable to fetch {parsed_message} on {self.network}")
+
     async def receive(self):
         """
-        Receive and parse messages from the WebSocket.
+        Receive notifications and yield their full data in arrival order.
+        Fetches are started as soon as a notification arrives so several can
+        be in flight while earlier ones are still being consumed.
         """
+        fetches = deque()
         while not self.shutting_down:  # Keep trying as long as we're not shutting down
             try:
                 while self.running and not self.shutting_down:
-                    try:
-                        message = await self.connection.recv()
-                        parsed_message = self.parse_message(json.loads(message))
+                    # Hand out finished fetches in order
+                    while fetches and fetches[0].done():
+                        fetch = fetches.popleft()
+                        if fetch.exception() is not None:
+                            self.logger.error(f"Failed to fetch full data for {self.network}: {fetch.exception()}")
+                            continue
+                        yield fetch.result()
+
+                    # A dropped socket always wakes the loop, even with every fetch slot taken,
+                    # since the pending fetches only resume once it has reconnected
+                    disconnected = asyncio.ensure_future(self._disconnected.wait())
+                    waiters = {disconnected, fetches[0]} if fetches else {disconnected}
+                    next_message = None
+                    if len(fetches) < self.max_pending_fetches:
+                        next_message = asyncio.ensure_future(self._notifications.get())
+                        waiters.add(next_message)
+                    await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+
+                    received = next_message is not None and next_message.done()
+                    for waiter in (disconnected, next_message):
+                        if waiter is not None and not waiter.done():
+                            waiter.cancel()
+
+                    if received:
+                        parsed_message = self.parse_message(next_message.result())
                         if parsed_message:
-                            full_data = await self.fetch_full_data(parsed_message)
-                            yield full_data
-                    except asyncio.TimeoutError:
-                        continue
+                            fetches.append(asyncio.create_task(self._fetch(parsed_message)))
+                    if self._disconnected.is_set():
+                        raise self._reader_error
             except websockets.ConnectionClosed:
                 self.logger.info(f"WebSocket connection closed for {self.network}.")
                 if not self.shutting_down:
@@ -73,8 +182,14 @@ class BaseWebSocketHandler(ABC):
 
     async def reconnect(self):
         """
-        Reconnect to the WebSocket and resubscribe.
+        Close the old connection, then reconnect to the WebSocket and resubscribe.
         """
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+        if self.connection is not None:
+            # The socket is usually already broken, it only needs releasing
+            with contextlib.suppress(Exception):
+                await self.connection.close()
         await self.connect()
         await self.subscribe()
         self.running = True
@@ -122,6 +237,8 @@ class BaseWebSocketHandler(ABC):
         """
         self.shutting_down = True  # Set shutdown flag
         self.running = False
+        if self._reader_task is not None:
+            self._reader_task.cancel()
         if self.connection:
             try:
                 await self.connection.close()
@@ -149,6 +266,6 @@ class BaseWebSocketHandler(ABC):
     async def fetch_full_data(self, parsed_message):
         """
         Abstract method to fetch full data (e.g., block details) from the blockchain.
-        Must be implemented by subclasses.
+        Must be implemented by subclasses, using request() rather than reading the socket.
         """
         pass
@@ -1,6 +1,8 @@
 import json
 from operator import itemgetter
 from ..base_models import BaseProcessor
+from database import run_sql
+import asyncio
 from .bitcoin_querier import BitcoinQuerier
 
 # More optimal itemgetter functions
@@ -30,10 +32,10 @@ class BitcoinProcessor(BaseProcessor):
         self.logger.info(f"Processing block {block_number} on {self.network}")
         
         # Insert block into MongoDB
-        self.db_operator.mongodb.insert.insert_block(block, self.network, block_number, timestamp)
+        await asyncio.to_thread(self.db_operator.mongodb.insert.insert_block, block, self.network, block_number, timestamp)
         
         # Insert block into PostgreSQL
-        self.db_operator.sql.insert.block.insert_block(self.network, block_number, get_hash(block), get_parent_hash(block), timestamp)
+        await run_sql(self.db_operator.sql.insert.block.insert_block, self.network, block_number, get_hash(block), get_parent_hash(block), timestamp)
         self.logger.debug(f"Processed {self.network} block {block_number}")
         
         # Process transactions
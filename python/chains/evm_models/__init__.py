@@ -2,5 +2,7 @@ from .evm_processor import EVMProcessor
 from .evm_querier import EVMQuerier
 from .evm_websocket_handler import EVMWebSocketHandler
 from.evm_pipeline import EVMPipeline
+from .scheduler import BlockScheduler
+from .backfill import BackfillEngine
 
-all = [EVMProcessor, EVMQuerier, EVMWebSocketHandler, EVMPipeline]
\ No newline at end of file
+all = [EVMProcessor, EVMQuerier, EVMWebSocketHandler, EVMPipeline, BlockScheduler, BackfillEngine]
\ No newline at end of file
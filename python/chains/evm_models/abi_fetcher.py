@@ -0,0 +1,219 @@
+import asyncio
+import json
+import logging
+import time
+import aiohttp
+from web3 import Web3
+from config import Settings
+from database import DatabaseOperator, run_sql
+
+logger = logging.getLogger(__name__)
+
+
+class _TokenBucket:
+    """
+    Token bucket handing out request slots in arrival order. A caller that
+    finds the bucket empty reserves the next slot and sleeps until it is due.
+    """
+    __slots__ = ('rate', 'capacity', 'tokens', 'updated')
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    async def acquire(self) -> float:
+        """
+        Take a slot, returning the seconds spent waiting for it.
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        wait = -self.tokens / self.rate
+        await asyncio.sleep(wait)
+        return wait
+
+
+class ABIFetcher:
+    """
+    Process-wide client for the block explorers' getabi endpoint, shared by
+    every chain's querier.
+
+    Requests are rate limited per API key, so chains sharing a key share its
+    budget. Concurrent fetches of the same contract share one request.
+    Contracts the explorer has no ABI for are remembered, in memory and in
+    evm_abi_misses, and only asked for again after a backoff that doubles
+    with each miss. Throttling and network errors are not remembered.
+    """
+    _shared = None
+
+    def __init__(self, rate: float = None, burst: int = None, timeout: float = None, max_retries: int = None):
+        self.rate = rate or Settings.ABI_FETCH_RATE
+        self.burst = burst or Settings.ABI_FETCH_BURST
+        self.timeout = timeout or Settings.RPC_TIMEOUT
+        self.max_retries = max_retries if max_retries is not None else Settings.RPC_MAX_RETRIES
+        self.logger = logger
+        self.db_operator = None
+
+        self._session = None
+        self._buckets = {}
+        self._inflight = {}
+        # (chain, address) -> (attempts, retry_at as epoch seconds)
+        self._misses = {}
+        self._loaded_chains = set()
+
+        self.requests = 0
+        self.fetched = 0
+        self.not_found = 0
+        self.coalesced = 0
+        self.negative_hits = 0
+        self.rate_limited = 0
+        self.errors = 0
+        self.queue_waits = 0
+        self.queue_time = 0.0
+        self.max_queue_time = 0.0
+
+    @classmethod
+    def shared(cls) -> 'ABIFetcher':
+        """
+        The process-wide instance, shared by every chain's querier.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Lazily create the session, it has to be created inside the running loop.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self._session
+
+    async def load_misses(self, db_operator: DatabaseOperator, chain: str):
+        """
+        Load a chain's recorded misses, and persist later ones through this operator.
+        Only the first call per chain hits the database.
+        """
+        self.db_operator = db_operator
+        if chain in self._loaded_chains:
+            return
+        self._loaded_chains.add(chain)
+        rows = await run_sql(db_operator.sql.query.evm.abi_misses_by_chain, chain)
+        for row in rows:
+            self._misses[(chain, row['contract_address'])] = (row['attempts'], row['retry_at'])
+        self.logger.info(f"Loaded {len(rows)} ABI misses for {chain}")
+
+    async def fetch(self, chain: str, url: str, api_key: str, contract_address: str):
+        """
+        Get a contract's ABI from a block explorer, None if it has none or the request failed.
+        """
+        address = Web3.to_checksum_address(contract_address)
+        key = (chain, address)
+
+        miss = self._misses.get(key)
+        if miss is not None and time.time() < miss[1]:
+            self.negative_hits += 1
+            return None
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(chain, url, api_key, address))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced += 1
+        # Shielded so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _fetch(self, chain: str, url: str, api_key: str, address: str):
+        params = {
+            'module': 'contract',
+            'action': 'getabi',
+            'address': address
+        }
+        if api_key:
+            params['apikey'] = api_key
+        bucket = self._buckets.get(api_key or url)
+        if bucket is None:
+            bucket = self._buckets[api_key or url] = _TokenBucket(self.rate, self.burst)
+
+        for attempt in range(self.max_retries + 1):
+            self._record_wait(await bucket.acquire())
+            self.requests += 1
+            try:
+                async with self._get_session().get(url, params=params) as response:
+                    if response.status == 429:
+                        self.rate_limited += 1
+                        continue
+                    if response.status != 200:
+                        self.errors += 1
+                        self.logger.debug(f"Explorer returned {response.status} for {address} on {chain}")
+                        return None
+                    data = await response.json(content_type=None)
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                self.errors += 1
+                self.logger.debug(f"Failed to fetch ABI for {address} on {chain}: {e}")
+                return None
+
+            result = data.get('result')
+            if data.get('status') == '1':
+                self.fetched += 1
+                await self._clear_miss(chain, address)
+                return json.loads(result)
+            if isinstance(result, str) and 'rate limit' in result.lower():
+                self.rate_limited += 1
+                continue
+            if isinstance(result, str) and 'not verified' in result.lower():
+                self.not_found += 1
+                await self._record_miss(chain, address)
+                return None
+            self.errors += 1
+            self.logger.debug(f"Explorer could not return the ABI for {address} on {chain}: {result}")
+            return None
+
+        self.logger.warning(f"Gave up fetching ABI for {address} on {chain} after {self.max_retries + 1} rate limited attempts")
+        return None
+
+    def _record_wait(self, wait: float):
+        self.queue_waits += 1
+        self.queue_time += wait
+        self.max_queue_time = max(self.max_queue_time, wait)
+
+    async def _record_miss(self, chain: str, address: str):
+        attempts = self._misses.get((chain, address), (0, 0))[0] + 1
+        delay = min(Settings.ABI_MISS_BACKOFF * 2 ** (attempts - 1), Settings.ABI_MISS_MAX_BACKOFF)
+        retry_at = int(time.time() + delay)
+        self._misses[(chain, address)] = (attempts, retry_at)
+        if self.db_operator is not None:
+            await run_sql(self.db_operator.sql.insert.evm.abi_miss, chain, address, attempts, retry_at)
+
+    async def _clear_miss(self, chain: str, address: str):
+        if self._misses.pop((chain, address), None) is not None and self.db_operator is not None:
+            await run_sql(self.db_operator.sql.insert.evm.delete_abi_miss, chain, address)
+
+    async def close(self):
+        """
+        Close the underlying connection pool, the next fetch opens a new one.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def stats(self) -> dict:
+        """Snapshot of the fetcher's counters and rate limiter queue times."""
+        return {
+            "requests": self.requests,
+            "fetched": self.fetched,
+            "not_found": self.not_found,
+            "coalesced": self.coalesced,
+            "negative_hits": self.negative_hits,
+            "rate_limited": self.rate_limited,
+            "errors": self.errors,
+            "recorded_misses": len(self._misses),
+            "avg_queue_time": self.queue_time / self.queue_waits if self.queue_waits else 0.0,
+            "max_queue_time": self.max_queue_time,
+        }
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from config import Settings
+from database import run_sql
+
+logger = logging.getLogger(__name__)
+
+
+class BackfillEngine:
+    """
+    Range-based historical backfill.
+
+    Splits [start, end] into ranges of `range_size` blocks, fetches each
+    range's logs with one eth_getLogs and its blocks in batch round-trips,
+    and processes ranges across `workers` concurrent workers. Finished
+    ranges are checkpointed per chain so a restarted backfill skips them,
+    once every write their blocks made in the background is stored.
+    Processed blocks are recorded in `reorg_detector` when one is given.
+    """
+    def __init__(self, network: str, querier, processor, range_size: int = None, workers: int = None,
+                 reorg_detector=None):
+        self.network = network
+        self.querier = querier
+        self.processor = processor
+        self.reorg_detector = reorg_detector
+        self.db_operator = processor.db_operator
+        self.range_size = range_size or Settings.BACKFILL_RANGE_SIZE
+        self.workers = workers or Settings.BACKFILL_WORKERS
+        self.logger = logger
+
+        # Metrics
+        self.blocks_total = 0
+        self.blocks_done = 0
+        self.ranges_done = 0
+        self.ranges_failed = 0
+        self._started_at = None
+
+    def stats(self) -> dict:
+        elapsed = time.monotonic() - self._started_at if self._started_at else 0
+        return {
+            "network": self.network,
+            "blocks_total": self.blocks_total,
+            "blocks_done": self.blocks_done,
+            "ranges_done": self.ranges_done,
+            "ranges_failed": self.ranges_failed,
+            "blocks_per_sec": round(self.blocks_done / elapsed, 2) if elapsed else 0.0,
+        }
+
+    async def pending_ranges(self, start_block: int, end_block: int) -> list:
+        """
+        Ranges of [start_block, end_block] not yet covered by a checkpoint.
+        """
+        completed = await run_sql(self.db_operator.sql.query.backfill.query_checkpoints, self.network, start_block, end_block)
+
+        gaps = []
+        cursor = start_block
+        for checkpoint in sorted(completed, key=lambda row: row['range_start']):
+            if checkpoint['range_start'] > cursor:
+                gaps.append((cursor, min(checkpoint['range_start'] - 1, end_block)))
+            cursor = max(cursor, checkpoint['range_end'] + 1)
+            if cursor > end_block:
+                break
+        if cursor <= end_block:
+            gaps.append((cursor, end_block))
+
+        return [
+            (range_start, min(range_start + self.range_size - 1, gap_end))
+            for gap_start, gap_end in gaps
+            for range_start in range(gap_start, gap_end + 1, self.range_size)
+        ]
+
+    async def run(self, start_block: int, end_block: int, should_stop=None):
+        """
+        Backfill [start_block, end_block]. `should_stop` is polled between
+        ranges so a shutdown leaves only whole ranges checkpointed.
+        """
+        ranges = await self.pending_ranges(start_block, end_block)
+        self.blocks_total = sum(range_end - range_start + 1 for range_start, range_end in ranges)
+        skipped = (end_block - start_block + 1) - self.blocks_total
+        self.logger.info(
+            f"Backfilling {self.network} {start_block} to {end_block}: {len(ranges)} ranges, "
+            f"{self.blocks_total} blocks ({skipped} already checkpointed), {self.workers} workers"
+        )
+
+        queue = asyncio.Queue()
+        for block_range in ranges:
+            queue.put_nowait(block_range)
+
+        self._started_at = time.monotonic()
+        await asyncio.gather(*(self._worker(queue, should_stop) for _ in range(self.workers)))
+        self.logger.info(f"Backfill finished for {self.network}: {self.stats()}")
+
+    async def _worker(self, queue: asyncio.Queue, should_stop):
+        while not queue.empty():
+            if should_stop and should_stop():
+                return
+            range_start, range_end = queue.get_nowait()
+            try:
+                await self._process_range(range_start, range_end)
+                self.ranges_done += 1
+                self.logger.info(
+                    f"{self.network} range {range_start}-{range_end} done, "
+                    f"{self.blocks_done}/{self.blocks_total} blocks at {self.stats()['blocks_per_sec']} blocks/sec"
+                )
+            except Exception as e:
+                # Not checkpointed, the range is picked up again on the next run
+                self.ranges_failed += 1
+                self.logger.error(f"Backfill of {self.network} range {range_start}-{range_end} failed: {e}", exc_info=True)
+
+    async def _process_range(self, range_start: int, range_end: int):
+        block_numbers = list(range(range_start, range_end + 1))
+        blocks, logs = await asyncio.gather(
+            self.querier.get_blocks(block_numbers),
+            self.querier.get_logs(range_start, range_end)
+        )
+
+        logs_by_block = defaultdict(list)
+        for log in logs:
+            logs_by_block[log['blockNumber']].append(log)
+
+        for block_number, block in zip(block_numbers, blocks):
+            if not block:
+                raise ValueError(f"Block {block_number} not found")
+            await self.processor.process_block(block, logs_by_block.get(block_number, []))
+            if self.reorg_detector is not None:
+                self.reorg_detector.observe(block)
+            self.blocks_done += 1
+
+        # Transactions are inserted in the background and Mongo documents buffered,
+        # a checkpointed range is never retried so they must be stored first
+        await self.processor.settle(block_numbers)
+        if not await run_sql(self.db_operator.sql.insert.backfill.checkpoint, self.network, range_start, range_end):
+            raise RuntimeError(f"Failed to checkpoint {self.network} range {range_start}-{range_end}")
@@ -1,22 +1,106 @@
-from datetime import datetime, timedelta
 from collections import OrderedDict
+import time
 
-class BoundedCache:
-    def __init__(self, max_size=500, ttl_hours=24):
+# Distinguishes "use the cache's default TTL" from an explicit ttl=None (never expires)
+_DEFAULT = object()
+
+
+class _Entry:
+    __slots__ = ('value', 'expires', 'weight')
+
+    def __init__(self, value, expires, weight):
+        self.value = value
+        self.expires = expires
+        self.weight = weight
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache with optional TTL.
+
+    Gets and sets are O(1). Expiry is checked lazily on access against the
+    monotonic clock, so there is no sweep to schedule. Capacity is counted
+    in entries, or in the weight returned by `weigher` for each value when
+    entries differ widely in size (e.g. ABIs).
+    """
+
+    def __init__(self, max_size: int = 1000, ttl: float = None, weigher=None):
         self.max_size = max_size
-        self.ttl = timedelta(hours=ttl_hours)
-        self.cache = OrderedDict()
-
-    def get(self, key):
-        if key not in self.cache:
-            return None
-        value, timestamp = self.cache[key]
-        if datetime.now() - timestamp > self.ttl:
-            del self.cache[key]
-            return None
-        return value
-
-    def set(self, key, value):
-        if len(self.cache) >= self.max_size:
-            self.cache.popitem(last=False)  # Remove oldest item
-        self.cache[key] = (value, datetime.now())
+        self.ttl = ttl
+        self.weigher = weigher
+        self._entries = OrderedDict()
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        if entry.expires is not None and time.monotonic() > entry.expires:
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def set(self, key, value, ttl=_DEFAULT):
+        """
+        Store a value, evicting the least recently used entries to make room.
+        `ttl` overrides the cache default for this key, None never expires.
+        """
+        if ttl is _DEFAULT:
+            ttl = self.ttl
+        expires = time.monotonic() + ttl if ttl is not None else None
+        weight = self.weigher(value) if self.weigher else 1
+        entry = self._entries.get(key)
+        if entry is None:
+            self._entries[key] = _Entry(value, expires, weight)
+            self.weight += weight
+        else:
+            self.weight += weight - entry.weight
+            entry.value, entry.expires, entry.weight = value, expires, weight
+            self._entries.move_to_end(key)
+        while self.weight > self.max_size and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.weight -= evicted.weight
+            self.evictions += 1
+
+    def pop(self, key, default=None):
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        self._remove(key)
+        return entry.value
+
+    def _remove(self, key):
+        self.weight -= self._entries.pop(key).weight
+
+    def clear(self):
+        self._entries.clear()
+        self.weight = 0
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """Snapshot of the cache size and counters."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "weight": self.weight,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -1,6 +1,13 @@
 from ..base_models import BasePipeline
+from ..utils import decode_hex, HeadTracker
+from .scheduler import BlockScheduler
+from .backfill import BackfillEngine
+from .reorg import ReorgDetector
+from .abi_fetcher import ABIFetcher
+from .processing.events import ProtocolCounters
+from .processing.logs import DecodePool
+from database import run_sql
 import asyncio
-from ..utils import decode_hex
 import signal
 import threading
 import time
@@ -15,6 +22,10 @@ class EVMPipeline(BasePipeline):
         self.querier = querier
         self.processor = processor
         self.network = network_name
+        self.scheduler = BlockScheduler(network_name, self.processor.process_block, catchup=self._catch_up_block)
+        self.head_tracker = None
+        self.reorg_detector = ReorgDetector(network_name, self.querier, self.processor)
+        self.backfill = BackfillEngine(network_name, self.querier, self.processor, reorg_detector=self.reorg_detector)
         self._shutdown_flag = threading.Event()
         
         # Register signal handlers
@@ -42,23 +53,38 @@ class EVMPipeline(BasePipeline):
         """
         try:
             self.logger.info(f"Starting {self.network} pipeline in real-time mode...")
-            tasks = []
 
             # Schedule shutdown if duration is specified
             if duration:
                 self.schedule_shutdown(delay_seconds=duration)
 
+            # Resume gap tracking from the last block persisted for the chain
+            last_block = await run_sql(self.processor.db_operator.sql.query.block.query_latest_block_number, self.network)
+            self.head_tracker = HeadTracker(self.network, last_block)
+            await self.processor.warm_caches()
+
             async for full_block in self.querier.stream_blocks(duration):
                 if self._shutdown_flag.is_set():
                     self.logger.info("Shutdown flag detected, stopping pipeline...")
                     break
                     
-                self.logger.info(f"Received block: {decode_hex(full_block.get('number'))}")
-                tasks.append(asyncio.create_task(self.processor.process_block(full_block)))
+                block_number = decode_hex(full_block.get('number'))
+                self.logger.info(f"Received block: {block_number} (queue depth {self.scheduler.queue_depth})")
+                for start, end in self.head_tracker.observe(block_number):
+                    self.scheduler.enqueue_catchup(start, end)
+                if self.reorg_detector.detect(full_block):
+                    # Let in-flight writes land before deleting the orphaned blocks
+                    await self.scheduler.settle()
+                    await self.reorg_detector.resolve(full_block)
+                await self.scheduler.submit(full_block)
 
-            # Wait for remaining tasks to complete
-            if tasks:
-                await asyncio.gather(*tasks)
+            # Wait for in-flight and backlogged blocks to complete, then the pools they discovered
+            await self.scheduler.drain()
+            await self.processor.log_processor.enrichment.drain()
+            self.logger.info(f"{self.network} scheduler stats: {self.scheduler.stats()}")
+            self.logger.info(f"{self.network} head tracker stats: {self.head_tracker.stats()}")
+            self.logger.info(f"{self.network} reorg stats: {self.reorg_detector.stats()}")
+            self._log_stats()
                 
             self.logger.info(f"Completed {self.network} pipeline in real-time mode.")
             
@@ -68,22 +94,41 @@ class EVMPipeline(BasePipeline):
             if self._shutdown_flag.is_set():
                 await self.cleanup()
 
+    def _log_stats(self):
+        """Log the stats of the caches, queues and writers both run modes share."""
+        self.logger.info(f"{self.network} metadata cache stats: {self.processor.log_processor.metadata_cache.stats()}")
+        self.logger.info(f"{self.network} signature index stats: {self.processor.log_processor.decoder.signatures.stats()}")
+        self.logger.info(f"{self.network} ABI fetcher stats: {ABIFetcher.shared().stats()}")
+        self.logger.info(f"{self.network} enrichment queue stats: {self.processor.log_processor.enrichment.stats()}")
+        self.logger.info(f"{self.network} decode pool stats: {self.processor.log_processor.decode_pool.stats()}")
+        self.logger.info(f"{self.network} mongo writer stats: {self.processor.db_operator.mongodb.db.writer.stats()}")
+        self.logger.info(f"{self.network} protocol counter stats: {ProtocolCounters.shared().stats()}")
+        if self.processor.archive is not None:
+            self.logger.info(f"{self.network} archive stats: {self.processor.archive.stats()}")
+        self.logger.info(f"{self.network} partition stats: {self.processor.partitions.stats()}")
+
+    async def _catch_up_block(self, block_number):
+        """
+        Fetch and process a block that was missed by the live stream.
+        """
+        block = await self.querier.get_block(block_number)
+        if not block:
+            raise ValueError(f"Missed block {block_number} not found")
+        self.logger.info(f"Catching up missed block: {block_number}")
+        await self.processor.process_block(block)
+        # Live blocks are recorded by detect(), caught up ones fill the holes between them
+        self.reorg_detector.observe(block)
+
     async def run_historical(self, start_block, end_block):
         """
-        Run the pipeline for a historical range of blocks.
+        Run the pipeline for a historical range of blocks, resuming from checkpoints.
         """
         try:
             self.logger.info(f"Starting {self.network} pipeline for historical range: {start_block} to {end_block}")
-            current_block = start_block
-            while current_block <= end_block and not self._shutdown_flag.is_set():
-                block = await self.querier.get_block(current_block)
-                if block:
-                    self.logger.info(f"Processing block: {decode_hex(block.get('number'))}")
-                    await self.processor.process_block(block)
-                    current_block = block.get("number") + 1
-                else:
-                    self.logger.warning(f"Block {current_block} not found. Stopping pipeline.")
-                    break
+            await self.processor.warm_caches()
+            await self.backfill.run(start_block, end_block, should_stop=self._shutdown_flag.is_set)
+            await self.processor.log_processor.enrichment.drain()
+            self._log_stats()
             self.logger.info(f"Completed {self.network} pipeline for historical range.")
         except Exception as e:
             self.logger.error(f"Error during historical pipeline execution: {e}", exc_info=True)
@@ -94,6 +139,7 @@ class EVMPipeline(BasePipeline):
     def shutdown(self):
         """Initiate shutdown sequence"""
         self.logger.info("Initiating pipeline shutdown...")
+        self._shutdown_start = time.time()
         self._shutdown_flag.set()
         
         # Trigger processor shutdown
@@ -104,16 +150,27 @@ class EVMPipeline(BasePipeline):
         if hasattr(self.querier, 'shutdown'):
             self.querier.shutdown()
 
+    @staticmethod
+    async def close_shared():
+        """
+        Close what every EVM pipeline in the process shares. Called once at
+        process exit, after the pipelines have stopped.
+        """
+        # Write the protocol counter deltas every chain left
+        await asyncio.to_thread(ProtocolCounters.shared().close)
+        await ABIFetcher.shared().close()
+        DecodePool.shared().close()
+
     async def cleanup(self):
         """Cleanup resources during shutdown"""
         try:
             self.logger.info("Cleaning up pipeline resources...")
             
-            # Close database connections
-            if hasattr(self, 'sql_database'):
-                self.sql_database.close()
-            if hasattr(self, 'mongodb_database'):
-                await self.mongodb_database.close()
+            # The databases are shared with the other pipelines, run.py closes them at exit
+
+            await self.processor.log_processor.enrichment.close()
+            if hasattr(self.querier, 'close'):
+                await self.querier.close()
                 
             self.logger.info("Pipeline cleanup completed")
             
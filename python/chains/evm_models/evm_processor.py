@@ -1,10 +1,13 @@
 from ..base_models import BaseProcessor
+import asyncio
 import threading
-from psycopg2.pool import ThreadedConnectionPool
-from config import Settings
 import signal
 import time
 from .processing import EventProcessor, BlockProcessor, LogProcessor
+from .abi_fetcher import ABIFetcher
+from .rpc import raw_log
+from config import Settings
+from database import SegmentArchive, PartitionManager
 
 class EVMProcessor(BaseProcessor):
     """
@@ -14,16 +17,13 @@ class EVMProcessor(BaseProcessor):
         super().__init__(sql_database, mongodb_database, network_name)
         self.querier = querier
         self.event_processor = EventProcessor(self.db_operator, network_name)
-        self.block_processor = BlockProcessor(self.db_operator, network_name)
+        # Time ranges of the chain's block, transaction, swap and sync partitions
+        self.partitions = PartitionManager(self.db_operator.sql_db, network_name)
+        self.block_processor = BlockProcessor(self.db_operator, network_name, partitions=self.partitions)
         self.log_processor = LogProcessor(self.db_operator, self.querier, network_name)
+        # Local copy of raw blocks and logs for reprocessing, when ARCHIVE_DIR is set
+        self.archive = SegmentArchive(network_name) if Settings.ARCHIVE_DIR else None
 
-        # Initialize connection pool
-        self.db_pool = ThreadedConnectionPool(
-            minconn=5,
-            maxconn=20,
-            **Settings.POSTGRES_CONFIG
-        )
-        
         # Register signal handlers
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -43,14 +43,29 @@ class EVMProcessor(BaseProcessor):
         shutdown_thread = threading.Thread(target=shutdown_timer, daemon=True)
         shutdown_thread.start()
 
-    async def process_block(self, block):
-        """Process a block, transactions and logs."""
+    async def warm_caches(self):
+        """Load known event signatures, pools, tokens and ABI misses into the shared caches, and create the upcoming partitions"""
+        await asyncio.to_thread(self.partitions.maintain)
+        self.partitions.start()
+        await self.log_processor.decoder.signatures.load(self.db_operator)
+        await self.log_processor.metadata_cache.warm(self.db_operator, self.network)
+        await ABIFetcher.shared().load_misses(self.db_operator, self.network)
+
+    async def process_block(self, block, logs=None, archive=True):
+        """
+        Process a block, transactions and logs. Logs are fetched unless already provided.
+        The raw block and logs are appended to the local archive unless `archive` is False.
+        """
         try:
             # Get block info immediately - this is synchronous and fast
-            block_number, timestamp = self.block_processor.process(block)
+            block_number, timestamp = await self.block_processor.process(block)
             
-            # Get logs for the block - synchronous operation
-            logs = self.querier.get_block_logs(block_number)
+            # Get logs for the block
+            if logs is None:
+                logs = await self.querier.get_block_logs(block_number)
+
+            if archive and self.archive is not None:
+                await asyncio.to_thread(self._archive_block, block, block_number, logs)
             
             # Process logs synchronously since it's mainly data transformation
             decoded_logs = await self.log_processor.process(block_number, timestamp, logs)
@@ -65,16 +80,34 @@ class EVMProcessor(BaseProcessor):
             self.logger.error(f"Error processing block {block_number}: {e}", exc_info=True)
             raise
 
+    async def settle(self, block_numbers):
+        """
+        Wait until the given blocks' background writes are stored: their
+        transaction inserts and the buffered Mongo documents. Raises if any
+        of them failed, so the blocks are not treated as done.
+        """
+        failed = await self.block_processor.settle(block_numbers)
+        if failed:
+            raise RuntimeError(f"Transactions of {self.network} blocks {failed} were not inserted")
+        if not await asyncio.to_thread(self.db_operator.mongodb.db.writer.flush):
+            raise RuntimeError(f"MongoDB writes failed while settling {self.network} blocks")
+
+    def _archive_block(self, block, block_number: int, logs):
+        try:
+            self.archive.append(block_number, {"block": block, "logs": [raw_log(log) for log in logs]})
+        except Exception as e:
+            # The archive is a copy, a failed append must not stop processing
+            self.logger.error(f"Error archiving block {block_number}: {e}")
+
     def shutdown(self):
         """Cleanup method for graceful shutdown"""
         try:
             # Shutdown event processor first
             if hasattr(self, 'event_processor'):
                 self.event_processor.shutdown()
-            
-            # Close database pool
-            if hasattr(self, 'db_pool'):
-                self.db_pool.closeall()
+            if self.archive is not None:
+                self.archive.close()
+            self.partitions.close()
                 
             self.logger.info("Processor shutdown completed")
             
@@ -1,22 +1,35 @@
 from ..base_models import BaseQuerier
 from .evm_websocket_handler import EVMWebSocketHandler
+from .rpc import AsyncRPCClient, RPCBatcher, RPCError, format_log
+from .multicall import Multicall, find_function_abi, encode_function_call, decode_function_result
+from .abi_fetcher import ABIFetcher
+from .utils import MULTICALL3_ADDRESS
 from web3 import Web3
 from typing import Optional
-import requests
+import asyncio
 import json
 from config import Settings
-from abc import abstractmethod
 
 class EVMQuerier(BaseQuerier):
     """
     Abstract EVM-specific querier with common functionality.
     """
-    
+    # Chains with Multicall3 at a different address override this, None disables multicall
+    multicall_address = MULTICALL3_ADDRESS
+    # Block explorer getabi endpoint and its API key, None if the explorer takes no key
+    explorer_url = None
+    explorer_api_key = None
+
     def __init__(self, network_name: str, http_endpoint: str, ws_endpoint: str):
         super().__init__(network_name)
+        # Web3 is kept for contract/ABI helpers, network calls go through the async RPC client
         self.w3 = Web3(Web3.HTTPProvider(http_endpoint))
+        self.rpc = AsyncRPCClient(network_name, http_endpoint)
+        # Concurrent single requests are coalesced into JSON-RPC batch arrays
+        self.batcher = RPCBatcher(self.rpc)
+        self.multicall = Multicall(self.rpc, self.multicall_address, self.batcher)
         self.ws = EVMWebSocketHandler(network_name, ws_endpoint)
-    
+
     def is_connected(self) -> bool:
         """
         Check if the connection to the provider is successful.
@@ -29,30 +42,67 @@ class EVMQuerier(BaseQuerier):
         """
         self.logger.info(f"Fetching block {'latest' if block_number is None else block_number}")
         try:
-            block = self.w3.eth.get_block('latest' if block_number is None else block_number, full_transactions=True)
-            self.logger.debug(f"Block {block['number']} fetched successfully.")
+            block = await self.rpc.request(
+                "eth_getBlockByNumber",
+                ['latest' if block_number is None else hex(block_number), True]
+            )
+            if block:
+                self.logger.debug(f"Block {block['number']} fetched successfully.")
             return block
         except Exception as e:
             self.logger.error(f"Failed to fetch block: {e}")
             raise
-    
-    def get_block_logs(self, block_number):
+
+    async def get_block_logs(self, block_number):
         """
         Get the logs of a block.
         """
         self.logger.info(f"Fetching logs for block {block_number}")
-        # Fetch logs for the block
-        try:    
-            logs = self.w3.eth.get_logs({
-                "fromBlock": block_number,
-                "toBlock": block_number
-            })
+        # Fetch logs for the block, batched with other blocks in flight
+        try:
+            logs = await self.batcher.request("eth_getLogs", [{
+                "fromBlock": hex(block_number),
+                "toBlock": hex(block_number)
+            }])
             self.logger.debug(f"Logs fetched successfully for block {block_number}")
-            return logs
+            return [format_log(log) for log in logs]
         except Exception as e:
             self.logger.error(f"Failed to fetch logs for block {block_number}: {e}")
             return None
-    
+
+    async def get_blocks(self, block_numbers: list):
+        """
+        Fetch several blocks with full transactions in JSON-RPC batch round-trips.
+        """
+        try:
+            return await self.rpc.batch([("eth_getBlockByNumber", [hex(n), True]) for n in block_numbers])
+        except Exception as e:
+            self.logger.error(f"Failed to fetch blocks {block_numbers[0]} to {block_numbers[-1]}: {e}")
+            raise
+
+    async def get_logs(self, from_block: int, to_block: int):
+        """
+        Get the logs of a block range with a single eth_getLogs. When the
+        provider rejects the range (too many results or too wide) it is
+        bisected until the halves are accepted.
+        """
+        try:
+            logs = await self.rpc.request("eth_getLogs", [{
+                "fromBlock": hex(from_block),
+                "toBlock": hex(to_block)
+            }])
+            return [format_log(log) for log in logs]
+        except RPCError as e:
+            if from_block == to_block:
+                raise
+            middle = (from_block + to_block) // 2
+            self.logger.debug(f"Splitting logs range {from_block}-{to_block} at {middle}: {e}")
+            first, second = await asyncio.gather(
+                self.get_logs(from_block, middle),
+                self.get_logs(middle + 1, to_block)
+            )
+            return first + second
+
     async def stream_blocks(self, duration=None):
         """
         Stream blocks with full transactions using WebSocket.
@@ -60,25 +110,27 @@ class EVMQuerier(BaseQuerier):
         async for full_block in self.ws.run(duration):
             if full_block:
                 yield full_block
-                
-    @ abstractmethod
+
     async def get_contract_abi(self, contract_address):
         """
-        Get the ABI of a contract.
+        Get the ABI of a contract from the chain's block explorer.
         """
-        pass
-    
-    def is_contract(self, address):
+        if self.explorer_url is None:
+            return None
+        self.logger.debug(f"Fetching ABI for contract {contract_address}")
+        return await ABIFetcher.shared().fetch(self.network, self.explorer_url, self.explorer_api_key, contract_address)
+
+    async def is_contract(self, address):
         """
         Check if an address is a contract or an EOA (Externally Owned Account).
         """
         # Some transactions (e.g., contract creation) have no "to" address
         if address is None:
             return False
-        code = self.w3.eth.get_code(address)
+        code = await self.batcher.request("eth_getCode", [address, "latest"])
         # True for contracts, False for EOAs
-        return len(code) > 0 
-    
+        return code not in (None, "0x")
+
     def get_contract(self, address, abi):
         try:
             if type(abi) == str:
@@ -87,3 +139,50 @@ class EVMQuerier(BaseQuerier):
         except Exception as e:
             self.logger.error(f"Failed to get contract {address}: {e}")
             return None
+
+    async def call_function(self, address, abi, function_name, *args):
+        """
+        Call a read-only contract function with eth_call, the async
+        equivalent of contract.functions.<function_name>(*args).call().
+        """
+        function_abi = find_function_abi(abi, function_name, len(args))
+        if function_abi is None:
+            raise ValueError(f"Function {function_name} not found in ABI for {address}")
+
+        data = encode_function_call(function_abi, args)
+        result = await self.batcher.request("eth_call", [{"to": address, "data": "0x" + data.hex()}, "latest"])
+        return decode_function_result(function_abi, bytes.fromhex(result[2:]))
+
+    async def call_functions(self, calls: list):
+        """
+        Call several read-only functions, given as (address, abi, function_name, args)
+        tuples, in one multicall. Returns the decoded results in order, with None for
+        calls that are missing from the ABI, revert or fail to decode.
+        """
+        function_abis = [find_function_abi(abi, function_name, len(args)) for _, abi, function_name, args in calls]
+        calls_data = [
+            (address, encode_function_call(function_abi, args))
+            for (address, _, _, args), function_abi in zip(calls, function_abis)
+            if function_abi is not None
+        ]
+        responses = iter(await self.multicall.aggregate(calls_data))
+
+        results = []
+        for (address, _, function_name, _), function_abi in zip(calls, function_abis):
+            if function_abi is None:
+                results.append(None)
+                continue
+            data = next(responses)
+            try:
+                results.append(decode_function_result(function_abi, data) if data else None)
+            except Exception as e:
+                self.logger.debug(f"Failed to decode {function_name} for {address}: {e}")
+                results.append(None)
+        return results
+
+    async def close(self):
+        """
+        Release the RPC connection pool. The block explorer fetcher is shared
+        by every chain and closed at process exit.
+        """
+        await self.rpc.close()
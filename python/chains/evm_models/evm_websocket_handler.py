@@ -1,5 +1,4 @@
 from ..base_models import BaseWebSocketHandler
-import json
 
 class EVMWebSocketHandler(BaseWebSocketHandler):
     """
@@ -37,9 +36,7 @@ class EVMWebSocketHandler(BaseWebSocketHandler):
         request_message = {
             "jsonrpc": "2.0",
             "method": "eth_getBlockByNumber",
-            "params": [hex(block_number), True],  # Full transactions requested
-            "id": 1
+            "params": [hex(block_number), True]  # Full transactions requested
         }
-        await self.connection.send(json.dumps(request_message))
-        response = await self.connection.recv()
-        return json.loads(response).get("result")
\ No newline at end of file
+        response = await self.request(request_message)
+        return response.get("result")
\ No newline at end of file
@@ -0,0 +1,90 @@
+import json
+import logging
+from eth_abi import encode, decode
+from eth_utils import function_abi_to_4byte_selector, get_abi_input_types, get_abi_output_types
+from .rpc import RPCError
+
+logger = logging.getLogger(__name__)
+
+# aggregate3((address target, bool allowFailure, bytes callData)[]) returns ((bool success, bytes returnData)[])
+AGGREGATE3_SELECTOR = bytes.fromhex('82ad56cb')
+AGGREGATE3_INPUT = ['(address,bool,bytes)[]']
+AGGREGATE3_OUTPUT = ['(bool,bytes)[]']
+
+
+def find_function_abi(abi, function_name: str, arg_count: int = 0) -> dict:
+    """
+    Find a function entry in a contract ABI by name and argument count.
+    """
+    if type(abi) == str:
+        abi = json.loads(abi)
+    for entry in abi:
+        if (entry.get("type") == "function"
+                and entry.get("name") == function_name
+                and len(entry.get("inputs", [])) == arg_count):
+            return entry
+    return None
+
+
+def encode_function_call(function_abi: dict, args=()) -> bytes:
+    """
+    Build the calldata for a function call.
+    """
+    return function_abi_to_4byte_selector(function_abi) + encode(get_abi_input_types(function_abi), args)
+
+
+def decode_function_result(function_abi: dict, data: bytes):
+    """
+    Decode the return data of a function call. Like web3, single outputs are returned unwrapped.
+    """
+    values = decode(get_abi_output_types(function_abi), data)
+    return values[0] if len(values) == 1 else values
+
+
+class Multicall:
+    """
+    Aggregates read-only contract calls into a single eth_call against a
+    Multicall3 contract, falling back to a batch of plain eth_calls when the
+    chain has no Multicall3 deployment.
+    """
+    def __init__(self, client, address: str = None, batcher=None):
+        self.client = client
+        self.address = address
+        # Single eth_calls go through the batcher when there is one so concurrent aggregates share a round-trip
+        self.batcher = batcher
+        self.logger = logger
+        self._supported = address is not None
+
+    async def aggregate(self, calls: list) -> list:
+        """
+        Execute (target, calldata) pairs and return the raw return data of each
+        call, or None for calls that reverted.
+        """
+        if not calls:
+            return []
+        if self._supported:
+            try:
+                return await self._aggregate3(calls)
+            except RPCError as e:
+                self.logger.warning(f"Multicall3 failed on {self.client.network}, falling back to batched eth_call: {e}")
+        return await self._batched_calls(calls)
+
+    async def _aggregate3(self, calls: list) -> list:
+        data = AGGREGATE3_SELECTOR + encode(AGGREGATE3_INPUT, [[(target, True, calldata) for target, calldata in calls]])
+        result = await (self.batcher or self.client).request(
+            "eth_call", [{"to": self.address, "data": "0x" + data.hex()}, "latest"]
+        )
+        if result in (None, "0x"):
+            # No contract at the address, stop trying for this chain
+            self._supported = False
+            raise RPCError("aggregate3", f"no Multicall3 deployment at {self.address}")
+
+        (responses,) = decode(AGGREGATE3_OUTPUT, bytes.fromhex(result[2:]))
+        return [return_data if success else None for success, return_data in responses]
+
+    async def _batched_calls(self, calls: list) -> list:
+        results = await self.client.batch(
+            [("eth_call", [{"to": target, "data": "0x" + calldata.hex()}, "latest"]) for target, calldata in calls],
+            return_exceptions=True
+        )
+        return [None if isinstance(result, Exception) or result is None else bytes.fromhex(result[2:]) for result in results]
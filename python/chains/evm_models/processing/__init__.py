@@ -1,6 +1,6 @@
 from .events import EventProcessor
 from .events.models import TokenSwap
 from .blocks import BlockProcessor
-from .logs import LogProcessor
+from .logs import LogProcessor, MetadataCache
 
-__all__ = ['EventProcessor', 'TokenSwap', 'BlockProcessor', 'LogProcessor']
\ No newline at end of file
+__all__ = ['EventProcessor', 'TokenSwap', 'BlockProcessor', 'LogProcessor', 'MetadataCache']
\ No newline at end of file
@@ -1,9 +1,12 @@
 from operator import itemgetter
-from database import DatabaseOperator
+from database import DatabaseOperator, PartitionManager, run_sql
+import asyncio
 import logging
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from ....utils import decode_hex, normalize_hex
 from ...utils import CHAIN_IDS
+from .transaction_columns import extract_transaction_columns
 
 
 # Block item getters
@@ -12,29 +15,23 @@ get_block_number = itemgetter('number')
 get_parent_hash = itemgetter('parentHash')
 get_timestamp = itemgetter('timestamp')
 
-# EVM Transaction item getters
-get_from = itemgetter('from')
-get_to = itemgetter('to')
-get_value = itemgetter('value')
-get_gas = itemgetter('gas')
-get_gas_price = itemgetter('gasPrice')
-get_chain_id = itemgetter('chainId')
-
 
 class BlockProcessor:
 
-    def __init__(self, db_operator: DatabaseOperator, chain: str):
+    def __init__(self, db_operator: DatabaseOperator, chain: str, partitions: PartitionManager = None):
         self.chain = chain  # Normalize chain name
         self.db_operator = db_operator
         self.logger = logging.getLogger(__name__)
-        self.batch_size = 1000
         self.chain_id = CHAIN_IDS.get(self.chain)
         if self.chain_id is None:
             self.logger.warning(f"No default chain ID found for {self.chain}")
+        # Long-lived, every block's transaction columns are extracted on it
         self._transaction_executor = ThreadPoolExecutor(max_workers=8)
-        self._processing_tasks = set()
+        self._processing_tasks = {}  # block number -> its transaction insert, while running
+        self._failed_inserts = set()  # blocks whose transaction insert failed, until settled or reprocessed
+        self.partitions = partitions
 
-    def process(self, block: dict):
+    async def process(self, block: dict):
         """
         Process block and schedule transaction processing asynchronously.
         Returns block_number and timestamp immediately.
@@ -45,13 +42,18 @@ class BlockProcessor:
             
             self.logger.info(f"Processing block {block_number} on {self.chain}")
             
-            # Insert block data
-            self.db_operator.mongodb.insert.insert_block(block, self.chain, block_number, timestamp)
+            # Insert block data, encoding runs in a worker thread
+            await asyncio.to_thread(self.db_operator.mongodb.insert.insert_block, block, self.chain, block_number, timestamp)
             
             block_hash = normalize_hex(get_hash(block))
             parent_hash = normalize_hex(get_parent_hash(block))
 
-            self.db_operator.sql.insert.block.insert_block(
+            # Everything the block writes lands in the time range of its timestamp
+            if self.partitions is not None and not self.partitions.covers(timestamp):
+                await asyncio.to_thread(self.partitions.ensure, timestamp)
+
+            await run_sql(
+                self.db_operator.sql.insert.block.insert_block,
                 self.chain,
                 block_number,
                 block_hash,
@@ -60,12 +62,10 @@ class BlockProcessor:
             )
             
             # Schedule transaction processing in background
-            self._transaction_executor.submit(
-                self.process_transactions,
-                block,
-                block_number,
-                timestamp
-            )
+            self._failed_inserts.discard(block_number)
+            task = asyncio.create_task(self._insert_transactions(block, block_number, timestamp))
+            self._processing_tasks[block_number] = task
+            task.add_done_callback(partial(self._insert_done, block_number))
             
             return block_number, timestamp
             
@@ -73,82 +73,60 @@ class BlockProcessor:
             self.logger.error(f"Error processing block {block_number} for {self.chain}: {e}")
             raise e
     
-    # Process the transactions
-    def process_transactions(self, block: dict, block_number: int, timestamp: int):
+    async def _insert_transactions(self, block: dict, block_number: int, timestamp: int) -> bool:
+        """
+        Extract the transaction columns in the executor, then bulk load them.
+        """
         try:
-            transactions = block.get('transactions', [])
-            if not transactions:
-                return
-            self.logger.info(f"Processing {len(transactions)} transactions on {self.chain} for block {block_number}")
-            # Pre-process transactions into batches
-            transaction_batches = [
-                transactions[i:i + self.batch_size] 
-                for i in range(0, len(transactions), self.batch_size)
-            ]
-            
-            # Process batches in parallel
-            with ThreadPoolExecutor(max_workers=8) as executor:
-                futures = []
-                for batch in transaction_batches:
-                    futures.append(
-                        executor.submit(
-                            self._process_transaction_batch,
-                            batch,
-                            block_number,
-                            timestamp
-                        )
-                    )
-                    
-                    # Collect all processed transactions
-                all_transactions = []
-                for future in futures:
-                    try:
-                        batch_result = future.result()
-                        all_transactions.extend(batch_result)
-                    except Exception as e:
-                        self.logger.error(f"Error processing transaction batch: {e}")
-            
-            # Bulk insert all transactions
-            if all_transactions:
-                self.db_operator.sql.insert.evm.transactions(
-                    self.chain, 
-                    all_transactions, 
+            loop = asyncio.get_running_loop()
+            columns = await loop.run_in_executor(
+                self._transaction_executor,
+                self.process_transactions,
+                block,
+                block_number,
+                timestamp
+            )
+            if columns:
+                return await run_sql(
+                    self.db_operator.sql.insert.evm.transactions,
+                    self.chain,
+                    columns,
                     block_number
                 )
+            return True
         except Exception as e:
-            self.logger.error(f"Error processing transactions for block {block_number}: {e}")
+            self.logger.error(f"Error inserting transactions for block {block_number}: {e}")
+            return False
+
+    def _insert_done(self, block_number: int, task: asyncio.Task):
+        if self._processing_tasks.get(block_number) is task:
+            del self._processing_tasks[block_number]
+        if task.cancelled() or not task.result():
+            self._failed_inserts.add(block_number)
 
-    def _process_transaction_batch(self, transaction_batch, block_number, timestamp):
+    async def settle(self, block_numbers) -> list:
         """
-        Process a batch of transactions.
+        Wait for the transaction inserts of the given blocks still running.
+        Returns the blocks whose insert failed.
         """
-        try:
-            processed_transactions = []
-            # Process each transaction in the batch into a tuple
-            for transaction in transaction_batch:
-                processed_tx = (
-                    block_number,
-                    self.chain,
-                    normalize_hex(get_hash(transaction)),
-                    self.get_chain_id_with_default(transaction),
-                    get_from(transaction),
-                    get_to(transaction),
-                    decode_hex(get_value(transaction)),
-                    decode_hex(get_gas(transaction)) * decode_hex(get_gas_price(transaction)),
-                    timestamp
-                )
-                processed_transactions.append(processed_tx)
-        except Exception as e:
-            self.logger.error(f"Error processing transaction batch: {e}")
-            return []
-        return processed_transactions
-    
-    def get_chain_id_with_default(self, transaction):
+        block_numbers = set(block_numbers)
+        running = [task for number, task in list(self._processing_tasks.items()) if number in block_numbers]
+        if running:
+            await asyncio.wait(running)
+        failed = sorted(block_numbers & self._failed_inserts)
+        self._failed_inserts.difference_update(block_numbers)
+        return failed
+
+    # Process the transactions into columns
+    def process_transactions(self, block: dict, block_number: int, timestamp: int):
         """
-        Get the chain ID from the transaction or use the default chain ID.
-        If neither is available, return None.
+        Extract a block's transactions column-wise, None if it has none.
         """
-        return get_chain_id(transaction) if 'chainId' in transaction else self.chain_id
+        transactions = block.get('transactions', [])
+        if not transactions:
+            return None
+        self.logger.info(f"Processing {len(transactions)} transactions on {self.chain} for block {block_number}")
+        return extract_transaction_columns(transactions, self.chain, block_number, timestamp, self.chain_id)
     
     def process_withdrawals(self, block):
         """
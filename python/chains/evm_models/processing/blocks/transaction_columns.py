@@ -0,0 +1,55 @@
+from itertools import repeat
+from operator import itemgetter, mul
+from ....utils import decode_hex, normalize_hex
+
+
+# EVM Transaction item getters
+get_hash = itemgetter('hash')
+get_from = itemgetter('from')
+get_value = itemgetter('value')
+get_gas = itemgetter('gas')
+get_gas_price = itemgetter('gasPrice')
+
+
+def decode_hex_column(values: list) -> list:
+    """
+    Decode a column of hex quantities in one pass, values that are already
+    decoded (or missing) are passed through as decode_hex does.
+    """
+    try:
+        return list(map(int, values, repeat(16)))
+    except TypeError:
+        return [decode_hex(value) for value in values]
+
+
+def extract_transaction_columns(transactions: list, chain: str, block_number: int, timestamp: int, default_chain_id: int = None) -> dict:
+    """
+    Extract a block's transactions into evm_transactions columns, one list
+    per column in transaction order. Every field is gathered for the whole
+    block with C-level map() calls and decoded a column at a time rather
+    than field by field per transaction. The columns shared by every
+    transaction in the block hold a single value.
+
+    Transactions without a chainId (pre EIP-155) take `default_chain_id`.
+    """
+    hashes = list(map(get_hash, transactions))
+    if hashes and not isinstance(hashes[0], str):
+        hashes = list(map(normalize_hex, hashes))
+
+    default = hex(default_chain_id) if default_chain_id is not None else None
+    chain_ids = decode_hex_column([transaction.get('chainId', default) for transaction in transactions])
+
+    return {
+        'block_number': block_number,
+        'chain': chain,
+        'transaction_hash': hashes,
+        'chain_id': chain_ids,
+        'from_address': list(map(get_from, transactions)),
+        # Contract creations have no recipient
+        'to_address': [transaction.get('to') for transaction in transactions],
+        'amount': decode_hex_column(list(map(get_value, transactions))),
+        'total_gas': list(map(mul,
+                              decode_hex_column(list(map(get_gas, transactions))),
+                              decode_hex_column(list(map(get_gas_price, transactions))))),
+        'timestamp': timestamp,
+    }
@@ -1,4 +1,6 @@
 from .event_processor import EventProcessor
 from .models import TokenSwap
+from .protocol_registry import ProtocolRegistry
+from .event_processors import ProtocolCounters
 
-__all__ = ['EventProcessor', 'TokenSwap']
\ No newline at end of file
+__all__ = ['EventProcessor', 'TokenSwap', 'ProtocolRegistry', 'ProtocolCounters']
\ No newline at end of file
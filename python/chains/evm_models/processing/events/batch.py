@@ -0,0 +1,70 @@
+import logging
+from database import run_sql
+
+logger = logging.getLogger(__name__)
+
+
+class EventWriteBatch:
+    """
+    Collects the swap and sync rows produced by one block so they can be
+    written in a single transaction instead of one commit per event.
+    """
+    def __init__(self, chain: str):
+        self.chain = chain
+        self.swaps = []
+        self.syncs = []
+        self.logger = logger
+
+    def __len__(self):
+        return len(self.swaps) + len(self.syncs)
+
+    def add_swap(self, swap_info, address: str, transaction_hash: str, log_index: int, timestamp: int):
+        self.swaps.append((
+            self.chain,
+            address,
+            transaction_hash,
+            log_index,
+            timestamp,
+            swap_info.amount0,
+            swap_info.amount1,
+            swap_info.token0_address,
+            swap_info.token1_address,
+            swap_info.token0_name,
+            swap_info.token1_name,
+            swap_info.token0_symbol,
+            swap_info.token1_symbol,
+            swap_info.factory_address,
+            swap_info.name
+        ))
+
+    def add_sync(self, sync_info, address: str, transaction_hash: str, log_index: int, timestamp: int):
+        self.syncs.append((
+            self.chain,
+            address,
+            transaction_hash,
+            log_index,
+            timestamp,
+            sync_info.reserve0,
+            sync_info.reserve1,
+            sync_info.token0_address,
+            sync_info.token1_address,
+            sync_info.token0_name,
+            sync_info.token1_name,
+            sync_info.token0_symbol,
+            sync_info.token1_symbol,
+            sync_info.factory_address,
+            sync_info.name
+        ))
+
+    async def flush(self, db_operator) -> bool:
+        """
+        Write the collected rows and clear the batch. Raises if the write
+        fails, so the block is not counted as processed without its events.
+        """
+        if not self:
+            return True
+        swaps, syncs = self.swaps, self.syncs
+        self.swaps, self.syncs = [], []
+        if not await run_sql(db_operator.sql.insert.evm.swaps_and_syncs, self.chain, swaps, syncs):
+            raise RuntimeError(f"Failed to write {len(swaps)} swaps and {len(syncs)} syncs for {self.chain}")
+        return True
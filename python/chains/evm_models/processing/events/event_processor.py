@@ -2,6 +2,7 @@
 
 from typing import Dict, List
 from .event_processors import SwapProcessor, SyncProcessor
+from .batch import EventWriteBatch
 from database import DatabaseOperator
 from operator import itemgetter
 import logging
@@ -21,6 +22,7 @@ class EventProcessor:
         self.db_operator = db_operator
         self.chain = chain
         self.event_mapping = self.load_event_mapping()
+        self.dispatch = self.compile_dispatch()
         self.logger = logger
         self.batch_size = 1000
         
@@ -33,7 +35,33 @@ class EventProcessor:
             "Sync": SyncProcessor(self.db_operator, self.chain),
         }
 
-    async def process_events(self, events: List[Dict], tx_hash: str, timestamp: int):
+    def compile_dispatch(self):
+        """
+        Map every topic0 a processor has a protocol for to that processor, so
+        an event is routed with one lookup on the hash its log already carries.
+        """
+        dispatch = {}
+        for processor in self.event_mapping.values():
+            for topic0 in processor.protocol_map:
+                dispatch[topic0] = processor
+        return dispatch
+
+    def resolve(self, event: Dict):
+        """
+        Find the processor for a decoded event and its signature, None if no processor handles it.
+        """
+        topic0 = event.get('topic0')
+        processor = self.dispatch.get(topic0)
+        if processor is not None:
+            return processor, topic0
+        # Otherwise hash the signature from the decoded parameters as before, which protocol
+        # map entries keyed on it still match, and a processor counts a miss as an unknown protocol
+        processor = self.event_mapping.get(get_event(event))
+        if processor is None:
+            return None
+        return processor, self.get_signature(event)
+
+    async def process_events(self, events: List[Dict], tx_hash: str, timestamp: int, batch: EventWriteBatch = None):
         """Process a list of events using pure asyncio"""
         try:
             if not events:
@@ -43,7 +71,7 @@ class EventProcessor:
             batches = [events[i:i + self.batch_size] for i in range(0, len(events), self.batch_size)]
             
             # Process all batches concurrently
-            tasks = [self._process_events_batch(batch, tx_hash, timestamp) for batch in batches]
+            tasks = [self._process_events_batch(chunk, tx_hash, timestamp, batch) for chunk in batches]
             batch_results = await asyncio.gather(*tasks)
             
             # Combine results
@@ -53,11 +81,11 @@ class EventProcessor:
             self.logger.error(f"Error processing events: {e}")
             return []
 
-    async def _process_events_batch(self, events: List[Dict], tx_hash: str, timestamp: int):
+    async def _process_events_batch(self, events: List[Dict], tx_hash: str, timestamp: int, batch: EventWriteBatch = None):
         """Process a batch of events concurrently"""
         try:
             tasks = [
-                self._process_single_event(event, tx_hash, index, timestamp)
+                self._process_single_event(event, tx_hash, index, timestamp, batch)
                 for index, event in enumerate(events)
             ]
             results = await asyncio.gather(*tasks)
@@ -67,22 +95,20 @@ class EventProcessor:
             self.logger.error(f"Error processing event batch: {e}")
             return []
 
-    async def _process_single_event(self, event: Dict, tx_hash: str, index: int, timestamp: int):
+    async def _process_single_event(self, event: Dict, tx_hash: str, index: int, timestamp: int, batch: EventWriteBatch = None):
         """Process a single event"""
         try:
-            event_name = get_event(event)
-            if event_name in self.event_mapping:
-                signature = self.get_signature(event)
-                processor = self.event_mapping[event_name]
-                
-                return processor.process_event(event, signature, tx_hash, index, timestamp)
+            resolved = self.resolve(event)
+            if resolved is not None:
+                processor, signature = resolved
+                return await processor.process_event(event, signature, tx_hash, index, timestamp, batch=batch)
                     
         except Exception as e:
             self.logger.error(f"Error processing event: {e}")
             return None
 
     def get_signature(self, event, _keccak=Web3.keccak, _join=','.join):
-        """Get event signature using cached functions"""
+        """Hash the event signature from its decoded parameters, for events decoded without a topic0"""
         name = get_event(event)
         types = tuple(get_type(v) for v in get_parameters(event).values())
         return _keccak(text=name + '(' + _join(types) + ')').hex()
@@ -93,14 +119,19 @@ class EventProcessor:
             if not decoded_logs:
                 return
             
+            # Rows from the whole block are written together in one transaction
+            batch = EventWriteBatch(self.chain)
+
             # Create tasks for each transaction's events
             tasks = []
             for tx_hash, logs in decoded_logs.items():
                 if logs:  # Only process if we have logs
-                    tasks.append(self.process_events(logs, tx_hash, timestamp))
+                    tasks.append(self.process_events(logs, tx_hash, timestamp, batch))
             
             # Process all transactions concurrently
             results = await asyncio.gather(*tasks)
+            # Raises when the rows are not written, the block is then retried
+            await batch.flush(self.db_operator)
             
             # Combine results from all transactions
             processed_results = []
@@ -112,4 +143,4 @@ class EventProcessor:
                 
         except Exception as e:
             self.logger.error(f"Error processing block events: {e}")
-            return []
+            raise
@@ -1,4 +1,5 @@
 from .swap import SwapProcessor
 from .sync import SyncProcessor
+from .protocol_counters import ProtocolCounters
 
-__all__ = ['SwapProcessor', 'SyncProcessor']
\ No newline at end of file
+__all__ = ['SwapProcessor', 'SyncProcessor', 'ProtocolCounters']
\ No newline at end of file
@@ -1,9 +1,9 @@
 from abc import ABC, abstractmethod
 from web3 import Web3
 from database import DatabaseOperator
+from ...logs.metadata_cache import MetadataCache
+from .protocol_counters import ProtocolCounters, unknown_protocol_key, known_protocol_key
 import logging
-import redis
-from datetime import timedelta
 from typing import Dict
 
 logger = logging.getLogger(__name__)
@@ -13,32 +13,29 @@ class EventProcessor(ABC):
         self.logger = logger
         self.chain = chain
         self.db_operator = db_operator
-        # Initialize Redis connection
-        self.redis_client = redis.Redis(
-            host='localhost',  # Configure as needed
-            port=6379,        # Configure as needed
-            db=0,            
-            decode_responses=True
-        )
+        self.metadata_cache = MetadataCache.shared()
+        # Counters are aggregated in memory and flushed to Redis for every processor and chain
+        self.counters = ProtocolCounters.shared()
+        self.redis_client = self.counters.redis_client
     
     def get_cache_key(self, signature: str) -> str:
         """Generate a cache key for unknown protocols using just the signature"""
-        return f"unknown_protocols:{signature}"
+        return unknown_protocol_key(signature)
 
-    def increment_unknown_protocol(self, signature: str) -> int:
-        """Increment counter for unknown protocol with 24h TTL"""
-        cache_key = self.get_cache_key(signature)
-        pipe = self.redis_client.pipeline()
-        
-        # Increment and set TTL atomically
-        pipe.incr(cache_key)
-        pipe.expire(cache_key, timedelta(days=1))
-        
-        result = pipe.execute()
-        return result[0]  # Return new counter value
+    def increment_unknown_protocol(self, signature: str):
+        """Count an unknown protocol, written to Redis on the next flush"""
+        self.counters.increment_unknown(signature)
+
+    def get_known_protocol_key(self, signature: str) -> str:
+        """Generate a cache key for known protocols"""
+        return known_protocol_key(signature)
+
+    def increment_known_protocol(self, signature: str, contract_address: str):
+        """Count a tracked protocol's contract, written to Redis on the next flush"""
+        self.counters.increment_known(signature, contract_address)
 
     def get_unknown_protocols(self) -> Dict[str, int]:
-        """Get all unknown protocols"""
+        """Get all unknown protocols, as of the last flush"""
         pattern = "unknown_protocols:*"
         keys = self.redis_client.keys(pattern)
         
@@ -58,11 +55,12 @@ class EventProcessor(ABC):
     def shutdown(self):
         """Cleanup method for graceful shutdown"""
         try:
-            self.redis_client.close()
+            # The counters are shared, so only what is pending is written out
+            self.counters.flush()
         except Exception as e:
             self.logger.error(f"Error during shutdown: {e}")
     @abstractmethod
-    def process_event(self, event):
+    async def process_event(self, event, signature, tx_hash, index, timestamp, batch=None):
         pass
     
     def create_protocol_map(self):
@@ -0,0 +1,157 @@
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+import redis
+from config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+def unknown_protocol_key(signature: str) -> str:
+    return f"unknown_protocols:{signature}"
+
+
+def known_protocol_key(signature: str) -> str:
+    return f"known_protocols:{signature}"
+
+
+class ProtocolCounters:
+    """
+    Process-wide counts of unknown protocol signatures, and of the contracts
+    emitting tracked ones, for every processor and chain.
+
+    Increments only touch memory. A background thread writes the deltas
+    gathered since the last flush to Redis every `flush_interval` seconds in
+    one pipeline, refreshing each key's TTL. Deltas from a failed flush are
+    kept for the next one. The Redis client can be passed in, so anything
+    with a redis-py style pipeline stands in for Redis.
+    """
+    _shared = None
+
+    def __init__(self, redis_client: redis.Redis = None, flush_interval: float = None, ttl: int = None):
+        self.redis_client = redis_client or redis.Redis(
+            host=Settings.REDIS_HOST,
+            port=Settings.REDIS_PORT,
+            db=Settings.REDIS_DB,
+            decode_responses=True
+        )
+        self.flush_interval = flush_interval or Settings.PROTOCOL_COUNTER_FLUSH_INTERVAL
+        self.ttl = ttl or Settings.PROTOCOL_COUNTER_TTL
+        self.logger = logger
+
+        self._lock = threading.Lock()
+        self._unknown = Counter()  # signature -> delta
+        self._known = defaultdict(Counter)  # signature -> contract -> delta
+        # Held for a whole flush, so flush() returns only once earlier deltas are in Redis
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        # Metrics
+        self.increments = 0
+        self.flushes = 0
+        self.flushed_keys = 0
+        self.failed_flushes = 0
+        self.flush_time = 0.0
+
+    @classmethod
+    def shared(cls) -> 'ProtocolCounters':
+        """
+        The process-wide instance, shared by every chain's event processors.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def increment_unknown(self, signature: str):
+        """
+        Count an event whose signature no protocol handles.
+        """
+        with self._lock:
+            self._unknown[signature] += 1
+            self.increments += 1
+            self._start()
+
+    def increment_known(self, signature: str, contract_address: str):
+        """
+        Count an event of a tracked signature against the contract that emitted it.
+        """
+        with self._lock:
+            self._known[signature][contract_address] += 1
+            self.increments += 1
+            self._start()
+
+    def flush(self):
+        """
+        Write the deltas gathered so far to Redis in one pipeline.
+        """
+        with self._flush_lock:
+            with self._lock:
+                unknown, self._unknown = self._unknown, Counter()
+                known, self._known = self._known, defaultdict(Counter)
+            if not unknown and not known:
+                return
+
+            started = time.perf_counter()
+            pipe = self.redis_client.pipeline()
+            for signature, delta in unknown.items():
+                key = unknown_protocol_key(signature)
+                pipe.incrby(key, delta)
+                pipe.expire(key, self.ttl)
+            for signature, contracts in known.items():
+                key = known_protocol_key(signature)
+                for contract_address, delta in contracts.items():
+                    pipe.hincrby(key, contract_address, delta)
+                pipe.expire(key, self.ttl)
+            try:
+                pipe.execute()
+            except Exception as e:
+                self.failed_flushes += 1
+                self.logger.error(f"Error flushing protocol counters to Redis: {e}")
+                # Merged back so the counts go out with the next flush
+                with self._lock:
+                    self._unknown.update(unknown)
+                    for signature, contracts in known.items():
+                        self._known[signature].update(contracts)
+                return
+
+            self.flushes += 1
+            self.flushed_keys += len(unknown) + len(known)
+            self.flush_time += time.perf_counter() - started
+
+    def _start(self):
+        """
+        Start the flush thread on first use, called with the lock held.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='protocol-counters', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        """
+        Stop the flush thread and write what is left.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    @property
+    def pending(self) -> int:
+        return len(self._unknown) + sum(len(contracts) for contracts in self._known.values())
+
+    def stats(self) -> dict:
+        """Snapshot of the counters' pending deltas and flushes."""
+        return {
+            "increments": self.increments,
+            "pending": self.pending,
+            "flushes": self.flushes,
+            "flushed_keys": self.flushed_keys,
+            "failed_flushes": self.failed_flushes,
+            "avg_flush_ms": self.flush_time / self.flushes * 1000 if self.flushes else 0.0,
+        }
@@ -0,0 +1,194 @@
+import json
+import logging
+import os
+import re
+from config import Settings
+from .models import ArbitarySwap, BaseTokenSwap, ArbitarySync
+
+logger = logging.getLogger(__name__)
+
+# Layout of the registry file, its own "version" is bumped whenever protocols change
+FORMAT = 1
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'protocols.json')
+
+_TOPIC0 = re.compile(r'^[0-9a-f]{64}$')
+_SWAP_KEYS = {"name", "amount0", "amount1", "direction", "tokens", "ignore", "track"}
+_SYNC_KEYS = {"name", "reserve0", "reserve1", "ignore", "track"}
+
+# Sign conventions: whether amount0 is going into the pool, from one parameter's value
+_DIRECTIONS = {
+    "negative": lambda value: value < 0,
+    "positive": lambda value: value > 0,
+    "flag": lambda value: value,
+}
+
+
+def _ignore(parameters):
+    return None
+
+
+def _check(topic0: str, spec: dict, keys: set):
+    if not _TOPIC0.match(topic0):
+        raise ValueError(f"Protocol registry key {topic0!r} is not a topic0 hash")
+    unknown = spec.keys() - keys
+    if unknown:
+        raise ValueError(f"Protocol {topic0} has unknown fields {sorted(unknown)}")
+
+
+def _amount_fields(topic0: str, spec: dict, role: str) -> tuple:
+    """The parameters an amount is read from when amount0 goes in and when it comes out."""
+    field = spec.get(role)
+    if isinstance(field, str):
+        return field, field
+    if isinstance(field, list) and len(field) == 2:
+        return tuple(field)
+    raise ValueError(f"Protocol {topic0} needs {role} as a parameter name or an [in, out] pair")
+
+
+def compile_swap(topic0: str, spec: dict):
+    """
+    Compile a swap spec into a function building an ArbitarySwap, whose tokens
+    come from the pool, or a BaseTokenSwap when the spec names the token
+    parameters, from an event's decoded parameters.
+
+    Without a direction amount0 is always the amount going in. Amounts given
+    as [in, out] pairs are read from the first parameter when amount0 goes in
+    and from the second otherwise.
+    """
+    _check(topic0, spec, _SWAP_KEYS)
+    if spec.get("ignore"):
+        return _ignore
+
+    amount0_in, amount0_out = _amount_fields(topic0, spec, "amount0")
+    amount1_in, amount1_out = _amount_fields(topic0, spec, "amount1")
+    tokens = spec.get("tokens")
+    if tokens is not None and not (isinstance(tokens, list) and len(tokens) == 2):
+        raise ValueError(f"Protocol {topic0} needs tokens as a [token0, token1] pair")
+    direction = spec.get("direction")
+    if direction is not None:
+        if len(direction) != 1 or next(iter(direction)) not in _DIRECTIONS:
+            raise ValueError(f"Protocol {topic0} needs direction as one of {sorted(_DIRECTIONS)}")
+        (convention, direction_field), = direction.items()
+        is_in = _DIRECTIONS[convention]
+
+    if direction is None and tokens is None:
+        def extract(parameters):
+            return ArbitarySwap(
+                amount0=parameters[amount0_in]["value"],
+                amount1=parameters[amount1_in]["value"],
+                isAmount0In=True
+            )
+    elif direction is None:
+        token0, token1 = tokens
+
+        def extract(parameters):
+            return BaseTokenSwap(
+                amount0=parameters[amount0_in]["value"],
+                amount1=parameters[amount1_in]["value"],
+                isAmount0In=True,
+                token0_address=parameters[token0]["value"],
+                token1_address=parameters[token1]["value"]
+            )
+    elif tokens is None:
+        def extract(parameters):
+            if is_in(parameters[direction_field]["value"]):
+                return ArbitarySwap(
+                    amount0=parameters[amount0_in]["value"],
+                    amount1=parameters[amount1_in]["value"],
+                    isAmount0In=True
+                )
+            return ArbitarySwap(
+                amount0=parameters[amount0_out]["value"],
+                amount1=parameters[amount1_out]["value"],
+                isAmount0In=False
+            )
+    else:
+        token0, token1 = tokens
+
+        def extract(parameters):
+            amount0_is_in = bool(is_in(parameters[direction_field]["value"]))
+            return BaseTokenSwap(
+                amount0=parameters[amount0_in if amount0_is_in else amount0_out]["value"],
+                amount1=parameters[amount1_in if amount0_is_in else amount1_out]["value"],
+                isAmount0In=amount0_is_in,
+                token0_address=parameters[token0]["value"],
+                token1_address=parameters[token1]["value"]
+            )
+    return extract
+
+
+def compile_sync(topic0: str, spec: dict):
+    """
+    Compile a sync spec into a function building an ArbitarySync from an event's decoded parameters.
+    """
+    _check(topic0, spec, _SYNC_KEYS)
+    if spec.get("ignore"):
+        return _ignore
+    reserve0, reserve1 = spec.get("reserve0"), spec.get("reserve1")
+    if not (isinstance(reserve0, str) and isinstance(reserve1, str)):
+        raise ValueError(f"Protocol {topic0} needs reserve0 and reserve1 parameter names")
+
+    def extract(parameters):
+        return ArbitarySync(
+            reserve0=parameters[reserve0]["value"],
+            reserve1=parameters[reserve1]["value"]
+        )
+    return extract
+
+
+class ProtocolRegistry:
+    """
+    Process-wide registry of the swap and sync protocols, by topic0.
+
+    Each protocol is declared in a versioned JSON file (the bundled
+    protocols.json unless Settings.PROTOCOL_REGISTRY points elsewhere) by
+    which parameters hold its amounts, how the direction of a swap is told
+    and where its tokens come from. Every entry is compiled once into an
+    extractor, so supporting a new DEX is a change to the file. Entries
+    marked "track" have their contracts counted in Redis, "ignore" entries
+    are recognised but not recorded.
+    """
+    _shared = None
+    _compilers = {"swap": compile_swap, "sync": compile_sync}
+
+    def __init__(self, path: str = None):
+        self.path = path or Settings.PROTOCOL_REGISTRY or DEFAULT_PATH
+        self.logger = logger
+        with open(self.path) as f:
+            registry = json.load(f)
+        if registry.get("format") != FORMAT:
+            raise ValueError(f"{self.path} has protocol registry format {registry.get('format')}, expected {FORMAT}")
+        self.version = registry.get("version")
+
+        self.specs = {kind: registry.get(kind, {}) for kind in self._compilers}
+        self._extractors = {
+            kind: {topic0: compiler(topic0, spec) for topic0, spec in self.specs[kind].items()}
+            for kind, compiler in self._compilers.items()
+        }
+        counts = ', '.join(f"{len(extractors)} {kind}" for kind, extractors in self._extractors.items())
+        self.logger.info(f"Loaded protocol registry version {self.version} from {self.path}: {counts}")
+
+    @classmethod
+    def shared(cls) -> 'ProtocolRegistry':
+        """
+        The process-wide instance, shared by every chain's event processors.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def extractors(self, kind: str) -> dict:
+        """
+        topic0 -> compiled extractor for one kind of event, 'swap' or 'sync'.
+        """
+        return dict(self._extractors[kind])
+
+    def tracked(self, kind: str) -> set:
+        """
+        The topic0s of one kind of event whose contracts are counted.
+        """
+        return {topic0 for topic0, spec in self.specs[kind].items() if spec.get("track")}
+
+    def name(self, kind: str, topic0: str):
+        spec = self.specs[kind].get(topic0)
+        return spec.get("name") if spec else None
@@ -1,4 +1,8 @@
 from .models import TokenInfo, ContractInfo
 from .log_processor import LogProcessor
+from .metadata_cache import MetadataCache
+from .enrichment_queue import EnrichmentQueue
+from .decode_pool import DecodePool
+from .signature_index import SignatureIndex
 
-__all__ = ['TokenInfo', 'ContractInfo', 'LogProcessor']
\ No newline at end of file
+__all__ = ['TokenInfo', 'ContractInfo', 'LogProcessor', 'MetadataCache', 'SignatureIndex', 'EnrichmentQueue', 'DecodePool']
\ No newline at end of file
@@ -0,0 +1,158 @@
+from .models import EventSignature
+
+# Returned by a word decoder when the word is not in canonical form, the codec then decodes it
+_SLOW = object()
+
+_ADDRESS_PADDING = bytes(12)
+_FALSE_WORD = bytes(32)
+_TRUE_WORD = bytes(31) + b'\x01'
+
+
+def _address(word: bytes):
+    if word[:12] != _ADDRESS_PADDING:
+        return _SLOW
+    # Lower-case hex, as eth_abi returns addresses
+    return '0x' + word[12:].hex()
+
+
+def _uint(bits: int):
+    limit = 1 << bits
+
+    def decode(word: bytes):
+        value = int.from_bytes(word, 'big')
+        # Non-zero padding above the type's width is rejected by the codec
+        return value if value < limit else _SLOW
+    return decode
+
+
+def _int(bits: int):
+    bound = 1 << (bits - 1)
+
+    def decode(word: bytes):
+        value = int.from_bytes(word, 'big', signed=True)
+        return value if -bound <= value < bound else _SLOW
+    return decode
+
+
+def _bool(word: bytes):
+    if word == _FALSE_WORD:
+        return False
+    if word == _TRUE_WORD:
+        return True
+    return _SLOW
+
+
+def _bytes32(word: bytes):
+    return word
+
+
+# Single-word types decoded by slicing instead of going through eth_abi
+WORD_DECODERS = {
+    'address': _address,
+    'bool': _bool,
+    'bytes32': _bytes32,
+    **{f'uint{bits}': _uint(bits) for bits in range(8, 257, 8)},
+    **{f'int{bits}': _int(bits) for bits in range(8, 257, 8)},
+}
+
+
+class DecodePlan:
+    """
+    An EventSignature compiled once into what decoding one of its logs needs:
+    the indexed and non-indexed fields split up front with their names, types,
+    descriptions and word decoders. Logs whose fields are all single-word
+    types are decoded by slicing topics and data, anything else falls back to
+    the codec.
+    """
+    __slots__ = ('event_sig', 'event_name', 'topic0', 'has_inputs', 'indexed', 'data_fields', 'data_types', 'data_decoders', 'data_size', 'abi_codec')
+
+    def __init__(self, event_sig: EventSignature, abi_codec):
+        # Kept so the plan can be rebuilt in another process, the codec does not pickle
+        self.event_sig = event_sig
+        self.event_name = event_sig.event_name
+        # Carried on every decoded log so event processors dispatch without re-hashing the signature
+        self.topic0 = event_sig.signature_hash
+        self.has_inputs = bool(event_sig.input_types)
+        self.abi_codec = abi_codec
+
+        indexed, data_fields = [], []
+        for input_type, is_indexed, name, inputs in zip(
+            event_sig.input_types,
+            event_sig.indexed_inputs,
+            event_sig.input_names,
+            event_sig.inputs
+        ):
+            description = inputs.get("description") or None
+            if is_indexed:
+                indexed.append((name, input_type, description, WORD_DECODERS.get(input_type)))
+            else:
+                data_fields.append((name, input_type, description))
+
+        self.indexed = tuple(indexed)
+        self.data_fields = tuple(data_fields)
+        self.data_types = tuple(input_type for _, input_type, _ in data_fields)
+        decoders = tuple(WORD_DECODERS.get(input_type) for input_type in self.data_types)
+        # None unless every non-indexed field can be read straight from its data word
+        self.data_decoders = decoders if all(decoders) else None
+        self.data_size = 32 * len(decoders)
+
+    def decode(self, log: dict) -> dict:
+        try:
+            topics = log.get("topics", [])
+            if len(topics) < 1:
+                return {"event": "Unknown", "raw_log": log}
+
+            # Fast path for no parameters
+            if not self.has_inputs:
+                return {"event": self.event_name, "topic0": self.topic0}
+
+            parameters = {}
+            result = {"event": self.event_name, "topic0": self.topic0, "parameters": parameters}
+
+            for (name, input_type, description, decoder), topic in zip(self.indexed, topics[1:]):
+                if input_type in ("bytes", "string"):
+                    # Dynamic values are hashed into the topic
+                    value = topic.hex()
+                else:
+                    word = bytes(topic)
+                    value = decoder(word) if decoder else _SLOW
+                    if value is _SLOW:
+                        try:
+                            value = self.abi_codec.decode([input_type], word)[0]
+                        except Exception as e:
+                            value = f"DecodeError: {str(e)}"
+                parameters[name] = {
+                    "value": value,
+                    "type": input_type,
+                    "indexed": True,
+                    "description": description
+                }
+
+            if self.data_fields:
+                try:
+                    for (name, input_type, description), value in zip(self.data_fields, self._decode_data(bytes(log.get("data", b"")))):
+                        parameters[name] = {
+                            "value": value,
+                            "type": input_type,
+                            "indexed": False,
+                            "description": description
+                        }
+                except Exception as e:
+                    result["data_decode_error"] = str(e)
+
+            return result
+
+        except Exception as e:
+            return {
+                "event": self.event_name,
+                "decode_error": str(e),
+                "raw_log": log
+            }
+
+    def _decode_data(self, data: bytes):
+        decoders = self.data_decoders
+        if decoders is not None and len(data) >= self.data_size:
+            values = [decoder(data[offset:offset + 32]) for offset, decoder in zip(range(0, self.data_size, 32), decoders)]
+            if _SLOW not in values:
+                return values
+        return self.abi_codec.decode(self.data_types, data)
@@ -0,0 +1,152 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from eth_abi.codec import ABICodec
+from eth_abi.registry import registry
+from config import Settings
+from .decode_plan import DecodePlan
+
+logger = logging.getLogger(__name__)
+
+# Worker process state, plans are compiled on first use and kept for the life of the worker
+_worker_codec = None
+_worker_plans = {}
+
+
+def _plan_key(event_sig) -> tuple:
+    return event_sig.signature_hash, sum(bool(indexed) for indexed in event_sig.indexed_inputs)
+
+
+def _decode_chunk(signatures: dict, logs: list) -> list:
+    """
+    Worker entry point. Decodes (log, plan key) pairs against the event
+    signatures shipped with the chunk, compiling the ones this worker has not
+    seen yet.
+    """
+    global _worker_codec
+    if _worker_codec is None:
+        _worker_codec = ABICodec(registry)
+    results = []
+    for log, key in logs:
+        plan = _worker_plans.get(key)
+        if plan is None:
+            plan = _worker_plans[key] = DecodePlan(signatures[key], _worker_codec)
+        decoded_log = plan.decode(log)
+        decoded_log["log_index"] = log.get("logIndex")
+        results.append(decoded_log)
+    return results
+
+
+class DecodePool:
+    """
+    Optional decode stage running DecodePlans in worker processes.
+
+    Decoding is pure CPU work, so in the event loop a large block holds up
+    every chain in the process. With `workers` > 0 logs whose event is
+    already compiled are sent to a process pool in chunks, along with the
+    signatures the chunk needs, and decoded in parallel. Blocks smaller than
+    `min_logs` are decoded in the event loop, where they cost less than the
+    round-trip to a worker.
+    """
+    _shared = None
+
+    def __init__(self, workers: int = None, chunk_size: int = None, min_logs: int = None):
+        self.workers = workers if workers is not None else Settings.DECODE_WORKERS
+        self.chunk_size = chunk_size or Settings.DECODE_CHUNK_SIZE
+        self.min_logs = min_logs if min_logs is not None else Settings.DECODE_POOL_MIN_LOGS
+        self.logger = logger
+        self._executor = None
+
+        self.chunks = 0
+        self.pooled_logs = 0
+        self.inline_logs = 0
+        self.failures = 0
+        self.pool_time = 0.0
+
+    @classmethod
+    def shared(cls) -> 'DecodePool':
+        """
+        The process-wide pool, shared by every chain's log processor.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Spawned, not forked, the parent runs an event loop and connection pool threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._executor
+
+    async def decode(self, items: list) -> list:
+        """
+        Decode (log, plan) pairs, returning the decoded logs in the same order.
+        """
+        if not self.enabled or len(items) < self.min_logs:
+            self.inline_logs += len(items)
+            return self._decode_inline(items)
+
+        started = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        futures = []
+        for start in range(0, len(items), self.chunk_size):
+            chunk = items[start:start + self.chunk_size]
+            signatures, logs = {}, []
+            for log, plan in chunk:
+                key = _plan_key(plan.event_sig)
+                signatures[key] = plan.event_sig
+                logs.append((log, key))
+            futures.append(loop.run_in_executor(executor, _decode_chunk, signatures, logs))
+        try:
+            chunks = await asyncio.gather(*futures)
+        except Exception as e:
+            # A broken pool is replaced on the next call, this block is decoded here
+            self.failures += 1
+            self.logger.error(f"Decode pool failed, decoding {len(items)} logs in the event loop: {e}")
+            self._shutdown()
+            self.inline_logs += len(items)
+            return self._decode_inline(items)
+
+        self.chunks += len(futures)
+        self.pooled_logs += len(items)
+        self.pool_time += time.perf_counter() - started
+        return [decoded_log for chunk in chunks for decoded_log in chunk]
+
+    @staticmethod
+    def _decode_inline(items: list) -> list:
+        results = []
+        for log, plan in items:
+            decoded_log = plan.decode(log)
+            decoded_log["log_index"] = log.get("logIndex")
+            results.append(decoded_log)
+        return results
+
+    def _shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def close(self):
+        """Stop the worker processes, the next pooled decode starts new ones."""
+        self._shutdown()
+
+    def stats(self) -> dict:
+        """Snapshot of the pool's counters."""
+        return {
+            "workers": self.workers,
+            "chunks": self.chunks,
+            "pooled_logs": self.pooled_logs,
+            "inline_logs": self.inline_logs,
+            "failures": self.failures,
+            "pooled_logs_per_sec": self.pooled_logs / self.pool_time if self.pool_time else 0.0,
+        }
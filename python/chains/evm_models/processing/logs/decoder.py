@@ -3,11 +3,8 @@ from operator import itemgetter
 import logging
 from eth_abi.codec import ABICodec
 from eth_abi.registry import registry
-from database import DatabaseOperator
-from datetime import datetime
-import threading
-import time
-from .cache import BoundedCache
+from database import DatabaseOperator, run_sql
+from .signature_index import SignatureIndex
 from .models import EventSignature
 
 get_name = itemgetter("name")
@@ -23,40 +20,26 @@ class EVMDecoder:
         self.logger = logging.getLogger(__name__)
         self.abi_codec = ABICodec(registry)
         self.network = chain
-        self._event_signature_cache = BoundedCache(max_size=1000, ttl_hours=24)
-        self._start_cleanup_thread()
+        self.signatures = SignatureIndex.shared()
     
     
-    # We already check if there is an event signature, so we can decode the log
-    def decode_log(self, log, abi):
+    async def decode_log(self, log, abi=None):
         try:
-            # Get the event signature from log
-            event_signature = get_topics(log)[0].hex()
+            topics = get_topics(log)
             
-            # Try to get the event from cache first
-            event_object = self._event_signature_cache.get(event_signature)
+            # Signatures seen on any chain decode straight from the shared index
+            plan = self.signatures.lookup(topics)
             
-            # If not in cache, try to get from DB
-            if event_object is None:
-                event_object = self.db_operator.sql.query.evm.event_by_chain(self.network, event_signature)
-                # If found in DB, add to cache
-                if event_object:
-                    self._event_signature_cache.set(event_signature, event_object)
-                # If not in DB, search ABI and add to both DB and cache
-                else:
-                    # Search for matching event in ABI
-                    for event in (e for e in abi if e["type"] == "event"):
-                        new_sig = self.get_event_signature(event)
-                        if new_sig.signature_hash == event_signature:
-                            event_object = new_sig
-                            self.db_operator.sql.insert.evm.event(self.network, event_object)
-                            self._event_signature_cache.set(event_signature, event_object)
-                            break
+            # Otherwise resolve the event from the DB or the contract ABI
+            if plan is None:
+                if abi is None:
+                    return None
+                plan = await self._plan_from_abi(topics, abi)
             
             log_index = get_log_index(log)
             
-            if event_object:
-                decoded_log = self._decode_log(log, event_object)
+            if plan is not None:
+                decoded_log = plan.decode(log)
             else:
                 decoded_log = self.decode_log_without_abi(log)
             decoded_log["log_index"] = log_index
@@ -66,94 +49,31 @@ class EVMDecoder:
         except Exception as e:
             self.logger.error(f"Error decoding log for {self.network}: {e}", exc_info=True)
             return None
-    
-    def _decode_log(self, log: dict, event_sig: EventSignature) -> dict:
-        try:
-            topics = log.get("topics", [])
-            if len(topics) < 1:
-                return {"event": "Unknown", "raw_log": log}
 
-            # Fast path for no parameters
-            if not event_sig.input_types:
-                return {"event": event_sig.event_name}
-
-            topics = topics[1:]  # Skip first topic (event signature)
-            data = log.get("data", "0x")
-            
-            result = {"event": event_sig.event_name,
-                      "parameters": {}
-                      }
-            
-            input_names = event_sig.input_names
-            input_descriptions = [i.get("description", "") for i in event_sig.inputs]
-            
-             # Process indexed parameters
-            topic_index = 0
-            for i, (input_type, is_indexed, input_name, description) in enumerate(zip(
-                event_sig.input_types, 
-                event_sig.indexed_inputs,
-                input_names,
-                input_descriptions
-            )):
-                if not is_indexed:
-                    continue
-                    
-                if topic_index >= len(topics):
+    async def _plan_from_abi(self, topics, abi):
+        """Find the log's event in the DB or the ABI and add it to the signature index"""
+        event_signature = topics[0].hex()
+        
+        event_object = await run_sql(self.db_operator.sql.query.evm.event_by_chain, self.network, event_signature)
+        # A stored event with a different indexed count is another variant of the same topic0
+        if event_object and sum(bool(indexed) for indexed in event_object.indexed_inputs) != len(topics) - 1:
+            event_object = None
+        # If not in DB, search ABI and add to DB
+        if not event_object:
+            for event in (e for e in abi if e["type"] == "event"):
+                new_sig = self.get_event_signature(event)
+                if new_sig.signature_hash == event_signature:
+                    event_object = new_sig
+                    await run_sql(self.db_operator.sql.insert.evm.event, self.network, event_object)
                     break
-                    
-                topic = topics[topic_index]
-                topic_index += 1
-                
-                if input_type in ["bytes", "string"]:
-                    value = topic.hex()
-                else:
-                    try:
-                        value = self.abi_codec.decode(
-                            [input_type], 
-                            bytes.fromhex(topic.hex())
-                        )[0]
-                    except Exception as e:
-                        value = f"DecodeError: {str(e)}"
-                
-                result["parameters"][input_name] = {
-                    "value": value,
-                    "type": input_type,
-                    "indexed": True,
-                    "description": description if description else None
-                }
-
-            # Process non-indexed parameters
-            if data != "0x":
-                non_indexed_info = [
-                    (t, name, desc) 
-                    for t, idx, name, desc in zip(event_sig.input_types, event_sig.indexed_inputs, input_names, input_descriptions)
-                    if not idx
-                ]
-                try:
-                    values = self.abi_codec.decode(
-                        [t for t, _, _ in non_indexed_info],
-                        bytes.fromhex(data.hex())
-                    )
-                    for (input_type, name, description), value in zip(non_indexed_info, values):
-                        result["parameters"][name] = {
-                            "value": value,
-                            "type": input_type,
-                            "indexed": False,
-                            "description": description if description else None
-                        }
-                except Exception as e:
-                    result["data_decode_error"] = str(e)
-
-            return result
-
-        except Exception as e:
-            return {
-                "event": event_sig.name,
-                "decode_error": str(e),
-                "raw_log": log
-            }
+        
+        # Compile the event once, later logs with the signature decode from the index
+        if event_object:
+            return self.signatures.add(event_object)
+        return None
     
-    def get_event_signature(self, event_abi: dict) -> EventSignature:
+    @staticmethod
+    def get_event_signature(event_abi: dict) -> EventSignature:
         name = event_abi["name"]
         inputs = event_abi["inputs"]
         input_types = [i["type"] for i in inputs]
@@ -207,32 +127,3 @@ class EVMDecoder:
                     "decode_error": str(e),
                     "raw_log": log
                 }
-
-    def cleanup_cache(self):
-        """Periodic cleanup of expired cache entries"""
-        try:
-            current_time = datetime.now()
-            expired_keys = [
-                key for key, (_, timestamp) in self._event_signature_cache.cache.items()
-                if current_time - timestamp > self._event_signature_cache.ttl
-            ]
-            for key in expired_keys:
-                del self._event_signature_cache.cache[key]
-        except Exception as e:
-            self.logger.error(f"Cache cleanup error: {e}", exc_info=True)
-
-    def _start_cleanup_thread(self):
-        """Start a background thread for cache cleanup"""
-        def cleanup_loop():
-            while True:
-                try:
-                    time.sleep(3600)  # Run every hour
-                    self.cleanup_cache()
-                except Exception as e:
-                    self.logger.error(f"Cache cleanup thread error: {e}", exc_info=True)
-
-        cleanup_thread = threading.Thread(target=cleanup_loop, daemon=True)
-        cleanup_thread.start()
-
-
-
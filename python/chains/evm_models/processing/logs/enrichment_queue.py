@@ -0,0 +1,174 @@
+import asyncio
+import logging
+from config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+class EnrichmentQueue:
+    """
+    Bounded queue of newly discovered contracts waiting for their pool and
+    token metadata, drained by a fixed set of background workers.
+
+    Submitting never waits, so block decoding is not held up by a wave of new
+    pools: a contract already queued, in progress or waiting on a retry is
+    ignored, and when the queue is full the contract is dropped and counted.
+    Each worker takes up to `batch_size` contracts at a time and enriches them
+    concurrently, so their eth_calls share RPC batch round-trips. A failed
+    contract is queued again after a backoff that doubles with each attempt.
+    """
+    def __init__(self, chain: str, enrich, workers: int = None, max_size: int = None, batch_size: int = None,
+                 max_retries: int = None, retry_backoff: float = None):
+        self.chain = chain
+        self.enrich = enrich  # Coroutine function taking (address, abi), raises to have the contract retried
+        self.workers = workers or Settings.ENRICHMENT_WORKERS
+        self.max_size = max_size or Settings.ENRICHMENT_QUEUE_SIZE
+        self.batch_size = batch_size or Settings.ENRICHMENT_BATCH_SIZE
+        self.max_retries = max_retries if max_retries is not None else Settings.ENRICHMENT_MAX_RETRIES
+        self.retry_backoff = retry_backoff or Settings.ENRICHMENT_RETRY_BACKOFF
+        self.logger = logger
+
+        self._queue = None
+        self._workers = []
+        # (chain, address) of every contract queued, in progress or waiting on a retry
+        self._pending = set()
+        self._attempts = {}
+        self._retry_timers = {}  # (chain, address) -> TimerHandle requeueing it after its backoff
+        self._in_progress = 0
+        self._idle = None
+
+        # Metrics
+        self.submitted = 0
+        self.deduplicated = 0
+        self.dropped = 0
+        self.enriched = 0
+        self.retried = 0
+        self.failed = 0
+        self.max_backlog_seen = 0
+
+    @property
+    def backlog(self) -> int:
+        """Contracts accepted but not yet enriched, including those waiting on a retry."""
+        return len(self._pending)
+
+    def submit(self, address: str, abi) -> bool:
+        """
+        Queue a contract for enrichment without waiting. Returns False if it was
+        already pending or the queue is full.
+        """
+        key = (self.chain, address)
+        if key in self._pending:
+            self.deduplicated += 1
+            return False
+        self._start()
+        if not self._put(key, abi):
+            return False
+        self._pending.add(key)
+        self._idle.clear()
+        self.submitted += 1
+        self.max_backlog_seen = max(self.max_backlog_seen, len(self._pending))
+        return True
+
+    async def drain(self):
+        """Wait until every accepted contract has been enriched or has failed."""
+        if self._idle is not None:
+            await self._idle.wait()
+
+    async def close(self):
+        """Stop the workers and pending retries, contracts still queued are abandoned."""
+        for timer in self._retry_timers.values():
+            timer.cancel()
+        self._retry_timers.clear()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+                self._queue.task_done()
+            self._idle.set()
+        self._pending.clear()
+        self._attempts.clear()
+        self._in_progress = 0
+
+    def _start(self):
+        """
+        Lazily create the queue and workers, they have to be created inside the running loop.
+        """
+        if self._workers:
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_size)
+            self._idle = asyncio.Event()
+            self._idle.set()
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    def _put(self, key, abi) -> bool:
+        try:
+            self._queue.put_nowait((key, abi))
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped % 100 == 1:
+                self.logger.warning(f"{self.chain} enrichment queue full, {self.dropped} contracts dropped so far")
+            return False
+
+    async def _work(self):
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            self._in_progress += len(batch)
+            results = await asyncio.gather(
+                *(self.enrich(key[1], abi) for key, abi in batch),
+                return_exceptions=True
+            )
+            self._in_progress -= len(batch)
+            for (key, abi), result in zip(batch, results):
+                self._queue.task_done()
+                if isinstance(result, BaseException):
+                    self._retry(key, abi, result)
+                else:
+                    self.enriched += 1
+                    self._finish(key)
+
+    def _retry(self, key, abi, error: BaseException):
+        attempts = self._attempts.get(key, 0) + 1
+        if attempts > self.max_retries:
+            self.failed += 1
+            self.logger.error(f"Giving up enriching {key[1]} on {self.chain} after {attempts} attempts: {error}")
+            self._finish(key)
+            return
+        self._attempts[key] = attempts
+        self.retried += 1
+        self.logger.debug(f"Retrying enrichment of {key[1]} on {self.chain} (attempt {attempts}): {error}")
+        delay = self.retry_backoff * 2 ** (attempts - 1)
+        self._retry_timers[key] = asyncio.get_running_loop().call_later(delay, self._requeue, key, abi)
+
+    def _requeue(self, key, abi):
+        self._retry_timers.pop(key, None)
+        if not self._put(key, abi):
+            self._finish(key)
+
+    def _finish(self, key):
+        self._pending.discard(key)
+        self._attempts.pop(key, None)
+        if not self._pending:
+            self._idle.set()
+
+    def stats(self) -> dict:
+        """Snapshot of the queue gauges and counters."""
+        return {
+            "network": self.chain,
+            "backlog": self.backlog,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "in_progress": self._in_progress,
+            "max_backlog_seen": self.max_backlog_seen,
+            "submitted": self.submitted,
+            "deduplicated": self.deduplicated,
+            "dropped": self.dropped,
+            "enriched": self.enriched,
+            "retried": self.retried,
+            "failed": self.failed,
+        }
@@ -4,10 +4,13 @@ import logging
 from operator import itemgetter
 from web3 import Web3
 from ....utils import normalize_hex
-from .cache import BoundedCache
+from ...cache import LRUCache
+from .metadata_cache import MetadataCache
+from .enrichment_queue import EnrichmentQueue
+from .decode_pool import DecodePool
 from .decoder import EVMDecoder
 import json
-from database import DatabaseOperator
+from database import DatabaseOperator, run_sql
 from .models import ContractInfo, TokenInfo
 from ...utils import ERC20_ABI
 
@@ -28,7 +31,13 @@ class LogProcessor:
         self.decoder = EVMDecoder(self.db_operator, self.chain)
         
         # Initialize cache
-        self.abi_cache = BoundedCache(max_size=1000, ttl_hours=24)
+        self.abi_cache = LRUCache(max_size=1000, ttl=86400)
+        self.metadata_cache = MetadataCache.shared()
+        self._abi_fetches = {}
+
+        # New pools are enriched in the background, off the decoding path
+        self.enrichment = EnrichmentQueue(self.chain, self._enrich_contract)
+        self.decode_pool = DecodePool.shared()
 
     async def process(self, block_number: int, timestamp: int, logs: list):
         """Process logs for a given block"""
@@ -36,33 +45,45 @@ class LogProcessor:
             if not logs:
                 return {}
             
-            # Pre-fetch all unique contract addresses
-            addresses = {log['address'] for log in logs if log.get('address')}
+            # Find the contracts with a log the signature index cannot decode
+            needs_abi = defaultdict(bool)
+            for log in logs:
+                address = log.get('address')
+                if address:
+                    topics = log.get('topics')
+                    needs_abi[address] |= not (topics and self.decoder.signatures.knows(topics))
             
-            # Bulk load ABIs concurrently
+            # Only those ABIs are waited for. The others are still fetched in the
+            # background, since fetching an ABI also records the contract's pool info
             abi_tasks = []
-            for addr in addresses:
-                if self.abi_cache.get(addr) is None:
-                    abi_tasks.append(self._fetch_and_cache_abi(addr))
+            for address, blocking in needs_abi.items():
+                if self.abi_cache.get(address) is None:
+                    task = self._fetch_abi_once(address)
+                    if blocking:
+                        abi_tasks.append(task)
             if abi_tasks:
                 await asyncio.gather(*abi_tasks)
             
-            # Process in parallel with pre-loaded data
-            batches = [logs[i:i + self.batch_size] for i in range(0, len(logs), self.batch_size)]
-            
-            # Create tasks for each batch
-            tasks = [self._process_logs_batch(batch, timestamp) for batch in batches]
-            batch_results = await asyncio.gather(*tasks)
-            
-            # Combine results
-            decoder_logs = defaultdict(list)
-            for batch_result in batch_results:
-                for tx_hash, decoded_logs in batch_result.items():
-                    decoder_logs[tx_hash].extend(decoded_logs)
+            if self.decode_pool.enabled and len(logs) >= self.decode_pool.min_logs:
+                decoder_logs = await self._decode_logs_in_pool(logs)
+            else:
+                # Process in parallel with pre-loaded data
+                batches = [logs[i:i + self.batch_size] for i in range(0, len(logs), self.batch_size)]
+                
+                # Create tasks for each batch
+                tasks = [self._process_logs_batch(batch, timestamp) for batch in batches]
+                batch_results = await asyncio.gather(*tasks)
+                
+                # Combine results
+                decoder_logs = defaultdict(list)
+                for batch_result in batch_results:
+                    for tx_hash, decoded_logs in batch_result.items():
+                        decoder_logs[tx_hash].extend(decoded_logs)
             
-            # Bulk insert into MongoDB
+            # Bulk insert into MongoDB, encoding runs in a worker thread
             if decoder_logs:
-                self.db_operator.mongodb.insert.insert_evm_transactions(
+                await asyncio.to_thread(
+                    self.db_operator.mongodb.insert.insert_evm_transactions,
                     dict(decoder_logs),
                     self.chain,
                     block_number,
@@ -75,12 +96,58 @@ class LogProcessor:
             self.logger.error(f"Error processing logs for block {block_number}: {e}")
             raise
 
+    def _fetch_abi_once(self, address) -> asyncio.Task:
+        """Fetch an ABI, sharing the fetch with any block already waiting on it"""
+        task = self._abi_fetches.get(address)
+        if task is None:
+            task = asyncio.create_task(self._fetch_and_cache_abi(address))
+            self._abi_fetches[address] = task
+            task.add_done_callback(lambda done: self._abi_fetch_done(address, done))
+        return task
+
+    def _abi_fetch_done(self, address, task: asyncio.Task):
+        self._abi_fetches.pop(address, None)
+        # Background fetches have no awaiter, so failures are logged here
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error(f"Error fetching ABI for {address}: {task.exception()}")
+
     async def _fetch_and_cache_abi(self, address):
         """Fetch and cache ABI for a contract address"""
         abi = await self.get_contract_abi(address)
         if abi:
             self.abi_cache.set(address, abi)
 
+    async def _decode_logs_in_pool(self, logs: list):
+        """Decode logs with an indexed event in the decode pool, the rest in the event loop"""
+        pooled, pooled_at, local_at = [], [], []
+        for i, log in enumerate(logs):
+            topics = log.get('topics')
+            if log.get('address') and topics and self.decoder.signatures.knows(topics):
+                pooled.append((log, self.decoder.signatures.lookup(topics)))
+                pooled_at.append(i)
+            else:
+                local_at.append(i)
+
+        pooled_results, local_results = await asyncio.gather(
+            self.decode_pool.decode(pooled),
+            asyncio.gather(*(self._process_single_log(logs[i]) for i in local_at))
+        )
+
+        # Put the results back in log order before grouping by transaction
+        results = [None] * len(logs)
+        for i, decoded_log in zip(pooled_at, pooled_results):
+            decoded_log['contract'] = get_address(logs[i])
+            results[i] = normalize_hex(get_transaction_hash(logs[i])), decoded_log
+        for i, log_result in zip(local_at, local_results):
+            results[i] = log_result
+
+        decoder_logs = defaultdict(list)
+        for log_result in results:
+            if log_result:
+                tx_hash, decoded_log = log_result
+                decoder_logs[tx_hash].append(decoded_log)
+        return decoder_logs
+
     async def _process_logs_batch(self, log_chunk: list, timestamp: int):
         """Process a batch of logs concurrently"""
         decoded_logs = defaultdict(list)
@@ -106,12 +173,12 @@ class LogProcessor:
             if not address or not log.get('topics'):
                 return None
             
+            # Known signatures decode without the ABI
             abi = self.abi_cache.get(address)
-            if abi is not None:
-                decoded_log = self.decoder.decode_log(log, abi)
-                if decoded_log:
-                    decoded_log['contract'] = address
-                    return tx_hash, decoded_log
+            decoded_log = await self.decoder.decode_log(log, abi)
+            if decoded_log:
+                decoded_log['contract'] = address
+                return tx_hash, decoded_log
                     
         except Exception as e:
             self.logger.error(f"Error processing log: {e}")
@@ -134,7 +201,7 @@ class LogProcessor:
         address = Web3.to_checksum_address(address)
         
         # First try to get ABI from DB
-        result = self.db_operator.sql.query.evm.query_contract_abi(self.chain, address)
+        result = await run_sql(self.db_operator.sql.query.evm.query_contract_abi, self.chain, address)
         if result:
             abi = json.loads(result.get('abi'))
             return abi
@@ -144,10 +211,11 @@ class LogProcessor:
         
         if abi:
             # Store it in DB first
-            self.db_operator.sql.insert.evm.contract_abi(self.chain, address, abi)
+            await run_sql(self.db_operator.sql.insert.evm.contract_abi, self.chain, address, abi)
             
-            # Schedule the contract processing asynchronously
-            asyncio.create_task(self._process_contract(address, abi))
+            # Only contracts that look like pools are worth the calls
+            if 'factory' in self._function_names(abi):
+                self.enrichment.submit(address, abi)
             
         return abi
 
@@ -157,68 +225,87 @@ class LogProcessor:
     
     async def _process_contract(self, address, abi, update=False):
         try:
-            address = Web3.to_checksum_address(address)
-            # Check if contract info is already in DB
-            contract_info = self.db_operator.sql.query.evm.swap_info_by_chain(self.chain, address)
-            if contract_info and not update:
-                return contract_info
-            
-            if type(abi) == str:
-                abi = json.loads(abi)
-            contract = self.querier.get_contract(address, abi)
-            
-            if not contract:
-                return None
-            # Get the factory of the contract
-            factory = contract.functions.factory().call(),
-            
-            self.db_operator.sql.insert.evm.contract_to_factory(self.chain, address, factory)
-            
-            swap_methods = ['token0', 'token1', 'factory']
-            for method in swap_methods:
-                if not hasattr(contract.functions, method):
-                    return None
-            
-            # Get the token0 and token1 addresses
-            token0_address = contract.functions.token0().call()
-            token1_address = contract.functions.token1().call()
-            
-            # Get the token0 and token1 info
-            token0_info = await self._process_token(token0_address, update=update)
-            token1_info = await self._process_token(token1_address, update=update)
-            
-            if not token0_info or not token1_info:
-                return None
-            
-            # Try to get fee from contract, not crucial so continue if it fails
-            try:
-                fee = contract.functions.fee().call()
-            except Exception as e:
-                fee = None
-            
-            # Create contract info after obtaining all necessary info
-            contract_info = ContractInfo(
-                address=address,
-                factory=factory,
-                fee=fee,
-                token0_name=token0_info.name,
-                token1_name=token1_info.name,
-                token0_symbol=token0_info.symbol,
-                token1_symbol=token1_info.symbol,
-                token0_decimals=token0_info.decimals,
-                token1_decimals=token1_info.decimals,
-                token0_address=token0_info.address,
-                token1_address=token1_info.address,
-                name=None # Exchange/Factory contract name
-            )
-
-            # Insert contract info into DB
-            self.db_operator.sql.insert.evm.swap_info(self.chain, contract_info)
-            
-            return contract_info
+            return await self._enrich_contract(address, abi, update)
         except Exception as e:
-            self.logger.error(f"Error processing contract {contract}: {e}")
+            self.logger.error(f"Error processing contract {address}: {e}")
             return None
+
+    @staticmethod
+    def _function_names(abi) -> set:
+        if type(abi) == str:
+            abi = json.loads(abi)
+        return {entry.get('name') for entry in abi if entry.get('type') == 'function'}
+
+    async def _enrich_contract(self, address, abi, update=False):
+        """
+        Record a contract's factory and, for pools, its token pair. Returns None for
+        contracts that are not pools, and raises when a call failed so it can be retried.
+        """
+        address = Web3.to_checksum_address(address)
+        # Check if contract info is already in DB
+        contract_info = await run_sql(self.db_operator.sql.query.evm.swap_info_by_chain, self.chain, address)
+        if contract_info and not update:
+            return contract_info
+
+        if type(abi) == str:
+            abi = json.loads(abi)
+
+        function_names = self._function_names(abi)
+        if 'factory' not in function_names:
+            raise ValueError(f"Function factory not found in ABI for {address}")
+
+        # Get the factory, token addresses and fee in a single multicall.
+        # Fee is not crucial so it's allowed to come back empty
+        factory, token0_address, token1_address, fee = await self.querier.call_functions([
+            (address, abi, 'factory', ()),
+            (address, abi, 'token0', ()),
+            (address, abi, 'token1', ()),
+            (address, abi, 'fee', ()),
+        ])
+        if factory is None:
+            raise ValueError(f"Failed to call factory for {address}")
+
+        await run_sql(self.db_operator.sql.insert.evm.contract_to_factory, self.chain, address, factory)
+
+        swap_methods = ['token0', 'token1', 'factory']
+        for method in swap_methods:
+            if method not in function_names:
+                return None
+        if token0_address is None or token1_address is None:
+            raise ValueError(f"Failed to call token0 and token1 for {address}")
+
+        # Get the token0 and token1 info, concurrent calls share a batch round-trip
+        token0_info, token1_info = await asyncio.gather(
+            self._process_token(token0_address, update=update),
+            self._process_token(token1_address, update=update)
+        )
+
+        if not token0_info or not token1_info:
+            raise ValueError(f"Failed to get token info for {address}")
+
+        # Create contract info after obtaining all necessary info
+        contract_info = ContractInfo(
+            address=address,
+            factory=factory,
+            fee=fee,
+            token0_name=token0_info.name,
+            token1_name=token1_info.name,
+            token0_symbol=token0_info.symbol,
+            token1_symbol=token1_info.symbol,
+            token0_decimals=token0_info.decimals,
+            token1_decimals=token1_info.decimals,
+            token0_address=token0_info.address,
+            token1_address=token1_info.address,
+            name=None # Exchange/Factory contract name
+        )
+
+        # Insert contract info into DB, then replace any stale or negative cache entry
+        if await run_sql(self.db_operator.sql.insert.evm.swap_info, self.chain, contract_info):
+            self.metadata_cache.put_contract(self.chain, contract_info)
+        else:
+            self.metadata_cache.invalidate(self.chain, address)
+        
+        return contract_info
     
     async def _process_token(self, contract_address, update=False):
         try:
@@ -226,22 +313,29 @@ class LogProcessor:
             contract_address = Web3.to_checksum_address(contract_address)
             
             # Check the database for the token info
-            token_info = self.db_operator.sql.query.evm.token_info_by_chain(self.chain, contract_address)
+            token_info = await run_sql(self.db_operator.sql.query.evm.token_info_by_chain, self.chain, contract_address)
             if token_info and not update:
                 return token_info
             
-            # If not found, get it from the contract address
-            token_contract = self.querier.get_contract(contract_address, ERC20_ABI)
-            
+            # If not found, get it from the contract address in one multicall
+            name, symbol, decimals = await self.querier.call_functions([
+                (contract_address, ERC20_ABI, 'name', ()),
+                (contract_address, ERC20_ABI, 'symbol', ()),
+                (contract_address, ERC20_ABI, 'decimals', ()),
+            ])
+            if name is None or symbol is None or decimals is None:
+                raise ValueError("Token metadata calls failed")
+
             # Package it nicely into a TokenInfo object
             token_info = TokenInfo(
                 address=contract_address,
-                name=token_contract.functions.name().call(),
-                symbol=token_contract.functions.symbol().call(),
-                decimals=token_contract.functions.decimals().call()
+                name=name,
+                symbol=symbol,
+                decimals=decimals
             )
             # Insert or update the token info into the database
-            self.db_operator.sql.insert.evm.token_info(self.chain, token_info)
+            if await run_sql(self.db_operator.sql.insert.evm.token_info, self.chain, token_info):
+                self.metadata_cache.put_token(self.chain, token_info)
             
             return token_info
         except Exception as e:
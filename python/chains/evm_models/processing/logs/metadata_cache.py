@@ -0,0 +1,145 @@
+import logging
+from database import DatabaseOperator, run_sql
+from config.settings import Settings
+from ...cache import LRUCache
+from .models import ContractInfo, TokenInfo
+
+logger = logging.getLogger(__name__)
+
+# Stored for addresses the database has no row for, so unknown pools are not re-queried per event
+_MISSING = object()
+_ABSENT = object()
+
+
+class MetadataCache:
+    """
+    Process-wide LRU of pool ContractInfo and TokenInfo keyed by (chain, address).
+
+    Swap and sync processing looks up the same few thousand pools on every
+    event, so lookups are served from memory and only misses reach SQL.
+    Unknown addresses are cached negatively for a short TTL since the
+    contract may be processed and written shortly after.
+    """
+    _shared = None
+
+    def __init__(self, max_size: int = Settings.METADATA_CACHE_SIZE, negative_ttl: float = Settings.METADATA_NEGATIVE_TTL):
+        self.negative_ttl = negative_ttl
+        self.contracts = LRUCache(max_size=max_size)
+        self.tokens = LRUCache(max_size=max_size)
+        self.logger = logger
+        self.negative_hits = 0
+        self._warmed = set()
+
+    @classmethod
+    def shared(cls) -> 'MetadataCache':
+        """
+        The process-wide instance, shared by every chain's processors.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def _get(self, cache: LRUCache, key):
+        """
+        Return (found, value) for a key, value is None for a cached unknown address.
+        """
+        value = cache.get(key, _ABSENT)
+        if value is _ABSENT:
+            return False, None
+        if value is _MISSING:
+            self.negative_hits += 1
+            return True, None
+        return True, value
+
+    def _set(self, cache: LRUCache, key, value):
+        if value is None:
+            cache.set(key, _MISSING, ttl=self.negative_ttl)
+        else:
+            cache.set(key, value)
+
+    async def contract_info(self, db_operator: DatabaseOperator, chain: str, address: str):
+        """
+        Get the pool info for a contract, querying the database on a miss.
+        """
+        found, value = self._get(self.contracts, (chain, address))
+        if found:
+            return value
+        value = await run_sql(db_operator.sql.query.evm.swap_info_by_chain, chain, address)
+        self._set(self.contracts, (chain, address), value)
+        return value
+
+    async def token_info(self, db_operator: DatabaseOperator, chain: str, address: str):
+        """
+        Get the token info for an address, querying the database on a miss.
+        """
+        found, value = self._get(self.tokens, (chain, address))
+        if found:
+            return value
+        value = await run_sql(db_operator.sql.query.evm.token_info_by_chain, chain, address)
+        self._set(self.tokens, (chain, address), value)
+        return value
+
+    def put_contract(self, chain: str, contract_info):
+        """
+        Store freshly written pool info, replacing any stale or negative entry.
+        """
+        self._set(self.contracts, (chain, contract_info.address), contract_info)
+
+    def put_token(self, chain: str, token_info):
+        """
+        Store freshly written token info, replacing any stale or negative entry.
+        """
+        self._set(self.tokens, (chain, token_info.address), token_info)
+
+    def invalidate(self, chain: str, address: str):
+        """
+        Drop any cached pool or token entry for an address.
+        """
+        self.contracts.pop((chain, address))
+        self.tokens.pop((chain, address))
+
+    async def warm(self, db_operator: DatabaseOperator, chain: str):
+        """
+        Load a chain's known pools and tokens from evm_swap_info and evm_token_info.
+        Only the first call per chain hits the database.
+        """
+        if chain in self._warmed:
+            return
+        self._warmed.add(chain)
+        try:
+            tokens = await run_sql(db_operator.sql.query.evm.all_evm_token_info_by_chain, chain)
+            for row in tokens[:self.tokens.max_size]:
+                self._set(self.tokens, (chain, row['contract_address']), TokenInfo(
+                    address=row['contract_address'],
+                    name=row['name'],
+                    symbol=row['symbol'],
+                    decimals=row['decimals']
+                ))
+
+            contracts = await run_sql(db_operator.sql.query.evm.all_evm_swap_info_by_chain, chain)
+            for row in contracts[:self.contracts.max_size]:
+                self._set(self.contracts, (chain, row['contract_address']), ContractInfo(
+                    address=row['contract_address'],
+                    factory=row['factory_address'],
+                    fee=row.get('fee'),
+                    token0_name=row.get('token0_name'),
+                    token1_name=row.get('token1_name'),
+                    token0_symbol=row.get('token0_symbol'),
+                    token0_decimals=row.get('token0_decimals'),
+                    token1_symbol=row.get('token1_symbol'),
+                    token1_decimals=row.get('token1_decimals'),
+                    token0_address=row.get('token0_address'),
+                    token1_address=row.get('token1_address'),
+                    name=row.get('name')
+                ))
+            self.logger.info(f"Warmed metadata cache for {chain} with {len(contracts)} pools and {len(tokens)} tokens")
+        except Exception as e:
+            self.logger.error(f"Error warming metadata cache for {chain}: {e}")
+
+    def stats(self) -> dict:
+        """Snapshot of the pool and token cache counters."""
+        return {
+            "contracts": self.contracts.stats(),
+            "tokens": self.tokens.stats(),
+            "negative_hits": self.negative_hits,
+        }
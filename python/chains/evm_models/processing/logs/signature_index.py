@@ -0,0 +1,91 @@
+from collections import defaultdict
+import logging
+from eth_abi.codec import ABICodec
+from eth_abi.registry import registry
+from database import DatabaseOperator, run_sql
+from .decode_plan import DecodePlan
+from .models import EventSignature
+
+logger = logging.getLogger(__name__)
+
+
+class SignatureIndex:
+    """
+    Process-wide topic0 -> event index built from evm_decoded_events.
+
+    Event signatures do not depend on the contract or chain, so a log whose
+    topic0 has been seen anywhere before decodes without fetching the
+    emitting contract's ABI. Variants sharing a topic0 (ERC20 and ERC721
+    Transfer) are told apart by their number of indexed inputs, which is
+    the number of topics after topic0.
+    """
+    _shared = None
+
+    def __init__(self):
+        self.abi_codec = ABICodec(registry)
+        self.plans = defaultdict(dict)
+        self.logger = logger
+        self.hits = 0
+        self.misses = 0
+        self._loaded = False
+
+    @classmethod
+    def shared(cls) -> 'SignatureIndex':
+        """
+        The process-wide instance, shared by every chain's decoder.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    async def load(self, db_operator: DatabaseOperator):
+        """
+        Load every stored event signature. Only the first call hits the database.
+        """
+        if self._loaded:
+            return
+        self._loaded = True
+        events = await run_sql(db_operator.sql.query.evm.all_events)
+        for event_sig in events:
+            self.add(event_sig)
+        self.logger.info(f"Loaded {len(events)} event signatures into the signature index")
+
+    def add(self, event_sig: EventSignature) -> DecodePlan:
+        """
+        Compile and index an event signature, returning its decode plan.
+        """
+        plan = DecodePlan(event_sig, self.abi_codec)
+        self.plans[event_sig.signature_hash][sum(bool(indexed) for indexed in event_sig.indexed_inputs)] = plan
+        return plan
+
+    def knows(self, topics) -> bool:
+        """
+        Whether a log's topics can be decoded from the index, without counting a lookup.
+        """
+        variants = self.plans.get(topics[0].hex())
+        return bool(variants) and len(topics) - 1 in variants
+
+    def lookup(self, topics) -> DecodePlan:
+        """
+        Get the decode plan for a log's topics, None if the event is not indexed.
+        """
+        variants = self.plans.get(topics[0].hex())
+        plan = variants.get(len(topics) - 1) if variants else None
+        if plan is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return plan
+
+    def __len__(self):
+        return sum(len(variants) for variants in self.plans.values())
+
+    def stats(self) -> dict:
+        """Snapshot of the index size and counters."""
+        lookups = self.hits + self.misses
+        return {
+            "signatures": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,163 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict, namedtuple
+from config import Settings
+from ..utils import decode_hex, normalize_hex
+from database import run_sql
+
+logger = logging.getLogger(__name__)
+
+# What is kept per block to detect a reorg and roll it back
+RingEntry = namedtuple('RingEntry', ['block_hash', 'parent_hash', 'timestamp', 'transaction_hashes'])
+
+
+def block_entry(block: dict) -> RingEntry:
+    return RingEntry(
+        block_hash=normalize_hex(block['hash']),
+        parent_hash=normalize_hex(block['parentHash']),
+        timestamp=decode_hex(block['timestamp']),
+        transaction_hashes=tuple(
+            normalize_hex(tx['hash']) if isinstance(tx, dict) else normalize_hex(tx)
+            for tx in block.get('transactions', [])
+        )
+    )
+
+
+class ReorgDetector:
+    """
+    Keeps the hashes of the last `depth` blocks of a chain and checks each
+    incoming block's parentHash against them.
+
+    `detect` is the cheap check on the live path. When it reports a reorg,
+    `resolve` walks back to the common ancestor, deletes the orphaned
+    blocks from Postgres and Mongo and reprocesses the canonical ones.
+    Blocks processed outside the live stream, caught up or backfilled, are
+    added with `observe` so the ring has no holes for `resolve` to stop at.
+    """
+    def __init__(self, network: str, querier, processor, depth: int = None):
+        self.network = network
+        self.querier = querier
+        self.processor = processor
+        self.db_operator = processor.db_operator
+        self.depth = depth or Settings.REORG_DEPTH
+        self.logger = logger
+        self._ring = OrderedDict()  # block number -> RingEntry, lowest number first
+
+        # Metrics
+        self.reorgs = 0
+        self.max_reorg_depth = 0
+        self.blocks_rolled_back = 0
+        self.last_resolve_ms = 0.0
+        self.detect_total_us = 0.0
+        self.detect_calls = 0
+
+    def stats(self) -> dict:
+        return {
+            "network": self.network,
+            "tracked_blocks": len(self._ring),
+            "reorgs": self.reorgs,
+            "max_reorg_depth": self.max_reorg_depth,
+            "blocks_rolled_back": self.blocks_rolled_back,
+            "last_resolve_ms": round(self.last_resolve_ms, 2),
+            "avg_detect_us": round(self.detect_total_us / self.detect_calls, 2) if self.detect_calls else 0.0,
+        }
+
+    def record(self, block_number: int, entry: RingEntry):
+        out_of_order = self._ring and block_number < next(reversed(self._ring))
+        self._ring[block_number] = entry
+        if out_of_order:
+            # Caught up and backfilled blocks arrive behind the head, keep the ring sorted
+            self._ring = OrderedDict(sorted(self._ring.items()))
+        while len(self._ring) > self.depth:
+            self._ring.popitem(last=False)
+
+    def observe(self, block: dict):
+        """
+        Record a block processed outside the live stream. Blocks older than
+        every tracked one are skipped once the ring is full.
+        """
+        block_number = decode_hex(block['number'])
+        if len(self._ring) >= self.depth and block_number < next(iter(self._ring)):
+            return
+        self.record(block_number, block_entry(block))
+
+    def detect(self, block: dict) -> bool:
+        """
+        Check an incoming block against the ring. Blocks that extend the
+        known chain are recorded and False is returned; True means the block
+        conflicts with what was already ingested and `resolve` must run
+        before it is processed.
+        """
+        started = time.perf_counter()
+        try:
+            block_number = decode_hex(block['number'])
+            entry = block_entry(block)
+
+            known = self._ring.get(block_number)
+            if known is not None and known.block_hash == entry.block_hash:
+                return False  # Same block announced twice
+
+            parent = self._ring.get(block_number - 1)
+            conflicting = known is not None or (parent is not None and parent.block_hash != entry.parent_hash)
+            if not conflicting:
+                self.record(block_number, entry)
+            return conflicting
+        finally:
+            self.detect_total_us += (time.perf_counter() - started) * 1e6
+            self.detect_calls += 1
+
+    async def resolve(self, block: dict):
+        """
+        Roll back the blocks orphaned by `block` and reprocess the canonical
+        chain up to (not including) `block`, which the caller processes as usual.
+        """
+        started = time.perf_counter()
+        block_number = decode_hex(block['number'])
+        entry = block_entry(block)
+
+        # Walk back from the new block until its ancestry meets the ring
+        canonical = []
+        parent_hash, number = entry.parent_hash, block_number - 1
+        while number in self._ring and self._ring[number].block_hash != parent_hash:
+            canonical_block = await self.querier.get_block(number)
+            if not canonical_block:
+                raise ValueError(f"Canonical block {number} not found while resolving reorg")
+            canonical.append(canonical_block)
+            parent_hash = normalize_hex(canonical_block['parentHash'])
+            number -= 1
+        ancestor = number
+        if canonical and ancestor not in self._ring:
+            self.logger.error(f"{self.network} reorg at {block_number} is deeper than the {self.depth} tracked blocks")
+
+        # Everything above the common ancestor that was ingested is orphaned
+        orphaned = {n: e for n, e in self._ring.items() if n > ancestor}
+        for n in orphaned:
+            del self._ring[n]
+
+        if orphaned:
+            # An orphan's transaction insert still running would commit after the delete,
+            # a failed one wrote nothing so it does not stop the rollback
+            await self.processor.block_processor.settle(list(orphaned))
+            transaction_hashes = {tx for e in orphaned.values() for tx in e.transaction_hashes}
+            await run_sql(
+                self.db_operator.sql.insert.block.rollback_blocks,
+                self.network, [e.block_hash for e in orphaned.values()], transaction_hashes,
+                min(e.timestamp for e in orphaned.values())
+            )
+            await asyncio.to_thread(self.db_operator.mongodb.insert.delete_blocks, self.network, list(orphaned))
+
+        # Reprocess the canonical blocks between the ancestor and the new block
+        for canonical_block in reversed(canonical):
+            await self.processor.process_block(canonical_block)
+            self.record(decode_hex(canonical_block['number']), block_entry(canonical_block))
+        self.record(block_number, entry)
+
+        self.reorgs += 1
+        self.max_reorg_depth = max(self.max_reorg_depth, len(orphaned))
+        self.blocks_rolled_back += len(orphaned)
+        self.last_resolve_ms = (time.perf_counter() - started) * 1000
+        self.logger.warning(
+            f"{self.network} reorg at block {block_number}: common ancestor {ancestor}, "
+            f"rolled back {len(orphaned)} blocks and reprocessed {len(canonical)} in {self.last_resolve_ms:.1f}ms"
+        )
@@ -0,0 +1,263 @@
+import asyncio
+import itertools
+import logging
+import random
+import aiohttp
+from hexbytes import HexBytes
+from eth_utils import to_checksum_address
+from config import Settings
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying, anything else is returned to the caller
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class RPCError(Exception):
+    """
+    Error object returned by a JSON-RPC endpoint.
+    """
+    def __init__(self, method, error):
+        self.method = method
+        self.error = error
+        super().__init__(f"{method} failed: {error}")
+
+
+class AsyncRPCClient:
+    """
+    Asynchronous JSON-RPC client over HTTP with a keep-alive connection pool,
+    a per-endpoint concurrency limit, request timeouts, retry with jitter and
+    JSON-RPC batch arrays.
+    """
+    def __init__(self, network: str, endpoint: str, max_concurrency: int = None, timeout: float = None,
+                 max_retries: int = None, retry_backoff: float = None, batch_size: int = None):
+        self.network = network
+        self.endpoint = endpoint
+        self.max_concurrency = max_concurrency or Settings.RPC_MAX_CONCURRENCY
+        self.timeout = timeout or Settings.RPC_TIMEOUT
+        self.max_retries = max_retries if max_retries is not None else Settings.RPC_MAX_RETRIES
+        self.retry_backoff = retry_backoff or Settings.RPC_RETRY_BACKOFF
+        self.batch_size = batch_size or Settings.RPC_BATCH_SIZE
+        self.logger = logger
+
+        self._session = None
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._ids = itertools.count(1)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Lazily create the session, it has to be created inside the running loop.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                keepalive_timeout=60,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    def _build_request(self, method: str, params: list) -> dict:
+        return {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params,
+            "id": next(self._ids)
+        }
+
+    async def _post(self, payload):
+        """
+        POST a payload, retrying transport errors and throttling responses.
+        """
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    session = self._get_session()
+                    async with session.post(self.endpoint, json=payload) as response:
+                        if response.status not in RETRYABLE_STATUSES:
+                            response.raise_for_status()
+                            return await response.json(content_type=None)
+                        error = aiohttp.ClientResponseError(
+                            response.request_info, response.history, status=response.status
+                        )
+            except aiohttp.ClientResponseError:
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = e
+
+            if attempt >= self.max_retries:
+                self.logger.error(f"RPC request to {self.network} failed after {attempt + 1} attempts: {error}")
+                raise error
+            # Exponential backoff with full jitter
+            delay = random.uniform(0, self.retry_backoff * 2 ** attempt)
+            self.logger.debug(f"RPC request to {self.network} failed ({error}), retrying in {delay:.2f}s")
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def request(self, method: str, params: list = None):
+        """
+        Send a single JSON-RPC request and return its result.
+        """
+        response = await self._post(self._build_request(method, params or []))
+        if response.get("error"):
+            raise RPCError(method, response["error"])
+        return response.get("result")
+
+    async def batch(self, calls: list, return_exceptions: bool = False) -> list:
+        """
+        Send (method, params) pairs as JSON-RPC batch arrays, split into chunks
+        of at most `batch_size` requests. Results are returned in call order;
+        with `return_exceptions` a failed call yields its RPCError instead of raising.
+        """
+        chunks = [calls[i:i + self.batch_size] for i in range(0, len(calls), self.batch_size)]
+        chunk_results = await asyncio.gather(*(self._batch_chunk(chunk) for chunk in chunks))
+
+        results = [result for chunk in chunk_results for result in chunk]
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, RPCError):
+                    raise result
+        return results
+
+    async def _batch_chunk(self, calls: list) -> list:
+        payload = [self._build_request(method, params or []) for method, params in calls]
+        response = await self._post(payload)
+        # Providers without batch support answer with a single error object
+        if not isinstance(response, list):
+            raise RPCError("batch", response.get("error") if isinstance(response, dict) else response)
+
+        # Responses may come back in any order, match them on id
+        by_id = {item.get("id"): item for item in response}
+        results = []
+        for request in payload:
+            item = by_id.get(request["id"])
+            if item is None:
+                results.append(RPCError(request["method"], "missing from batch response"))
+            elif item.get("error"):
+                results.append(RPCError(request["method"], item["error"]))
+            else:
+                results.append(item.get("result"))
+        return results
+
+    async def close(self):
+        """
+        Close the underlying connection pool.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+
+class RPCBatcher:
+    """
+    Coalesces concurrent requests into JSON-RPC batch arrays. Requests are
+    held for at most `window` seconds, or until `max_size` are queued, and
+    then sent as a single round-trip.
+    """
+    def __init__(self, client: AsyncRPCClient, max_size: int = None, window: float = None):
+        self.client = client
+        self.max_size = max_size or Settings.RPC_BATCH_SIZE
+        self.window = window if window is not None else Settings.RPC_BATCH_WINDOW
+        self.logger = logger
+
+        self._pending = []
+        self._timer = None
+        self._tasks = set()
+
+        # Metrics
+        self.requests = 0
+        self.round_trips = 0
+
+    def stats(self) -> dict:
+        return {
+            "network": self.client.network,
+            "requests": self.requests,
+            "round_trips": self.round_trips,
+            "pending": len(self._pending),
+        }
+
+    async def request(self, method: str, params: list = None):
+        """
+        Queue a request for the next batch and wait for its result.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((method, params or [], future))
+        self.requests += 1
+
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self.round_trips += 1
+
+        # Keep a reference so the task isn't garbage collected mid-flight
+        task = asyncio.create_task(self._send(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, pending: list):
+        try:
+            if len(pending) == 1:
+                method, params, _ = pending[0]
+                results = [await self.client.request(method, params)]
+            else:
+                results = await self.client.batch([(method, params) for method, params, _ in pending], return_exceptions=True)
+        except Exception as e:
+            results = [e] * len(pending)
+
+        for (_, _, future), result in zip(pending, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+def format_log(log: dict) -> dict:
+    """
+    Convert a raw JSON-RPC log into the shape web3 returns (checksummed address,
+    hex quantities to ints, hashes and data to HexBytes) so the decoder sees
+    the same types.
+    """
+    return {
+        **log,
+        "address": to_checksum_address(log["address"]) if log.get("address") else None,
+        "topics": [HexBytes(topic) for topic in log.get("topics", [])],
+        "data": HexBytes(log.get("data", "0x")),
+        "blockNumber": int(log["blockNumber"], 16) if log.get("blockNumber") else None,
+        "blockHash": HexBytes(log["blockHash"]) if log.get("blockHash") else None,
+        "transactionHash": HexBytes(log["transactionHash"]) if log.get("transactionHash") else None,
+        "transactionIndex": int(log["transactionIndex"], 16) if log.get("transactionIndex") else None,
+        "logIndex": int(log["logIndex"], 16) if log.get("logIndex") else None,
+    }
+
+
+def raw_log(log: dict) -> dict:
+    """
+    Convert a log in the shape format_log returns back into its JSON-RPC form,
+    so it can be archived as plain JSON and formatted again on replay.
+    """
+    return {
+        **log,
+        "address": log["address"].lower() if log.get("address") else None,
+        "topics": [HexBytes(topic).to_0x_hex() for topic in log.get("topics", [])],
+        "data": HexBytes(log.get("data", "0x")).to_0x_hex(),
+        "blockNumber": hex(log["blockNumber"]) if log.get("blockNumber") is not None else None,
+        "blockHash": HexBytes(log["blockHash"]).to_0x_hex() if log.get("blockHash") else None,
+        "transactionHash": HexBytes(log["transactionHash"]).to_0x_hex() if log.get("transactionHash") else None,
+        "transactionIndex": hex(log["transactionIndex"]) if log.get("transactionIndex") is not None else None,
+        "logIndex": hex(log["logIndex"]) if log.get("logIndex") is not None else None,
+    }
@@ -0,0 +1,205 @@
+import asyncio
+import logging
+from collections import deque
+from config import Settings
+from ..utils import decode_hex
+
+logger = logging.getLogger(__name__)
+
+# Backpressure policies
+BLOCK = 'block'   # Stop pulling from the stream until a slot frees up
+SPILL = 'spill'   # Park blocks in an in-memory backlog and keep reading the stream
+
+
+class BlockScheduler:
+    """
+    Bounded in-flight scheduler for block processing.
+
+    Keeps at most `max_in_flight` blocks being processed at once for a chain,
+    reaps finished tasks as they complete and applies a backpressure policy
+    when processing falls behind the head of the chain.
+
+    Missed blocks can be queued on a catch-up lane. They are only started
+    when no live block is waiting and use at most half of the slots, so
+    live blocks keep priority. Blocks whose processing fails are queued on
+    the same lane again, up to `max_retries` times.
+    """
+    def __init__(self, network: str, process, max_in_flight: int = None, policy: str = None, max_backlog: int = None,
+                 catchup=None, max_retries: int = None):
+        self.network = network
+        self.process = process
+        self.catchup = catchup  # Coroutine function taking a block number
+        self.max_in_flight = max_in_flight or Settings.BLOCK_MAX_IN_FLIGHT
+        self.policy = policy or Settings.BLOCK_BACKPRESSURE_POLICY
+        self.max_backlog = max_backlog or Settings.BLOCK_MAX_BACKLOG
+        self.max_retries = Settings.BLOCK_MAX_RETRIES if max_retries is None else max_retries
+        if self.policy not in (BLOCK, SPILL):
+            raise ValueError(f"Unknown backpressure policy: {self.policy}")
+
+        self.catchup_max_in_flight = max(1, self.max_in_flight // 2)
+
+        self.logger = logger
+        self._in_flight = set()
+        self._backlog = deque()
+        self._slot_freed = asyncio.Event()
+        self._waiting = 0
+        self._catchup = deque()
+        self._catchup_in_flight = set()
+        self._block_numbers = {}  # task -> number of the block it processes
+        self._failures = {}  # block number -> failed attempts so far
+
+        # Metrics
+        self.processed = 0
+        self.failed = 0
+        self.spilled = 0
+        self.max_depth_seen = 0
+        self.caught_up = 0
+        self.retried = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    @property
+    def backlog(self) -> int:
+        return len(self._backlog)
+
+    @property
+    def catchup_pending(self) -> int:
+        return len(self._catchup) + len(self._catchup_in_flight)
+
+    @property
+    def queue_depth(self) -> int:
+        """Blocks accepted by the scheduler but not yet finished."""
+        return len(self._in_flight) + len(self._backlog)
+
+    def stats(self) -> dict:
+        """Snapshot of the scheduler gauges and counters."""
+        return {
+            "network": self.network,
+            "in_flight": self.in_flight,
+            "backlog": self.backlog,
+            "queue_depth": self.queue_depth,
+            "max_depth_seen": self.max_depth_seen,
+            "processed": self.processed,
+            "failed": self.failed,
+            "spilled": self.spilled,
+            "catchup_pending": self.catchup_pending,
+            "caught_up": self.caught_up,
+            "retried": self.retried,
+        }
+
+    async def submit(self, block):
+        """
+        Hand a block to the scheduler. Returns once the block has either been
+        started or parked in the backlog; under the `block` policy (or when the
+        backlog is full) this waits for processing to catch up.
+        """
+        if self._has_capacity() and not self._backlog:
+            self._start(block)
+        elif self.policy == SPILL:
+            while len(self._backlog) >= self.max_backlog:
+                await self._wait_for_slot()
+            self._backlog.append(block)
+            self.spilled += 1
+            if len(self._backlog) % 100 == 1:
+                self.logger.warning(f"{self.network} processing behind head, backlog at {len(self._backlog)} blocks")
+        else:
+            # Counted so freed slots aren't handed to the catch-up lane meanwhile
+            self._waiting += 1
+            try:
+                while not self._has_capacity():
+                    await self._wait_for_slot()
+            finally:
+                self._waiting -= 1
+            self._start(block)
+
+        self.max_depth_seen = max(self.max_depth_seen, self.queue_depth)
+
+    def enqueue_catchup(self, start: int, end: int):
+        """Queue the block numbers start..end on the catch-up lane."""
+        if self.catchup is None:
+            raise ValueError("Scheduler has no catch-up handler")
+        self._catchup.extend(range(start, end + 1))
+        self._fill_from_backlog()
+
+    async def drain(self):
+        """Wait until every accepted and caught-up block has been processed."""
+        while self._in_flight or self._backlog or self._catchup:
+            if self._in_flight:
+                await asyncio.wait(set(self._in_flight))
+            else:
+                self._fill_from_backlog()
+
+    async def settle(self):
+        """
+        Wait for the blocks currently in flight and the live backlog, without
+        waiting on queued catch-up blocks.
+        """
+        while self._in_flight or self._backlog:
+            if self._in_flight:
+                await asyncio.wait(set(self._in_flight))
+            else:
+                self._fill_from_backlog()
+
+    async def _wait_for_slot(self):
+        self._slot_freed.clear()
+        await self._slot_freed.wait()
+
+    def _has_capacity(self) -> bool:
+        return len(self._in_flight) < self.max_in_flight
+
+    def _start(self, block):
+        task = asyncio.create_task(self.process(block))
+        self._in_flight.add(task)
+        self._block_numbers[task] = decode_hex(block['number'])
+        task.add_done_callback(self._on_done)
+
+    def _start_catchup(self, block_number):
+        task = asyncio.create_task(self.catchup(block_number))
+        self._in_flight.add(task)
+        self._catchup_in_flight.add(task)
+        self._block_numbers[task] = block_number
+        task.add_done_callback(self._on_done)
+
+    def _on_done(self, task):
+        self._in_flight.discard(task)
+        is_catchup = task in self._catchup_in_flight
+        self._catchup_in_flight.discard(task)
+        block_number = self._block_numbers.pop(task)
+        if task.cancelled():
+            self.failed += 1
+        elif task.exception() is not None:
+            self.failed += 1
+            self.logger.error(f"Block processing failed for {self.network}: {task.exception()}")
+            self._retry(block_number)
+        else:
+            self._failures.pop(block_number, None)
+            if is_catchup:
+                self.caught_up += 1
+            else:
+                self.processed += 1
+
+        self._fill_from_backlog()
+        self._slot_freed.set()
+
+    def _retry(self, block_number: int):
+        """Queue a failed block on the catch-up lane, unless it ran out of retries."""
+        attempts = self._failures.get(block_number, 0) + 1
+        if self.catchup is None or attempts > self.max_retries:
+            self._failures.pop(block_number, None)
+            self.logger.error(f"Giving up on {self.network} block {block_number} after {attempts} attempts")
+            return
+        self._failures[block_number] = attempts
+        self._catchup.append(block_number)
+        self.retried += 1
+        self.logger.warning(f"Retrying {self.network} block {block_number} (attempt {attempts + 1})")
+
+    def _fill_from_backlog(self):
+        while self._backlog and self._has_capacity():
+            self._start(self._backlog.popleft())
+        # Catch-up only runs on slots no live block wants
+        if self._backlog or self._waiting:
+            return
+        while self._catchup and self._has_capacity() and len(self._catchup_in_flight) < self.catchup_max_in_flight:
+            self._start_catchup(self._catchup.popleft())
@@ -0,0 +1,112 @@
+import asyncio
+from types import SimpleNamespace
+from chains.evm_models.reorg import ReorgDetector
+from chains.evm_models.processing.blocks.block_processor import BlockProcessor
+
+
+def make_block(number: int, block_hash: str, parent_hash: str, transaction_hashes):
+    return {
+        'number': hex(number),
+        'hash': block_hash,
+        'parentHash': parent_hash,
+        'timestamp': hex(1_700_000_000 + number * 12),
+        'transactions': [
+            {'hash': tx_hash, 'from': '0x' + '11' * 20, 'to': '0x' + '22' * 20,
+             'value': '0x0', 'gas': '0x5208', 'gasPrice': '0x1', 'chainId': '0x1'}
+            for tx_hash in transaction_hashes
+        ],
+    }
+
+
+# Mock SQL and Mongo, evm_transactions rows are kept by transaction hash
+class MockStore:
+    def __init__(self):
+        self.transactions = {}
+        self.held = {}  # transaction hash -> event the insert of its block waits on
+
+    async def insert_block(self, chain, block_number, block_hash, parent_hash, timestamp):
+        return True
+
+    async def insert_transactions(self, chain, columns, block_number):
+        for tx_hash in columns['transaction_hash']:
+            if tx_hash in self.held:
+                await self.held[tx_hash].wait()
+        for tx_hash in columns['transaction_hash']:
+            # ON CONFLICT DO NOTHING
+            self.transactions.setdefault(tx_hash, block_number)
+        return True
+
+    async def rollback_blocks(self, chain, block_hashes, transaction_hashes, min_timestamp):
+        for tx_hash in transaction_hashes:
+            self.transactions.pop(tx_hash, None)
+        return True
+
+    def db_operator(self):
+        return SimpleNamespace(
+            sql=SimpleNamespace(insert=SimpleNamespace(
+                block=SimpleNamespace(insert_block=self.insert_block, rollback_blocks=self.rollback_blocks),
+                evm=SimpleNamespace(transactions=self.insert_transactions),
+            )),
+            mongodb=SimpleNamespace(insert=SimpleNamespace(
+                insert_block=lambda block, chain, block_number, timestamp: True,
+                delete_blocks=lambda chain, block_numbers: True,
+            )),
+        )
+
+
+class MockProcessor:
+    def __init__(self, db_operator):
+        self.db_operator = db_operator
+        self.block_processor = BlockProcessor(db_operator, 'ethereum')
+
+    async def process_block(self, block, logs=None):
+        await self.block_processor.process(block)
+
+
+class MockQuerier:
+    def __init__(self, blocks):
+        self.blocks = {int(block['number'], 16): block for block in blocks}
+
+    async def get_block(self, block_number):
+        return self.blocks.get(block_number)
+
+
+async def _orphan_insert_held_across_resolve():
+    store = MockStore()
+    processor = MockProcessor(store.db_operator())
+
+    ancestor = make_block(1, '0x' + 'a1' * 32, '0x' + 'a0' * 32, ['0x' + '01' * 32])
+    orphan = make_block(2, '0x' + 'b2' * 32, ancestor['hash'], ['0x' + 'bb' * 32, '0x' + 'cc' * 32])
+    canonical = make_block(2, '0x' + 'c2' * 32, ancestor['hash'], ['0x' + 'cc' * 32])
+    new_head = make_block(3, '0x' + 'c3' * 32, canonical['hash'], [])
+
+    detector = ReorgDetector('ethereum', MockQuerier([ancestor, canonical]), processor, depth=8)
+    release = store.held['0x' + 'bb' * 32] = asyncio.Event()
+    for block in (ancestor, orphan):
+        assert not detector.detect(block)
+        await processor.process_block(block)
+    orphan_insert = processor.block_processor._processing_tasks[2]
+    await processor.block_processor.settle([1])
+
+    assert detector.detect(new_head)
+    resolving = asyncio.create_task(detector.resolve(new_head))
+    await asyncio.sleep(0.05)
+    # The rollback waits for the orphan's insert instead of deleting before it commits
+    assert not resolving.done()
+    assert store.transactions == {'0x' + '01' * 32: 1}
+
+    release.set()
+    await resolving
+    await orphan_insert
+    await processor.block_processor.settle([2])
+
+    # Only the ancestor's and the canonical block's transactions remain
+    assert store.transactions == {'0x' + '01' * 32: 1, '0x' + 'cc' * 32: 2}
+
+
+def test_resolve_waits_for_orphaned_transaction_inserts():
+    asyncio.run(_orphan_insert_held_across_resolve())
+
+
+if __name__ == "__main__":
+    test_resolve_waits_for_orphaned_transaction_inserts()
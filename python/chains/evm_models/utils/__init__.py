@@ -1,2 +1,2 @@
 from .abis import ERC20_ABI
-from .constants import CHAIN_IDS
\ No newline at end of file
+from .constants import CHAIN_IDS, MULTICALL3_ADDRESS, ZKSYNC_MULTICALL3_ADDRESS
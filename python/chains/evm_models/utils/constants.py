@@ -10,4 +10,8 @@ CHAIN_IDS = {
     'zksync': 324,
     'mantle': 5000,
     'linea': 59140,  # Chain ID for Linea
-}
\ No newline at end of file
+}
+
+# Multicall3 is deployed at the same address on most EVM chains
+MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'
+ZKSYNC_MULTICALL3_ADDRESS = '0xF9cda624FBC7e059355ce98a31693d299FACd963'
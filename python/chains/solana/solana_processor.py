@@ -1,4 +1,6 @@
 from ..base_models import BaseProcessor
+from database import run_sql
+import asyncio
 import json
 from operator import itemgetter
 import numpy as np
@@ -42,10 +44,10 @@ class SolanaProcessor(BaseProcessor):
             self.logger.info(f"Processing {self.network} block {block_height}")
             
             # Insert block into MongoDB
-            self.db_operator.mongodb.insert.insert_block(block, self.network, block_height, block_time)
+            await asyncio.to_thread(self.db_operator.mongodb.insert.insert_block, block, self.network, block_height, block_time)
             
             # Insert block into PostgreSQL
-            self.db_operator.sql.insert.block.insert_block(self.network, block_height, get_block_hash(block), get_previous_block_hash(block), block_time)
+            await run_sql(self.db_operator.sql.insert.block.insert_block, self.network, block_height, get_block_hash(block), get_previous_block_hash(block), block_time)
             self.logger.debug(f"{self.network} block {block_height} stored successfully.")
             
             # Process transactions
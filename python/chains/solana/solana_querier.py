@@ -1,6 +1,8 @@
 from solana.rpc.api import Client
 from ..base_models import BaseQuerier
 from config import Settings
+from ..utils import HeadTracker
+from collections import deque
 import asyncio
 import json
 from .solana_websocket_handler import SolanaWebSocketHandler
@@ -16,6 +18,13 @@ class SolanaQuerier(BaseQuerier):
         self.client = Client(Settings.SOLANA_ENDPOINT)
         self.ws = SolanaWebSocketHandler(Settings.SOLANA_WEBSOCKET_ENDPOINT)
 
+        # Gap tracking, slots are tracked in-stream since the blocks table stores heights
+        self.head_tracker = HeadTracker('solana')
+        self.pending_slots = {}  # slot -> failed fetch attempts
+        self.catchup_slots = deque()
+        self.catchup_per_slot = 4
+        self.max_slot_attempts = 5
+
     def is_connected(self) -> bool:
         """
         Check connection to the Solana RPC node.
@@ -63,6 +72,9 @@ class SolanaQuerier(BaseQuerier):
     async def stream_blocks(self, duration=None):
         """
         Stream blocks using WebSocket and fetch block details concurrently.
+        Slots the RPC hasn't caught up to are kept pending and retried, and
+        slots skipped by the stream (e.g. during a reconnect) are caught up
+        after live slots.
         """
         self.logger.info("Starting block streaming...")
         start_time = asyncio.get_running_loop().time()
@@ -75,31 +87,61 @@ class SolanaQuerier(BaseQuerier):
                 self.logger.info("Stream duration expired.")
                 break
                 
-            if ws_slot is not None:
+            if ws_slot is None:
+                continue
+
+            # Only process if we haven't seen this slot before
+            if last_processed_slot and ws_slot <= last_processed_slot:
+                continue
+
+            for start, end in self.head_tracker.observe(ws_slot):
+                self.catchup_slots.extend(range(start, end + 1))
+            self.pending_slots.setdefault(ws_slot, 0)
+
+            try:
+                # Get current slot from RPC, newer slots wait for it to catch up
+                current_slot = self.client.get_slot().value
+            except Exception as e:
+                self.logger.error(f"Error fetching current slot: {e}")
+                continue
+
+            # Live slots first, in order
+            for slot in sorted(slot for slot in self.pending_slots if slot <= current_slot):
+                block = await self._fetch_pending_slot(slot)
+                if block:
+                    last_processed_slot = max(last_processed_slot or slot, slot)
+                    self.logger.info(f"Successfully fetched and processing block {slot}")
+                    yield block
+
+            # Then a bounded number of missed slots
+            for _ in range(min(self.catchup_per_slot, len(self.catchup_slots))):
+                slot = self.catchup_slots.popleft()
                 try:
-                    # Get current slot from RPC
-                    current_slot = self.client.get_slot().value
-                    slot_diff = ws_slot - current_slot
-                    
-                    # Only process if we haven't seen this slot before
-                    if last_processed_slot and ws_slot <= last_processed_slot:
-                        continue
-                    
-                    # If WebSocket slot is ahead of RPC slot, wait for RPC to catch up
-                    if slot_diff > 0:
-                        self.logger.debug(f"Waiting for slot {ws_slot} to be available (current: {current_slot})")
-                        await asyncio.sleep(1)  # Wait a bit for RPC to catch up
-                        continue
-                    
-                    # Try to fetch the block
-                    block = await self.get_block(ws_slot)
-                    if block:
-                        last_processed_slot = ws_slot
-                        self.logger.info(f"Successfully fetched and processing block {ws_slot}")
-                        yield block
-                    else:
-                        self.logger.debug(f"No block data available for slot {ws_slot}")
-                        
+                    block = await self.get_block(slot)
                 except Exception as e:
-                    self.logger.error(f"Error processing slot {ws_slot}: {e}")
-                    continue
\ No newline at end of file
+                    # Skipped slots have no block
+                    self.logger.debug(f"No block for missed slot {slot}: {e}")
+                    continue
+                if block:
+                    self.logger.info(f"Caught up missed block {slot}")
+                    yield block
+
+    async def _fetch_pending_slot(self, slot):
+        """
+        Try to fetch a pending slot, dropping it after max_slot_attempts tries.
+        """
+        try:
+            block = await self.get_block(slot)
+        except Exception as e:
+            self.logger.error(f"Error processing slot {slot}: {e}")
+            block = None
+
+        if block:
+            self.pending_slots.pop(slot, None)
+            return block
+
+        self.pending_slots[slot] += 1
+        if self.pending_slots[slot] >= self.max_slot_attempts:
+            self.logger.warning(f"Giving up on slot {slot} after {self.max_slot_attempts} attempts")
+            self.pending_slots.pop(slot, None)
+        return None
\ No newline at end of file
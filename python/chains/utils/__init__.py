@@ -1,3 +1,4 @@
 from .utils import decode_hex, normalize_hex, decode_extra_data
+from .head_tracker import HeadTracker
 
-__all__ = [decode_hex, normalize_hex, decode_extra_data]
\ No newline at end of file
+__all__ = [decode_hex, normalize_hex, decode_extra_data, HeadTracker]
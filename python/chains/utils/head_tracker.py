@@ -0,0 +1,61 @@
+import logging
+from config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+class HeadTracker:
+    """
+    Tracks the last block (or slot) seen for a chain and reports the ranges
+    skipped when an incoming head jumps ahead, e.g. after a reconnect.
+    """
+    def __init__(self, network: str, last_block: int = None, max_catchup: int = None):
+        self.network = network
+        self.last_block = last_block
+        self.max_catchup = max_catchup or Settings.HEAD_MAX_CATCHUP
+        self.logger = logger
+
+        # Metrics
+        self.gaps_detected = 0
+        self.blocks_missed = 0
+        self.blocks_dropped = 0
+
+    def stats(self) -> dict:
+        return {
+            "network": self.network,
+            "last_block": self.last_block,
+            "gaps_detected": self.gaps_detected,
+            "blocks_missed": self.blocks_missed,
+            "blocks_dropped": self.blocks_dropped,
+        }
+
+    def observe(self, block_number: int) -> list:
+        """
+        Record an incoming head and return the (start, end) ranges missing
+        between the previous head and this one. Gaps larger than max_catchup
+        are clipped to the most recent blocks, the rest is left to a backfill.
+        """
+        if self.last_block is None or block_number <= self.last_block:
+            # First head or a repeated/reorged height, nothing skipped
+            if self.last_block is None or block_number > self.last_block:
+                self.last_block = block_number
+            return []
+
+        gaps = []
+        start, end = self.last_block + 1, block_number - 1
+        if start <= end:
+            self.gaps_detected += 1
+            self.blocks_missed += end - start + 1
+            if end - start + 1 > self.max_catchup:
+                clipped = start
+                start = end - self.max_catchup + 1
+                self.blocks_dropped += start - clipped
+                self.logger.warning(
+                    f"{self.network} gap {clipped}-{end} exceeds {self.max_catchup} blocks, "
+                    f"only catching up from {start}; backfill {clipped}-{start - 1} separately"
+                )
+            self.logger.warning(f"{self.network} missed blocks {start}-{end}, head jumped to {block_number}")
+            gaps.append((start, end))
+
+        self.last_block = block_number
+        return gaps
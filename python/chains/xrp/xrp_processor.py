@@ -1,5 +1,7 @@
 import json
 from ..base_models import BaseProcessor
+from database import run_sql
+import asyncio
 from operator import itemgetter
 
 get_ledger = itemgetter('ledger')
@@ -36,10 +38,10 @@ class XRPProcessor(BaseProcessor):
         ledger = get_ledger(ledger)
         timestamp = get_block_time(ledger) + 946684800
         # Insert block into MongoDB, add 30 years since XRP has its own epoch
-        self.db_operator.mongodb.insert.insert_block(ledger, self.network, ledger_index, timestamp)
+        await asyncio.to_thread(self.db_operator.mongodb.insert.insert_block, ledger, self.network, ledger_index, timestamp)
         
         # Insert block data into the PostgreSQL database
-        self.db_operator.sql.insert.block.insert_block(self.network, ledger_index, get_ledger_hash(ledger), get_parent_hash(ledger), timestamp)
+        await run_sql(self.db_operator.sql.insert.block.insert_block, self.network, ledger_index, get_ledger_hash(ledger), get_parent_hash(ledger), timestamp)
         self.logger.debug(f"Processed {self.network} block {ledger_index}")
 
         # Process transactions
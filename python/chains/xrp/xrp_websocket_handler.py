@@ -1,5 +1,3 @@
-import json
-import asyncio
 from ..base_models import BaseWebSocketHandler
 
 class XRPWebSocketHandler(BaseWebSocketHandler):
@@ -35,6 +33,5 @@ class XRPWebSocketHandler(BaseWebSocketHandler):
             "transactions": True,
             "expand": True  # Include full transaction details
         }
-        await self.connection.send(json.dumps(tx_request))
-        response = await self.connection.recv()
-        return json.loads(response).get("result")
\ No newline at end of file
+        response = await self.request(tx_request)
+        return response.get("result")
\ No newline at end of file
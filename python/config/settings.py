@@ -61,6 +61,21 @@ class Settings:
     # MONGO CONFIG
     MONGO_URI = os.getenv('MONGO_URI')
     MONGO_DB_NAME = os.getenv('MONGO_DB_NAME')
+    RAW_CODEC = os.getenv('RAW_CODEC', 'gzip-json')  # Archive format for raw blocks and logs, 'gzip-json' or 'zstd-msgpack'
+    ZSTD_LEVEL = int(os.getenv('ZSTD_LEVEL', 3))
+    ZSTD_DICT_SIZE = int(os.getenv('ZSTD_DICT_SIZE', 112640))  # Bytes per trained dictionary
+    ZSTD_DICT_SAMPLES = int(os.getenv('ZSTD_DICT_SAMPLES', 1000))  # Payloads per chain to train on, 0 disables dictionaries
+    MONGO_FLUSH_SIZE = int(os.getenv('MONGO_FLUSH_SIZE', 500))  # Buffered documents that trigger a bulk write
+    MONGO_FLUSH_INTERVAL = float(os.getenv('MONGO_FLUSH_INTERVAL', 1.0))  # Seconds between bulk writes otherwise
+    MONGO_MAX_PENDING = int(os.getenv('MONGO_MAX_PENDING', 20000))  # Buffered documents before writers wait
+    MONGO_WRITE_RETRIES = int(os.getenv('MONGO_WRITE_RETRIES', 3))  # Later flushes a failed document is retried in before it is dropped
+    MONGO_WRITE_CONCERN = os.getenv('MONGO_WRITE_CONCERN', '1')  # Acknowledging nodes, or 'majority'
+    MONGO_JOURNAL = os.getenv('MONGO_JOURNAL', 'false').lower() == 'true'  # Wait for the journal on each bulk write
+
+    # LOCAL ARCHIVE CONFIG
+    ARCHIVE_DIR = os.getenv('ARCHIVE_DIR')  # Directory for raw block segment files, unset disables the local archive
+    ARCHIVE_SEGMENT_BYTES = int(os.getenv('ARCHIVE_SEGMENT_BYTES', 256 * 1024 * 1024))  # Size at which a new segment is started
+    ARCHIVE_CODEC = os.getenv('ARCHIVE_CODEC', 'gzip-json')  # 'gzip-json' or 'zstd-msgpack', dictionaries are not used
     
 
 
@@ -72,7 +87,59 @@ class Settings:
         "host": os.getenv('DB_HOST'),
         "port": int(os.getenv('DB_PORT')) if os.getenv('DB_PORT') else 5432,
     }
-    
+    SQL_POOL_MIN_CONNECTIONS = int(os.getenv('SQL_POOL_MIN_CONNECTIONS', 5))
+    SQL_POOL_MAX_CONNECTIONS = int(os.getenv('SQL_POOL_MAX_CONNECTIONS', 50))
+    SQL_WORK_MEM = os.getenv('SQL_WORK_MEM', '1GB')  # Per pooled connection
+    SQL_BACKEND = os.getenv('SQL_BACKEND', 'psycopg2')  # 'psycopg2' or 'asyncpg' for the ingest path
+    SQL_STATEMENT_CACHE_SIZE = int(os.getenv('SQL_STATEMENT_CACHE_SIZE', 256))  # Prepared statements kept per asyncpg connection
+    PARTITION_INTERVAL = int(os.getenv('PARTITION_INTERVAL', 7 * 86400))  # Seconds of block timestamps per time range of a network partition
+    PARTITION_PREMAKE = int(os.getenv('PARTITION_PREMAKE', 4))  # Time ranges kept created ahead of now
+    PARTITION_RETENTION = int(os.getenv('PARTITION_RETENTION', 0))  # Seconds of blocks kept before their time range is detached, 0 keeps everything
+    PARTITION_ARCHIVE_SCHEMA = os.getenv('PARTITION_ARCHIVE_SCHEMA', 'partition_archive')  # Schema detached time ranges are moved to, empty drops them
+    PARTITION_MAINTENANCE_INTERVAL = float(os.getenv('PARTITION_MAINTENANCE_INTERVAL', 3600))  # Seconds between creating and expiring time ranges
+    
+    # PIPELINE CONFIG
+    BLOCK_MAX_IN_FLIGHT = int(os.getenv('BLOCK_MAX_IN_FLIGHT', 8))
+    BLOCK_BACKPRESSURE_POLICY = os.getenv('BLOCK_BACKPRESSURE_POLICY', 'block')  # 'block' or 'spill'
+    BLOCK_MAX_BACKLOG = int(os.getenv('BLOCK_MAX_BACKLOG', 1000))
+    BLOCK_MAX_RETRIES = int(os.getenv('BLOCK_MAX_RETRIES', 3))  # Times a failed block is retried on the catch-up lane
+    HEAD_MAX_CATCHUP = int(os.getenv('HEAD_MAX_CATCHUP', 10000))  # Blocks behind head caught up automatically
+    REORG_DEPTH = int(os.getenv('REORG_DEPTH', 64))  # Recent block hashes kept per chain for reorg detection
+    BACKFILL_RANGE_SIZE = int(os.getenv('BACKFILL_RANGE_SIZE', 100))  # Blocks per eth_getLogs range
+    BACKFILL_WORKERS = int(os.getenv('BACKFILL_WORKERS', 4))  # Ranges processed concurrently
+    METADATA_CACHE_SIZE = int(os.getenv('METADATA_CACHE_SIZE', 50000))  # Pools and tokens each kept in memory
+    METADATA_NEGATIVE_TTL = float(os.getenv('METADATA_NEGATIVE_TTL', 300))  # Seconds an unknown pool stays cached
+    ENRICHMENT_WORKERS = int(os.getenv('ENRICHMENT_WORKERS', 4))  # Background workers enriching new pools, per chain
+    ENRICHMENT_QUEUE_SIZE = int(os.getenv('ENRICHMENT_QUEUE_SIZE', 10000))  # Contracts queued before new ones are dropped
+    ENRICHMENT_BATCH_SIZE = int(os.getenv('ENRICHMENT_BATCH_SIZE', 20))  # Contracts a worker enriches together
+    ENRICHMENT_MAX_RETRIES = int(os.getenv('ENRICHMENT_MAX_RETRIES', 3))
+    ENRICHMENT_RETRY_BACKOFF = float(os.getenv('ENRICHMENT_RETRY_BACKOFF', 2))  # Seconds, doubled per retry
+    DECODE_WORKERS = int(os.getenv('DECODE_WORKERS', 0))  # Processes decoding logs, 0 decodes in the event loop
+    DECODE_CHUNK_SIZE = int(os.getenv('DECODE_CHUNK_SIZE', 250))  # Logs sent to a decode worker at a time
+    DECODE_POOL_MIN_LOGS = int(os.getenv('DECODE_POOL_MIN_LOGS', 200))  # Smaller blocks are decoded in the event loop
+    PROTOCOL_REGISTRY = os.getenv('PROTOCOL_REGISTRY')  # Swap/sync protocol registry file, defaults to the bundled protocols.json
+
+    # REDIS CONFIG
+    REDIS_HOST = os.getenv('REDIS_HOST', 'localhost')
+    REDIS_PORT = int(os.getenv('REDIS_PORT', 6379))
+    REDIS_DB = int(os.getenv('REDIS_DB', 0))
+    PROTOCOL_COUNTER_FLUSH_INTERVAL = float(os.getenv('PROTOCOL_COUNTER_FLUSH_INTERVAL', 5.0))  # Seconds between protocol counter writes
+    PROTOCOL_COUNTER_TTL = int(os.getenv('PROTOCOL_COUNTER_TTL', 86400))  # Seconds a protocol counter is kept after its last write
+
+    # RPC CONFIG
+    RPC_MAX_CONCURRENCY = int(os.getenv('RPC_MAX_CONCURRENCY', 16))  # Per endpoint
+    RPC_TIMEOUT = float(os.getenv('RPC_TIMEOUT', 30))  # Seconds
+    RPC_MAX_RETRIES = int(os.getenv('RPC_MAX_RETRIES', 3))
+    RPC_RETRY_BACKOFF = float(os.getenv('RPC_RETRY_BACKOFF', 0.5))  # Seconds, doubled per retry
+    RPC_BATCH_SIZE = int(os.getenv('RPC_BATCH_SIZE', 50))  # Max requests per JSON-RPC batch array
+    RPC_BATCH_WINDOW = float(os.getenv('RPC_BATCH_WINDOW', 0.01))  # Seconds to coalesce requests before sending
+
+    # ABI FETCH CONFIG
+    ABI_FETCH_RATE = float(os.getenv('ABI_FETCH_RATE', 5))  # Explorer requests per second, per API key
+    ABI_FETCH_BURST = int(os.getenv('ABI_FETCH_BURST', 5))  # Requests allowed back to back before rate limiting
+    ABI_MISS_BACKOFF = int(os.getenv('ABI_MISS_BACKOFF', 3600))  # Seconds before retrying an unverified contract, doubled per miss
+    ABI_MISS_MAX_BACKOFF = int(os.getenv('ABI_MISS_MAX_BACKOFF', 604800))  # Upper bound on the retry delay
+
     # NEO4J CONFIG
     NEO4J_URI = os.getenv('NEO4J_URI')
     NEO4J_DB_NAME = os.getenv('NEO4J_DB_NAME')
@@ -1,12 +1,14 @@
 from .mongodb import MongoDatabase, MongoInsertOperations, MongoQueryOperations, MongoDBOperator
-from .sql import SQLDatabase, SQLInsertOperations, SQLQueryOperations, SQLOperator
+from .sql import SQLDatabase, SQLInsertOperations, SQLQueryOperations, SQLOperator, AsyncSQLDatabase, AsyncSQLOperator, run_sql, PartitionManager
 from .neo4j import Neo4jDB, Neo4jInsertOps, Neo4jQueryOps, Neo4jOperator
 from .clickhouse import ClickHouseDB, ClickHouseInsertOps, ClickHouseQueryOps, ClickHouseOperator
 from .operator import DatabaseOperator  
+from .archive import SegmentArchive
 
 __all__ = [
           'MongoDatabase', 'MongoInsertOperations', 'MongoQueryOperations', 'MongoDBOperator',
           'SQLDatabase', 'SQLInsertOperations', 'SQLQueryOperations', 'SQLOperator',
+          'AsyncSQLDatabase', 'AsyncSQLOperator', 'run_sql', 'PartitionManager',
           'Neo4jDB', 'Neo4jInsertOps', 'Neo4jQueryOps', 'Neo4jOperator',
-          'DatabaseOperator'
+          'DatabaseOperator', 'SegmentArchive'
            ]
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .segment_archive import SegmentArchive
+
+__all__ = ['SegmentArchive']
@@ -0,0 +1,272 @@
+import logging
+import mmap
+import os
+import struct
+import threading
+from config import Settings
+from ..mongodb.codecs import GzipJSONCodec, ZstdMsgpackCodec
+
+logger = logging.getLogger(__name__)
+
+# Segment header: magic followed by the name of the codec its payloads are encoded with
+MAGIC = b'RAWSEG1\n'
+HEADER = struct.Struct('<8s16s')
+# Index entry: block number, payload offset in the segment, payload length
+ENTRY = struct.Struct('<QQI')
+
+
+def _open_codec(name: str):
+    if name == GzipJSONCodec.name:
+        return GzipJSONCodec()
+    if name == ZstdMsgpackCodec.name:
+        # No trained dictionary, so a segment can be read without the database
+        return ZstdMsgpackCodec(None, dict_samples=0)
+    raise ValueError(f"Unknown archive codec: {name}")
+
+
+class _Segment:
+    """
+    One segment: a data file of concatenated payloads and an index file of
+    fixed-size entries locating each payload. The index is only parsed into
+    memory while the segment is being read.
+    """
+    def __init__(self, path: str, seq: int):
+        self.seq = seq
+        self.data_path = os.path.join(path, f'{seq:08d}.seg')
+        self.index_path = os.path.join(path, f'{seq:08d}.idx')
+        self.codec_name = None
+        self.first = None
+        self.last = None
+        self.entries = None
+        self._map = None
+
+    def create(self, codec_name: str):
+        with open(self.data_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, codec_name.encode()))
+        open(self.index_path, 'wb').close()
+        self.codec_name = codec_name
+        self.entries = {}
+
+    def scan(self):
+        """
+        Read the header and the block range, dropping a torn index entry or
+        entries pointing past the data written before a crash.
+        """
+        with open(self.data_path, 'rb') as f:
+            magic, codec_name = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{self.data_path} is not an archive segment")
+        self.codec_name = codec_name.rstrip(b'\0').decode()
+        for block_number, _, _ in self._read_index():
+            self._extend(block_number)
+
+    def _read_index(self):
+        data_size = os.path.getsize(self.data_path)
+        index_size = os.path.getsize(self.index_path)
+        valid = index_size - index_size % ENTRY.size
+        if not valid:
+            return
+        with open(self.index_path, 'rb') as f, mmap.mmap(f.fileno(), valid, access=mmap.ACCESS_READ) as index:
+            for entry in ENTRY.iter_unpack(index):
+                if entry[1] + entry[2] <= data_size:
+                    yield entry
+
+    def _extend(self, block_number: int):
+        if self.first is None or block_number < self.first:
+            self.first = block_number
+        if self.last is None or block_number > self.last:
+            self.last = block_number
+
+    def load(self) -> dict:
+        """Block number -> (offset, length), the last entry for a block wins."""
+        if self.entries is None:
+            self.entries = {block_number: (offset, length) for block_number, offset, length in self._read_index()}
+        return self.entries
+
+    def unload(self):
+        self.entries = None
+        self.close()
+
+    def add(self, block_number: int, offset: int, length: int):
+        self._extend(block_number)
+        if self.entries is not None:
+            self.entries[block_number] = (offset, length)
+
+    def view(self, offset: int, length: int) -> memoryview:
+        """Zero-copy view of a payload, remapping once the file has grown past the mapping."""
+        if self._map is None or len(self._map) < offset + length:
+            self.close()
+            with open(self.data_path, 'rb') as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(self._map)[offset:offset + length]
+
+    def overlaps(self, start: int, end: int) -> bool:
+        return self.first is not None and self.first <= end and self.last >= start
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+class SegmentArchive:
+    """
+    Append-only local archive of raw blocks for one chain.
+
+    Payloads are appended to segment files under `root/<chain>/`, with an
+    offset index written next to each segment, and read back through mmap.
+    A segment is closed for writing once it reaches `segment_bytes`.
+    Appending a block again (a reorg or a replay) shadows the earlier copy.
+
+    Views returned by `raw` point into the mapped file and must be released
+    before the archive is closed.
+    """
+    def __init__(self, chain: str, root: str = None, segment_bytes: int = None, codec: str = None):
+        self.chain = chain
+        self.path = os.path.join(root or Settings.ARCHIVE_DIR, chain)
+        self.segment_bytes = segment_bytes or Settings.ARCHIVE_SEGMENT_BYTES
+        self.codec_name = codec or Settings.ARCHIVE_CODEC
+        self.logger = logger
+
+        self._lock = threading.Lock()
+        self._codecs = {}
+        self._data_file = None
+        self._index_file = None
+
+        os.makedirs(self.path, exist_ok=True)
+        self.segments = []
+        for name in sorted(os.listdir(self.path)):
+            if name.endswith('.seg'):
+                segment = _Segment(self.path, int(name[:-4]))
+                segment.scan()
+                self.segments.append(segment)
+
+        # Metrics
+        self.appended = 0
+        self.appended_bytes = 0
+        self.read = 0
+
+    def _codec(self, name: str):
+        codec = self._codecs.get(name)
+        if codec is None:
+            codec = self._codecs[name] = _open_codec(name)
+        return codec
+
+    def append(self, block_number: int, value):
+        """
+        Encode and append a block's payload.
+        """
+        payload, _ = self._codec(self.codec_name).encode(self.chain, value)
+        with self._lock:
+            segment = self._writable_segment()
+            offset = self._data_file.tell()
+            self._data_file.write(payload)
+            self._data_file.flush()
+            # The payload is written before its index entry, so a crash leaves no entry without data
+            self._index_file.write(ENTRY.pack(block_number, offset, len(payload)))
+            self._index_file.flush()
+            segment.add(block_number, offset, len(payload))
+            self.appended += 1
+            self.appended_bytes += len(payload)
+
+    def _writable_segment(self) -> _Segment:
+        segment = self.segments[-1] if self.segments else None
+        if self._data_file is None and segment is not None and segment.codec_name == self.codec_name:
+            self._open_for_append(segment)
+        if self._data_file is None or self._data_file.tell() >= self.segment_bytes:
+            self._close_files()
+            segment = _Segment(self.path, segment.seq + 1 if segment else 0)
+            segment.create(self.codec_name)
+            self.segments.append(segment)
+            self._open_for_append(segment)
+        return segment
+
+    def _open_for_append(self, segment: _Segment):
+        # Drop a torn index entry left by a crash so new entries stay aligned
+        index_size = os.path.getsize(segment.index_path)
+        if index_size % ENTRY.size:
+            os.truncate(segment.index_path, index_size - index_size % ENTRY.size)
+        self._data_file = open(segment.data_path, 'ab')
+        self._index_file = open(segment.index_path, 'ab')
+
+    def raw(self, block_number: int):
+        """
+        Zero-copy view of a block's encoded payload and the codec name to decode it with,
+        None if the block is not archived.
+        """
+        for segment in reversed(self.segments):
+            if segment.overlaps(block_number, block_number):
+                location = segment.load().get(block_number)
+                if location is not None:
+                    return segment.view(*location), segment.codec_name
+        return None
+
+    def get(self, block_number: int):
+        """
+        A block's decoded payload, None if it is not archived.
+        """
+        found = self.raw(block_number)
+        if found is None:
+            return None
+        view, codec_name = found
+        try:
+            self.read += 1
+            return self._codec(codec_name).decode(view)
+        finally:
+            view.release()
+
+    def iter_range(self, start: int, end: int, window: int = 10000):
+        """
+        Yield (block_number, payload) for the archived blocks in start..end in
+        block order. Segments are indexed a window of blocks at a time and
+        released once passed, so memory stays flat over long ranges.
+        """
+        for window_start in range(start, end + 1, window):
+            window_end = min(window_start + window - 1, end)
+            located = {}
+            # Later segments shadow earlier copies of a block
+            for segment in self.segments:
+                if segment.overlaps(window_start, window_end):
+                    for block_number, location in list(segment.load().items()):
+                        if window_start <= block_number <= window_end:
+                            located[block_number] = (segment, location)
+            for block_number in sorted(located):
+                segment, location = located[block_number]
+                view = segment.view(*location)
+                try:
+                    self.read += 1
+                    yield block_number, self._codec(segment.codec_name).decode(view)
+                finally:
+                    view.release()
+            for segment in self.segments:
+                if segment.last is not None and segment.last <= window_end and segment is not self.segments[-1]:
+                    segment.unload()
+
+    def block_range(self):
+        """The lowest and highest archived block numbers, None if the archive is empty."""
+        firsts = [segment.first for segment in self.segments if segment.first is not None]
+        if not firsts:
+            return None
+        return min(firsts), max(segment.last for segment in self.segments if segment.last is not None)
+
+    def _close_files(self):
+        for f in (self._data_file, self._index_file):
+            if f is not None:
+                f.close()
+        self._data_file = self._index_file = None
+
+    def close(self):
+        with self._lock:
+            self._close_files()
+            for segment in self.segments:
+                segment.close()
+
+    def stats(self) -> dict:
+        """Snapshot of the archive's segments and counters."""
+        return {
+            "network": self.chain,
+            "segments": len(self.segments),
+            "appended": self.appended,
+            "appended_bytes": self.appended_bytes,
+            "read": self.read,
+        }
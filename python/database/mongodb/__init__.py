@@ -2,5 +2,7 @@ from .base import MongoDatabase
 from .insert_ops import MongoInsertOperations
 from .query_ops import MongoQueryOperations
 from .operator import MongoDBOperator
+from .codecs import RawCodecs, GzipJSONCodec, ZstdMsgpackCodec
+from .buffered_writer import BufferedMongoWriter, WriterClosedError
 
-__all__ = ['MongoDatabase', 'MongoInsertOperations', 'MongoQueryOperations', 'MongoDBOperator']
\ No newline at end of file
+__all__ = ['MongoDatabase', 'MongoInsertOperations', 'MongoQueryOperations', 'MongoDBOperator', 'RawCodecs', 'GzipJSONCodec', 'ZstdMsgpackCodec', 'BufferedMongoWriter', 'WriterClosedError']
\ No newline at end of file
@@ -2,6 +2,7 @@ from pymongo import MongoClient
 from pymongo.server_api import ServerApi
 import logging
 from config import Settings
+from .buffered_writer import BufferedMongoWriter
 
 logger = logging.getLogger(__name__)
 
@@ -9,6 +10,7 @@ class MongoDatabase:
     def __init__(self):
         self.client = MongoClient(Settings.MONGO_URI, 27017)
         self.db = self.client[Settings.MONGO_DB_NAME]
+        self._writer = None
         logger.info(f"Connected to MongoDB database: {Settings.MONGO_DB_NAME}")
         
         # Ensure indexes are created
@@ -20,10 +22,21 @@ class MongoDatabase:
         """
         return self.db[collection_name]
 
+    @property
+    def writer(self) -> BufferedMongoWriter:
+        """
+        Buffered writer shared by every chain writing to this database.
+        """
+        if self._writer is None:
+            self._writer = BufferedMongoWriter(self)
+        return self._writer
+
     def close(self):
         """
-        Close the MongoDB connection.
+        Flush buffered writes and close the MongoDB connection.
         """
+        if self._writer is not None:
+            self._writer.close()
         self.client.close()
         logger.info("MongoDB connection closed.")
 
@@ -40,6 +53,8 @@ class MongoDatabase:
                 # Create indexes
                 collection.create_index("block_number", unique=True)
                 collection.create_index("timestamp")  # For potential TTL or queries by time
+                # Decoded transactions are upserted on block and hash
+                self.get_collection(f"{collection_name}_transactions").create_index([("block_number", 1), ("transaction_hash", 1)])
                 logger.info(f"Indexes created for collection: {collection_name}")
         except Exception as e:
             logger.error(f"Error creating indexes: {e}")
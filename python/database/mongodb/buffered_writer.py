@@ -0,0 +1,209 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from pymongo import ReplaceOne
+from pymongo.errors import BulkWriteError
+from pymongo.write_concern import WriteConcern
+from config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+class WriterClosedError(RuntimeError):
+    """
+    Raised when a document is written to a writer that was already closed.
+    """
+
+
+class BufferedMongoWriter:
+    """
+    Buffers documents from every chain and writes them in unordered bulk
+    upserts from a background thread.
+
+    A batch is written once `flush_size` documents are buffered or every
+    `flush_interval` seconds, whichever comes first. Documents are upserted
+    on their key, so replaying a block after a restart replaces it instead
+    of failing on a duplicate, and a document buffered twice is written
+    once. Callers wait once `max_pending` documents are buffered, so a slow
+    database pushes back instead of growing the buffer.
+
+    Documents whose write fails are buffered again for the next flush, up
+    to `max_retries` more times, unless a newer version was buffered since.
+    Once closed, the writer rejects further documents.
+    """
+    def __init__(self, mongodb, flush_size: int = None, flush_interval: float = None, max_pending: int = None,
+                 write_concern: WriteConcern = None, max_retries: int = None):
+        self.mongodb = mongodb
+        self.flush_size = flush_size or Settings.MONGO_FLUSH_SIZE
+        self.flush_interval = flush_interval or Settings.MONGO_FLUSH_INTERVAL
+        self.max_pending = max_pending or Settings.MONGO_MAX_PENDING
+        self.max_retries = Settings.MONGO_WRITE_RETRIES if max_retries is None else max_retries
+        w = Settings.MONGO_WRITE_CONCERN
+        self.write_concern = write_concern or WriteConcern(w=int(w) if w.isdigit() else w, j=Settings.MONGO_JOURNAL)
+        self.logger = logger
+
+        self._condition = threading.Condition()
+        # collection -> {key: (filter, document, failed attempts)}
+        self._buffers = defaultdict(dict)
+        self._pending = 0
+        self._closed = False
+        # Held for a whole flush, so flush() returns only once earlier writes are in the database
+        self._flush_lock = threading.Lock()
+        self._thread = None
+
+        # Metrics
+        self.flushes = 0
+        self.written = 0
+        self.failed = 0
+        self.retried = 0
+        self.dropped = 0
+        self.flush_time = 0.0
+        self.max_flush_time = 0.0
+        self.last_flush_size = 0
+
+    def write(self, collection_name: str, key: dict, document: dict):
+        """
+        Buffer a document to be upserted into a collection on `key`.
+        Raises WriterClosedError once the writer is closed.
+        """
+        buffer_key = tuple(key.items())
+        with self._condition:
+            self._start()
+            while self._pending >= self.max_pending and not self._closed:
+                self._condition.wait()
+            if self._closed:
+                raise WriterClosedError(f"MongoDB writer is closed, {collection_name} document {key} not written")
+            buffer = self._buffers[collection_name]
+            if buffer_key not in buffer:
+                self._pending += 1
+            buffer[buffer_key] = (key, {**key, **document}, 0)
+            if self._pending >= self.flush_size:
+                self._condition.notify_all()
+
+    def flush(self) -> bool:
+        """
+        Write everything buffered so far, returning once it is in the database.
+        Returns False if any document failed, whether it was buffered again
+        or dropped, including by a flush that was running meanwhile.
+        """
+        failures = self.failed
+        with self._flush_lock:
+            with self._condition:
+                buffers, self._buffers = self._buffers, defaultdict(dict)
+                size, self._pending = self._pending, 0
+                self._condition.notify_all()
+            if not size:
+                return self.failed == failures
+
+            started = time.perf_counter()
+            failed = {}
+            for collection_name, buffer in buffers.items():
+                entries = self._write_batch(collection_name, list(buffer.values()))
+                if entries:
+                    failed[collection_name] = entries
+            if failed:
+                self._rebuffer(failed)
+            elapsed = time.perf_counter() - started
+
+            self.flushes += 1
+            self.last_flush_size = size
+            self.flush_time += elapsed
+            self.max_flush_time = max(self.max_flush_time, elapsed)
+            self.logger.debug(f"Flushed {size} documents to MongoDB in {elapsed * 1000:.1f} ms")
+        return self.failed == failures
+
+    def _write_batch(self, collection_name: str, entries: list) -> list:
+        """
+        Upsert a collection's entries, returning the ones that failed.
+        """
+        collection = self.mongodb.get_collection(collection_name).with_options(write_concern=self.write_concern)
+        try:
+            result = collection.bulk_write(
+                [ReplaceOne(key, document, upsert=True) for key, document, _ in entries],
+                ordered=False
+            )
+            self.written += result.upserted_count + result.matched_count
+            return []
+        except BulkWriteError as e:
+            errors = e.details.get("writeErrors", [])
+            self.written += len(entries) - len(errors)
+            self.failed += len(errors)
+            self.logger.error(f"{len(errors)} of {len(entries)} writes to {collection_name} failed: {errors[:1]}")
+            return [entries[error["index"]] for error in errors]
+        except Exception as e:
+            self.failed += len(entries)
+            self.logger.error(f"Error writing {len(entries)} documents to {collection_name} in MongoDB: {e}")
+            return entries
+
+    def _rebuffer(self, failed: dict):
+        """
+        Buffer failed entries again for the next flush, dropping those out of retries.
+        """
+        with self._condition:
+            for collection_name, entries in failed.items():
+                buffer = self._buffers[collection_name]
+                for key, document, attempts in entries:
+                    buffer_key = tuple(key.items())
+                    if buffer_key in buffer:
+                        continue  # Replaced by a newer version meanwhile
+                    if attempts >= self.max_retries:
+                        self.dropped += 1
+                        self.logger.error(f"Dropping {collection_name} document {key} after {attempts + 1} failed writes")
+                        continue
+                    buffer[buffer_key] = (key, document, attempts + 1)
+                    self._pending += 1
+                    self.retried += 1
+
+    def _start(self):
+        """
+        Start the flush thread on first use, called with the condition held.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='mongo-writer', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self._closed and self._pending < self.flush_size:
+                    self._condition.wait(self.flush_interval)
+                closed = self._closed
+            self.flush()
+            if closed:
+                # Failed documents get their remaining retries before the thread exits
+                while self._pending:
+                    self.flush()
+                return
+
+    def close(self):
+        """
+        Flush what is buffered and stop the flush thread.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        else:
+            while self._pending:
+                self.flush()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def stats(self) -> dict:
+        """Snapshot of the writer's buffer and flush latency."""
+        return {
+            "pending": self._pending,
+            "flushes": self.flushes,
+            "written": self.written,
+            "failed": self.failed,
+            "retried": self.retried,
+            "dropped": self.dropped,
+            "last_flush_size": self.last_flush_size,
+            "avg_flush_ms": self.flush_time / self.flushes * 1000 if self.flushes else 0.0,
+            "max_flush_ms": self.max_flush_time * 1000,
+        }
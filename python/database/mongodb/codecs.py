@@ -0,0 +1,201 @@
+import gzip
+import json
+import logging
+import threading
+from config import Settings
+
+logger = logging.getLogger(__name__)
+
+# Documents written before codecs were recorded are gzip-compressed JSON
+DEFAULT_CODEC = 'gzip-json'
+
+# msgpack extension type for integers beyond 64 bits (uint256 amounts)
+_BIG_INT = 1
+
+
+class GzipJSONCodec:
+    """
+    JSON text compressed with gzip, the original archive format.
+    """
+    name = 'gzip-json'
+
+    def __init__(self, mongodb=None):
+        pass
+
+    def encode(self, network: str, value) -> tuple:
+        """
+        Encode a value, returning the bytes and the id of the dictionary used (always None).
+        """
+        return gzip.compress(json.dumps(value).encode('utf-8')), None
+
+    def decode(self, data: bytes, dict_id: int = None):
+        return json.loads(gzip.decompress(data).decode('utf-8'))
+
+
+class ZstdMsgpackCodec:
+    """
+    msgpack compressed with zstd, using a dictionary trained per chain.
+
+    Blocks of one chain share most of their keys and many values, which
+    compress poorly one block at a time. The first `dict_samples` payloads
+    of a chain are compressed without a dictionary and kept as training
+    samples. A dictionary is then trained on them and stored in the
+    raw_codec_dictionaries collection, and every later payload records the
+    id of the dictionary it was compressed with. 0 samples disables training.
+    Without a database dictionaries only live in memory.
+
+    Needs the optional zstandard and msgpack packages.
+    """
+    name = 'zstd-msgpack'
+
+    def __init__(self, mongodb, level: int = None, dict_size: int = None, dict_samples: int = None):
+        import msgpack
+        import zstandard
+        self.msgpack = msgpack
+        self.zstd = zstandard
+        self.mongodb = mongodb
+        self.level = level or Settings.ZSTD_LEVEL
+        self.dict_size = dict_size or Settings.ZSTD_DICT_SIZE
+        self.dict_samples = dict_samples if dict_samples is not None else Settings.ZSTD_DICT_SAMPLES
+        self.logger = logger
+
+        # Encoding runs in worker threads
+        self._lock = threading.Lock()
+        self._dictionaries = {}  # dict_id -> ZstdCompressionDict
+        self._active = {}  # network -> dictionary used for new payloads, None until trained
+        self._samples = {}  # network -> payloads collected for training
+
+    def encode(self, network: str, value) -> tuple:
+        """
+        Encode a value, returning the bytes and the id of the dictionary used, None if there was none.
+        """
+        packed = self.msgpack.packb(value, default=self._pack_default)
+        dictionary = self._dictionary_for(network, packed)
+        if dictionary is None:
+            return self.zstd.ZstdCompressor(level=self.level).compress(packed), None
+        return self.zstd.ZstdCompressor(level=self.level, dict_data=dictionary).compress(packed), dictionary.dict_id()
+
+    def decode(self, data: bytes, dict_id: int = None):
+        if dict_id is None:
+            decompressor = self.zstd.ZstdDecompressor()
+        else:
+            decompressor = self.zstd.ZstdDecompressor(dict_data=self._load_dictionary(dict_id))
+        return self.msgpack.unpackb(decompressor.decompress(data), ext_hook=self._unpack_ext, strict_map_key=False)
+
+    def _pack_default(self, value):
+        if isinstance(value, int):
+            return self.msgpack.ExtType(_BIG_INT, value.to_bytes((value.bit_length() + 8) // 8, 'big', signed=True))
+        raise TypeError(f"Cannot archive value of type {type(value).__name__}")
+
+    @staticmethod
+    def _unpack_ext(code: int, data: bytes):
+        if code == _BIG_INT:
+            return int.from_bytes(data, 'big', signed=True)
+        raise ValueError(f"Unknown archive extension type {code}")
+
+    def _dictionary_for(self, network: str, packed: bytes):
+        """
+        The dictionary new payloads of a chain are compressed with, collecting
+        the payload as a training sample until there is one.
+        """
+        with self._lock:
+            if network not in self._active:
+                self._active[network] = self._load_latest_dictionary(network)
+            dictionary = self._active[network]
+            if dictionary is not None or not self.dict_samples:
+                return dictionary
+            samples = self._samples.setdefault(network, [])
+            samples.append(packed)
+            if len(samples) < self.dict_samples:
+                return None
+            del self._samples[network]
+        # Trained outside the lock, encoding for other chains carries on meanwhile
+        dictionary = self._train(network, samples)
+        with self._lock:
+            self._active[network] = dictionary
+        return dictionary
+
+    def _train(self, network: str, samples: list):
+        try:
+            dictionary = self.zstd.train_dictionary(self.dict_size, samples, level=self.level)
+            dictionary.precompute_compress(level=self.level)
+            if self.mongodb is not None:
+                self.mongodb.get_collection('raw_codec_dictionaries').insert_one({
+                    "network": network,
+                    "dict_id": dictionary.dict_id(),
+                    "dictionary": dictionary.as_bytes(),
+                    "samples": len(samples),
+                })
+            self._dictionaries[dictionary.dict_id()] = dictionary
+            self.logger.info(f"Trained {len(dictionary.as_bytes())} byte zstd dictionary {dictionary.dict_id()} for {network} on {len(samples)} payloads")
+            return dictionary
+        except Exception as e:
+            # Carry on without a dictionary rather than retrying on every payload
+            self.logger.error(f"Error training zstd dictionary for {network}: {e}")
+            return None
+
+    def _load_latest_dictionary(self, network: str):
+        if self.mongodb is None:
+            return None
+        document = self.mongodb.get_collection('raw_codec_dictionaries').find_one(
+            {"network": network}, sort=[("_id", -1)]
+        )
+        if document is None:
+            return None
+        return self._cache_dictionary(document)
+
+    def _load_dictionary(self, dict_id: int):
+        dictionary = self._dictionaries.get(dict_id)
+        if dictionary is None:
+            if self.mongodb is None:
+                raise ValueError(f"zstd dictionary {dict_id} not found")
+            document = self.mongodb.get_collection('raw_codec_dictionaries').find_one({"dict_id": dict_id})
+            if document is None:
+                raise ValueError(f"zstd dictionary {dict_id} not found")
+            dictionary = self._cache_dictionary(document)
+        return dictionary
+
+    def _cache_dictionary(self, document):
+        dictionary = self.zstd.ZstdCompressionDict(document["dictionary"])
+        dictionary.precompute_compress(level=self.level)
+        self._dictionaries[document["dict_id"]] = dictionary
+        return dictionary
+
+
+class RawCodecs:
+    """
+    The archive codecs of one MongoDB database. New payloads are written with
+    the codec named by Settings.RAW_CODEC, stored payloads are read with the
+    codec recorded in their document.
+    """
+    _classes = {codec.name: codec for codec in (GzipJSONCodec, ZstdMsgpackCodec)}
+
+    def __init__(self, mongodb, writer: str = None):
+        self.mongodb = mongodb
+        self._codecs = {}
+        self.writer = self.get(writer or Settings.RAW_CODEC)
+
+    def get(self, name: str):
+        codec = self._codecs.get(name)
+        if codec is None:
+            codec_class = self._classes.get(name)
+            if codec_class is None:
+                raise ValueError(f"Unknown raw archive codec: {name}")
+            codec = self._codecs[name] = codec_class(self.mongodb)
+        return codec
+
+    def encode(self, network: str, value, field: str) -> dict:
+        """
+        Encode a value with the writer codec, returning the document fields holding it in `field`.
+        """
+        data, dict_id = self.writer.encode(network, value)
+        fields = {"codec": self.writer.name, field: data}
+        if dict_id is not None:
+            fields["dict_id"] = dict_id
+        return fields
+
+    def decode(self, document: dict, field: str):
+        """
+        Decode a document's payload field with the codec it was written with.
+        """
+        return self.get(document.get("codec", DEFAULT_CODEC)).decode(document[field], document.get("dict_id"))
@@ -1,29 +1,28 @@
-import gzip
 import logging
 from .base import MongoDatabase
-import json
-from pymongo.errors import BulkWriteError
+from .codecs import RawCodecs
+from .buffered_writer import WriterClosedError
 
 class MongoInsertOperations:
-    def __init__(self, mongodb: MongoDatabase):
+    def __init__(self, mongodb: MongoDatabase, codecs: RawCodecs = None):
         self.mongodb = mongodb
+        self.codecs = codecs or RawCodecs(mongodb)
         self.logger = logging.getLogger(__name__)
 
-    def _compress_data(self, block_data):
+    def _compress_data(self, data, network, field):
         """
-        Compress block data using gzip.
+        Encode data with the configured archive codec, returning the document fields holding it.
         """
         try:
-            json_str = json.dumps(block_data)
-            compressed_data = gzip.compress(json_str.encode('utf-8'))
-            return compressed_data
+            return self.codecs.encode(network, data, field)
         except Exception as e:
             self.logger.debug(f"Error compressing block data: {e}")
             return None
 
     def insert_block(self, block_data, network, block_number, timestamp):
         """
-        Insert a compressed block into the MongoDB collection with basic metadata.
+        Buffer a compressed block for the MongoDB collection with basic metadata.
+        Blocks are upserted on their number, so replayed blocks replace the stored copy.
         :param block_data: The raw block data as a JSON/dict string.
         :param block_number: The block number.
         :param timestamp: The block's timestamp.
@@ -38,68 +37,79 @@ class MongoInsertOperations:
             if not network or not isinstance(network, str):
                 raise ValueError("Invalid network name provided for MongoDB collection.")
 
-            # Retrieve the collection for the network
-            collection = self.mongodb.get_collection(network)
-
             # Compress the block data
-            compressed_data = self._compress_data(block_data)
+            compressed_data = self._compress_data(block_data, network, "compressed_data")
             if compressed_data is None:
                 return
 
 
-            # Insert document into MongoDB
+            # Buffer the document, the writer upserts it with other chains' documents
             document = {
-                "block_number": block_number,
                 "timestamp": timestamp,
-                "compressed_data": compressed_data,
+                **compressed_data,
             }
-            collection.insert_one(document)
+            self.mongodb.writer.write(network, {"block_number": block_number}, document)
 
-            self.logger.info(f"Successfully inserted block {block_number} into {network} collection in MongoDB.")
+            self.logger.info(f"Buffered block {block_number} for {network} collection in MongoDB.")
+        except WriterClosedError:
+            raise
         except Exception as e:
             self.logger.error(f"Error inserting block {block_number} into {network} collection in MongoDB: {e}")
     
     def insert_evm_transactions(self, transactions, network, block_number, timestamp):
         """
-        Bulk insert for EVM transactions, skipping any that fail compression.
+        Buffer EVM transactions for a bulk upsert, skipping any that fail compression.
         """
-        collection = self.mongodb.get_collection(f'{network}_transactions')
+        collection_name = f'{network}_transactions'
         
         # Filter and prepare documents, skipping any compression failures
-        documents = []
+        documents = 0
         for tx_hash, logs in transactions.items():
             if not logs:
                 continue
             
             try:
-                compressed_data = self._compress_data(logs)
+                compressed_data = self._compress_data(logs, network, "compressed_logs")
                 if compressed_data is None:
                     continue
-                documents.append({
-                    "block_number": block_number,
-                    "timestamp": timestamp,
-                    "network": network,
-                    "transaction_hash": tx_hash,
-                    "compressed_logs": compressed_data
-                })
+                self.mongodb.writer.write(
+                    collection_name,
+                    {"block_number": block_number, "transaction_hash": tx_hash},
+                    {
+                        "timestamp": timestamp,
+                        "network": network,
+                        **compressed_data
+                    }
+                )
+                documents += 1
+            except WriterClosedError:
+                raise
             except Exception as e:
                 self.logger.debug(f"Error compressing block data: {str(e)}")
                 continue  # Skip any compression failures
         
-        if not documents:
-            return
-        
+        self.logger.info(
+            f"Block {block_number} buffered {documents} of {len(transactions)} transactions for {network}"
+        )
+
+    def delete_blocks(self, network, block_numbers):
+        """
+        Delete blocks and their decoded transactions, used to roll back reorged blocks.
+        """
         try:
-            # Bulk insert only the successfully compressed documents
-            result = collection.insert_many(documents, ordered=False)
+            # Buffered writes for these blocks must land before they are deleted
+            self.mongodb.writer.flush()
+            block_numbers = list(block_numbers)
+            blocks = self.mongodb.get_collection(network).delete_many({"block_number": {"$in": block_numbers}})
+            transactions = self.mongodb.get_collection(f'{network}_transactions').delete_many({"block_number": {"$in": block_numbers}})
             self.logger.info(
-                f"Block {block_number} bulk insert stats for {network}: "
-                f"Inserted: {len(result.inserted_ids)}, "
-                f"Total Processed: {len(transactions)}"
+                f"Deleted {blocks.deleted_count} blocks and {transactions.deleted_count} transactions "
+                f"from {network} collections in MongoDB."
             )
-            
+            return True
         except Exception as e:
-            self.logger.debug(f"Error during bulk insert for block {block_number}: {str(e)}")
+            self.logger.error(f"Error deleting blocks {block_numbers} from {network} collections in MongoDB: {e}")
+            return False
 
 def decode_hex(value):
     """
@@ -1,10 +1,13 @@
 from .base import MongoDatabase
 from .query_ops import MongoQueryOperations
 from .insert_ops import MongoInsertOperations
+from .codecs import RawCodecs
 
 class MongoDBOperator:
     def __init__(self, db: MongoDatabase):
         self.db = db
-        self.query = MongoQueryOperations(self.db)
-        self.insert = MongoInsertOperations(self.db)
+        # One set of codecs so reads reuse the dictionaries loaded for writes
+        self.codecs = RawCodecs(self.db)
+        self.query = MongoQueryOperations(self.db, self.codecs)
+        self.insert = MongoInsertOperations(self.db, self.codecs)
 
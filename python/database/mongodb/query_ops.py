@@ -1,19 +1,19 @@
-import gzip
 import logging
 from .base import MongoDatabase
-import json
+from .codecs import RawCodecs
 
 class MongoQueryOperations:
-    def __init__(self, mongodb: MongoDatabase):
+    def __init__(self, mongodb: MongoDatabase, codecs: RawCodecs = None):
         self.mongodb = mongodb
+        self.codecs = codecs or RawCodecs(mongodb)
         self.logger = logging.getLogger(__name__)
 
-    def _decompress_data(self, compressed_data):
+    def _decompress_data(self, document, field):
         """
-        Decompress gzip-compressed block data.
+        Decode a document's archived data with the codec it was written with.
         """
         try:
-            decompressed_data = json.loads(gzip.decompress(compressed_data).decode('utf-8'))
+            decompressed_data = self.codecs.decode(document, field)
             return decompressed_data
         except Exception as e:
             self.logger.error(f"Error decompressing block data: {e}")
@@ -40,7 +40,7 @@ class MongoQueryOperations:
                 self.logger.info(f"Retrieved block {block_number} from {network} collection in MongoDB.")
                 # Decompress the block data if specified
                 if decompress:
-                    raw_block_data = self._decompress_data(document["compressed_data"])
+                    raw_block_data = self._decompress_data(document, "compressed_data")
                     return {
                         "block_number": document["block_number"],
                         "timestamp": document["timestamp"],
@@ -89,7 +89,7 @@ class MongoQueryOperations:
                     decompressed_blocks.append({
                         "block_number": block["block_number"],
                         "timestamp": block["timestamp"],
-                        "raw_block_data": self._decompress_data(block["compressed_data"])
+                        "raw_block_data": self._decompress_data(block, "compressed_data")
                     })
                 return decompressed_blocks
 
@@ -118,7 +118,7 @@ class MongoQueryOperations:
                         "block_number": transaction["block_number"],
                         "transaction_hash": transaction.get("transaction_hash"),
                         "timestamp": transaction["timestamp"],
-                        "raw_data": self._decompress_data(transaction["compressed_logs"])
+                        "raw_data": self._decompress_data(transaction, "compressed_logs")
                     })
                 self.logger.info(f"Retrieved {len(transaction_list)} transactions from {network} collection in MongoDB for block {block_number}")
                 return decompressed_transactions
@@ -139,7 +139,7 @@ class MongoQueryOperations:
                         "block_number": transaction["block_number"],
                         "transaction_hash": transaction["transaction_hash"],
                         "timestamp": transaction["timestamp"],
-                        "log_data": self._decompress_data(transaction["compressed_logs"])
+                        "log_data": self._decompress_data(transaction, "compressed_logs")
                     } for transaction in transaction_list
                 ]
                 self.logger.info(f"Retrieved {len(transaction_list)} recent transactions from {network} collection in MongoDB")
@@ -1,9 +1,14 @@
 from .mongodb.operator import MongoDBOperator
-from .sql.operator import SQLOperator
+from .sql.operator import SQLOperator, AsyncSQLOperator
+from .sql.async_base import AsyncSQLDatabase
+from config.settings import Settings
 
 class DatabaseOperator:
     def __init__(self, sql_db: str, mongo_db: str):
         self.sql_db = sql_db
         self.mongo_db = mongo_db
-        self.sql = SQLOperator(self.sql_db)
+        if Settings.SQL_BACKEND == 'asyncpg':
+            self.sql = AsyncSQLOperator(AsyncSQLDatabase.shared(), self.sql_db)
+        else:
+            self.sql = SQLOperator(self.sql_db)
         self.mongodb = MongoDBOperator(self.mongo_db)
@@ -1,11 +1,17 @@
 from .base import SQLDatabase
+from .async_base import AsyncSQLDatabase
 from .operations.insert_ops import SQLInsertOperations
 from .operations.query_ops import SQLQueryOperations
-from .operator import SQLOperator
+from .operator import SQLOperator, AsyncSQLOperator, run_sql
+from .partitions import PartitionManager
 
 __all__ = [
     'SQLDatabase',
     'SQLInsertOperations',
     'SQLQueryOperations',
-    'SQLOperator'
+    'SQLOperator',
+    'AsyncSQLDatabase',
+    'AsyncSQLOperator',
+    'run_sql',
+    'PartitionManager'
 ]
\ No newline at end of file
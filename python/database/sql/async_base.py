@@ -0,0 +1,115 @@
+import asyncio
+import logging
+import re
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from config.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# "(col, ...) VALUES %s", the execute_values form of a bulk insert
+_BULK_VALUES = re.compile(r'\(([^()]*)\)\s*VALUES\s+%s', re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def to_asyncpg(query: str) -> str:
+    """
+    Rewrite a psycopg2 query for asyncpg so both backends share the SQL in
+    queries/. %s placeholders become $1..$n and a bulk `VALUES %s` becomes a
+    single-row VALUES list, which is then run with executemany.
+    """
+    def single_row(match):
+        columns = match.group(1)
+        return f"({columns}) VALUES ({', '.join(['%s'] * len(columns.split(',')))})"
+
+    parts = _BULK_VALUES.sub(single_row, query).split('%s')
+    return ''.join(
+        part + (f'${index}' if index < len(parts) else '')
+        for index, part in enumerate(parts, 1)
+    ).replace('%%', '%')
+
+
+class AsyncSQLDatabase:
+    """
+    asyncpg-backed PostgreSQL database for the ingest path.
+
+    The pool is created on first use since it is bound to the running event
+    loop. asyncpg prepares every statement it runs and caches it per
+    connection, so the hot inserts and lookups skip parse/plan after the
+    first call. The schema is applied by SQLDatabase at startup.
+
+    Needs the optional asyncpg package, imported when the pool is created.
+    benchmarks/sql_backends.py checks the backend against psycopg2.
+    """
+    _shared = None
+
+    def __init__(self):
+        self.pool = None
+        self.logger = logger
+        self._lock = None
+
+    @classmethod
+    def shared(cls) -> 'AsyncSQLDatabase':
+        """
+        The process-wide instance, so every chain's operator draws from one pool.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    async def connect(self):
+        if self.pool is not None:
+            return self.pool
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self.pool is None:
+                import asyncpg
+                config = Settings.POSTGRES_CONFIG
+                self.pool = await asyncpg.create_pool(
+                    database=config['dbname'],
+                    user=config['user'],
+                    password=config['password'],
+                    host=config['host'],
+                    port=config['port'],
+                    min_size=Settings.SQL_POOL_MIN_CONNECTIONS,
+                    max_size=Settings.SQL_POOL_MAX_CONNECTIONS,
+                    statement_cache_size=Settings.SQL_STATEMENT_CACHE_SIZE,
+                    server_settings={'synchronous_commit': 'off', 'work_mem': Settings.SQL_WORK_MEM}
+                )
+                self.logger.info("asyncpg pool created.")
+        return self.pool
+
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Run one unit of work on a pooled connection inside a transaction.
+        """
+        pool = await self.connect()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                yield conn
+
+    async def fetch(self, query: str, *args):
+        pool = await self.connect()
+        return await pool.fetch(to_asyncpg(query), *args)
+
+    async def fetchrow(self, query: str, *args):
+        pool = await self.connect()
+        return await pool.fetchrow(to_asyncpg(query), *args)
+
+    async def execute(self, query: str, *args):
+        pool = await self.connect()
+        return await pool.execute(to_asyncpg(query), *args)
+
+    async def executemany(self, query: str, rows):
+        pool = await self.connect()
+        return await pool.executemany(to_asyncpg(query), rows)
+
+    async def close(self):
+        """
+        Close the pool.
+        """
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
@@ -1,7 +1,10 @@
 import psycopg2
 from psycopg2 import sql, pool
+from psycopg2.extras import RealDictCursor
+from contextlib import contextmanager
 import logging
 import os
+import threading
 from config.settings import Settings
 
 logger = logging.getLogger(__name__)
@@ -20,17 +23,22 @@ class SQLDatabase:
         self.host = host
         self.port = port
 
+        # Used for the schema and by maintenance scripts, operations lease pooled connections
         self.conn = psycopg2.connect(
             **Settings.POSTGRES_CONFIG
         )
         
+        # Bulk-insert tuning applies to every pooled session
         self.pool = psycopg2.pool.ThreadedConnectionPool(
-            minconn=5,
-            maxconn=100,
+            minconn=Settings.SQL_POOL_MIN_CONNECTIONS,
+            maxconn=Settings.SQL_POOL_MAX_CONNECTIONS,
+            options=f"-c synchronous_commit=off -c work_mem={Settings.SQL_WORK_MEM}",
             **Settings.POSTGRES_CONFIG
         )
+        # The pool raises when exhausted, callers wait for a free connection instead
+        self._available = threading.BoundedSemaphore(Settings.SQL_POOL_MAX_CONNECTIONS)
         
-        self.cursor = self.conn.cursor()
+        self.cursor = self.conn.cursor(cursor_factory=RealDictCursor)
         self.logger = logger
 
         schema_file = os.path.join(os.path.dirname(__file__), schema_file)
@@ -58,10 +66,45 @@ class SQLDatabase:
         self.conn.close()
         
     def get_connection(self):
-        return self.pool.getconn()
+        self._available.acquire()
+        try:
+            return self.pool.getconn()
+        except Exception:
+            self._available.release()
+            raise
 
     def return_connection(self, conn):
-        self.pool.putconn(conn)
+        try:
+            self.pool.putconn(conn)
+        finally:
+            self._available.release()
+
+    @contextmanager
+    def connection(self):
+        """
+        Lease a pooled connection for the duration of the block.
+        """
+        conn = self.get_connection()
+        try:
+            yield conn
+        finally:
+            self.return_connection(conn)
+
+    @contextmanager
+    def transaction(self, cursor_factory=RealDictCursor):
+        """
+        Run one unit of work on a leased connection. Commits when the block
+        exits cleanly and rolls back (and re-raises) on error, so concurrent
+        callers never share a cursor or a transaction.
+        """
+        with self.connection() as conn:
+            try:
+                with conn.cursor(cursor_factory=cursor_factory) as cursor:
+                    yield cursor
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
 
     def __del__(self):
         if hasattr(self, 'pool'):
@@ -0,0 +1,82 @@
+import struct
+from itertools import chain, repeat
+
+# PGCOPY signature, then no flags and an empty header extension
+HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+TRAILER = struct.pack('>h', -1)
+NULL = struct.pack('>i', -1)
+
+_LENGTH = struct.Struct('>i')
+_INT8 = struct.Struct('>iq')
+_FIELD_COUNT = struct.Struct('>h')
+_NUMERIC_ZERO = struct.pack('>ihhHh', 8, 0, 0, 0, 0)
+_NUMERIC_NEGATIVE = 0x4000
+
+
+def int8_field(value) -> bytes:
+    return NULL if value is None else _INT8.pack(8, value)
+
+
+def text_field(value) -> bytes:
+    if value is None:
+        return NULL
+    data = value.encode()
+    return _LENGTH.pack(len(data)) + data
+
+
+def numeric_field(value) -> bytes:
+    """
+    An integer in numeric's binary form: its base 10000 digits, most
+    significant first, with the weight of the first one.
+    """
+    if value is None:
+        return NULL
+    if value == 0:
+        return _NUMERIC_ZERO
+    sign = 0
+    if value < 0:
+        sign, value = _NUMERIC_NEGATIVE, -value
+    digits = []
+    while value:
+        value, digit = divmod(value, 10000)
+        digits.append(digit)
+    weight = len(digits) - 1
+    # Trailing zero digits are implied by the weight
+    while digits[0] == 0:
+        digits.pop(0)
+    digits.reverse()
+    return struct.pack(f'>ihhHh{len(digits)}h', 8 + 2 * len(digits), len(digits), weight, sign, 0, *digits)
+
+
+FIELD_ENCODERS = {
+    'int8': int8_field,
+    'text': text_field,
+    'numeric': numeric_field,
+}
+
+
+def encode_binary_copy(columns: list, rows: int) -> bytes:
+    """
+    Encode a COPY ... FROM STDIN WITH (FORMAT binary) stream from columns.
+
+    Each column is a (type, values) pair, type one of FIELD_ENCODERS and
+    values a list with one value per row, or a single value shared by every
+    row, which is encoded only once. Fields are encoded a column at a time
+    and interleaved into rows at the end.
+    """
+    fields = []
+    for kind, values in columns:
+        encode = FIELD_ENCODERS[kind]
+        if isinstance(values, list):
+            fields.append(list(map(encode, values)))
+        else:
+            fields.append(repeat(encode(values), rows))
+    field_count = repeat(_FIELD_COUNT.pack(len(columns)), rows)
+    return HEADER + b''.join(chain.from_iterable(zip(field_count, *fields))) + TRAILER
+
+
+def column_records(columns: list, rows: int):
+    """
+    The rows of the same (type, values) columns as tuples, for drivers that encode COPY themselves.
+    """
+    return zip(*(values if isinstance(values, list) else repeat(values, rows) for _, values in columns))
@@ -1,11 +1,14 @@
-from .blocks import BlockInsertOperations, BlockQueryOperations
-from .evm import EVMInsertOperations, EVMQueryOperations
+from .blocks import BlockInsertOperations, BlockQueryOperations, AsyncBlockInsertOperations, AsyncBlockQueryOperations
+from .evm import EVMInsertOperations, EVMQueryOperations, AsyncEVMInsertOperations, AsyncEVMQueryOperations
 from .bitcoin import BitcoinInsertOperations, BitcoinQueryOperations
 from .solana import SolanaInsertOperations, SolanaQueryOperations
 from .xrp import XRPInsertOperations, XRPQueryOperations
+from .backfill import BackfillInsertOperations, BackfillQueryOperations, AsyncBackfillInsertOperations, AsyncBackfillQueryOperations
 from .api import APIQueryOperations
 from .insert_ops import SQLInsertOperations
 from .query_ops import SQLQueryOperations
+from .async_insert_ops import AsyncSQLInsertOperations
+from .async_query_ops import AsyncSQLQueryOperations
 
 __all__ = [
     # Block Operations
@@ -18,10 +21,17 @@ __all__ = [
     SolanaInsertOperations, SolanaQueryOperations,
     # XRP Operations
     XRPInsertOperations, XRPQueryOperations,
+    # Backfill Operations
+    BackfillInsertOperations, BackfillQueryOperations,
     # API Operations
     APIQueryOperations,
     # Insert Operations
     SQLInsertOperations,
     # Query Operations
-    SQLQueryOperations
+    SQLQueryOperations,
+    # asyncpg Operations
+    AsyncBlockInsertOperations, AsyncBlockQueryOperations,
+    AsyncEVMInsertOperations, AsyncEVMQueryOperations,
+    AsyncBackfillInsertOperations, AsyncBackfillQueryOperations,
+    AsyncSQLInsertOperations, AsyncSQLQueryOperations
 ]
\ No newline at end of file
@@ -11,9 +11,10 @@ class APIQueryOperations(BaseOperations):
         try:
             query = get_swaps_by_chain(chain, seconds_ago)
 
-            self.db.cursor.execute(query)
-            results = self.db.cursor.fetchall()
-            return [dict(row) for row in results]
+            with self.db.transaction() as cursor:
+                cursor.execute(query)
+                results = cursor.fetchall()
+                return [dict(row) for row in results]
         except Exception as e:
             self.db.logger.error(f"Error fetching swaps for interval {chain} past {seconds_ago} seconds: {e}", exc_info=True)
             return []
@@ -22,9 +23,10 @@ class APIQueryOperations(BaseOperations):
         """Get swaps for all networks within a specific past interval"""
         try:
             query = get_swaps(seconds_ago)
-            self.db.cursor.execute(query)
-            results = self.db.cursor.fetchall()
-            return [dict(row) for row in results]
+            with self.db.transaction() as cursor:
+                cursor.execute(query)
+                results = cursor.fetchall()
+                return [dict(row) for row in results]
         except Exception as e:
             self.db.logger.error(f"Error fetching swaps for all networks for a {seconds_ago} second interval: {e}", exc_info=True)
             return []
@@ -0,0 +1,20 @@
+from ..async_base import AsyncSQLDatabase
+from .insert_ops import SQLInsertOperations
+from .blocks import AsyncBlockInsertOperations
+from .evm import AsyncEVMInsertOperations
+from .backfill import AsyncBackfillInsertOperations
+
+
+class AsyncSQLInsertOperations:
+    """
+    asyncpg insert operations for the ingest path, with the same layout as
+    SQLInsertOperations. Chains without async operations keep using psycopg2.
+    """
+    def __init__(self, db: AsyncSQLDatabase, fallback: SQLInsertOperations):
+        self.db = db
+        self.block = AsyncBlockInsertOperations(self.db, fallback.block)
+        self.evm = AsyncEVMInsertOperations(self.db, fallback.evm)
+        self.backfill = AsyncBackfillInsertOperations(self.db, fallback.backfill)
+        self.bitcoin = fallback.bitcoin
+        self.solana = fallback.solana
+        self.xrp = fallback.xrp
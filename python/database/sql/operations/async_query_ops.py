@@ -0,0 +1,21 @@
+from ..async_base import AsyncSQLDatabase
+from .query_ops import SQLQueryOperations
+from .blocks import AsyncBlockQueryOperations
+from .evm import AsyncEVMQueryOperations
+from .backfill import AsyncBackfillQueryOperations
+
+
+class AsyncSQLQueryOperations:
+    """
+    asyncpg query operations for the ingest path, with the same layout as
+    SQLQueryOperations. Reporting and API queries keep using psycopg2.
+    """
+    def __init__(self, db: AsyncSQLDatabase, fallback: SQLQueryOperations):
+        self.db = db
+        self.block = AsyncBlockQueryOperations(self.db, fallback.block)
+        self.evm = AsyncEVMQueryOperations(self.db, fallback.evm)
+        self.backfill = AsyncBackfillQueryOperations(self.db, fallback.backfill)
+        self.bitcoin = fallback.bitcoin
+        self.solana = fallback.solana
+        self.xrp = fallback.xrp
+        self.api = fallback.api
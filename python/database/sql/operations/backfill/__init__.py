@@ -0,0 +1,11 @@
+from .insert import BackfillInsertOperations
+from .query import BackfillQueryOperations
+from .async_insert import AsyncBackfillInsertOperations
+from .async_query import AsyncBackfillQueryOperations
+
+__all__ = [
+    BackfillInsertOperations,
+    BackfillQueryOperations,
+    AsyncBackfillInsertOperations,
+    AsyncBackfillQueryOperations
+]
@@ -0,0 +1,15 @@
+from ..base import AsyncBaseOperations
+from ...queries.backfill.insert import INSERT_BACKFILL_CHECKPOINT
+import time
+
+class AsyncBackfillInsertOperations(AsyncBaseOperations):
+    async def checkpoint(self, chain, range_start, range_end) -> bool:
+        """
+        Record a block range as fully processed for a chain.
+        """
+        try:
+            await self.db.execute(INSERT_BACKFILL_CHECKPOINT, chain, range_start, range_end, int(time.time()))
+            return True
+        except Exception as e:
+            self.db.logger.error(f"Error checkpointing {chain} range {range_start}-{range_end}: {e}")
+            return False
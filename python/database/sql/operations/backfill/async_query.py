@@ -0,0 +1,14 @@
+from ..base import AsyncBaseOperations
+from ...queries.backfill.query import QUERY_BACKFILL_CHECKPOINTS
+from typing import List, Dict, Any
+
+class AsyncBackfillQueryOperations(AsyncBaseOperations):
+    async def query_checkpoints(self, chain: str, start_block: int, end_block: int) -> List[Dict[str, Any]]:
+        """
+        Query completed ranges overlapping [start_block, end_block] for a chain.
+        """
+        try:
+            return [dict(row) for row in await self.db.fetch(QUERY_BACKFILL_CHECKPOINTS, chain, start_block, end_block)]
+        except Exception as e:
+            self.db.logger.error(f"Error querying backfill checkpoints for {chain}: {e}")
+            return []
@@ -0,0 +1,19 @@
+from ..base import BaseOperations
+from ...queries.backfill.insert import INSERT_BACKFILL_CHECKPOINT
+import time
+
+class BackfillInsertOperations(BaseOperations):
+    def __init__(self, db):
+        super().__init__(db)
+
+    def checkpoint(self, chain, range_start, range_end) -> bool:
+        """
+        Record a block range as fully processed for a chain.
+        """
+        try:
+            with self.db.transaction() as cursor:
+                cursor.execute(INSERT_BACKFILL_CHECKPOINT, (chain, range_start, range_end, int(time.time())))
+            return True
+        except Exception as e:
+            self.db.logger.error(f"Error checkpointing {chain} range {range_start}-{range_end}: {e}")
+            return False
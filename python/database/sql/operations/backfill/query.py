@@ -0,0 +1,19 @@
+from ..base import BaseOperations
+from ...queries.backfill.query import QUERY_BACKFILL_CHECKPOINTS
+from typing import List, Dict, Any
+
+class BackfillQueryOperations(BaseOperations):
+    def __init__(self, db):
+        super().__init__(db)
+
+    def query_checkpoints(self, chain: str, start_block: int, end_block: int) -> List[Dict[str, Any]]:
+        """
+        Query completed ranges overlapping [start_block, end_block] for a chain.
+        """
+        try:
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_BACKFILL_CHECKPOINTS, (chain, start_block, end_block))
+                return cursor.fetchall()
+        except Exception as e:
+            self.db.logger.error(f"Error querying backfill checkpoints for {chain}: {e}")
+            return []
@@ -1,7 +1,22 @@
 from ..base import SQLDatabase
-from psycopg2.extras import RealDictCursor
+from ..async_base import AsyncSQLDatabase
 
 class BaseOperations:
     def __init__(self, db: SQLDatabase):
         self.db = db
-        self.db.cursor = self.db.conn.cursor(cursor_factory=RealDictCursor)
\ No newline at end of file
+
+
+class AsyncBaseOperations:
+    """
+    Base for asyncpg operations. Operations a domain does not implement
+    asynchronously fall through to its psycopg2 counterpart.
+    """
+    def __init__(self, db: AsyncSQLDatabase, fallback: BaseOperations = None):
+        self.db = db
+        self.fallback = fallback
+
+    def __getattr__(self, name):
+        fallback = self.__dict__.get('fallback')
+        if fallback is None:
+            raise AttributeError(f"{type(self).__name__} has no attribute {name}")
+        return getattr(fallback, name)
@@ -15,12 +15,11 @@ class BitcoinInsertOperations(BaseOperations):
         try:
             self.db.logger.info(f"Inserting Bitcoin transaction {block_number} into PostgreSQL database in bulk.")
 
-            execute_values(self.db.cursor, INSERT_BITCOIN_TRANSACTIONS, transactions)
-            self.db.conn.commit()
+            with self.db.transaction() as cursor:
+                execute_values(cursor, INSERT_BITCOIN_TRANSACTIONS, transactions)
             
             self.db.logger.info(f"{len(transactions)} Bitcoin transactions inserted successfully in bulk.")
             return True
         except Exception as e:
             self.db.logger.error(f"Error inserting Bitcoin transactions: {e}")
-            self.db.conn.rollback()
             return False
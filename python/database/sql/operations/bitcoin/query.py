@@ -10,10 +10,11 @@ class BitcoinQueryOperations(BaseOperations):
         Query Bitcoin transactions for a specific block.
         """
         try:
-            self.db.cursor.execute(QUERY_BITCOIN_TRANSACTIONS, (
-                block_number,
-            ))
-            return self.db.cursor.fetchall()
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_BITCOIN_TRANSACTIONS, (
+                    block_number,
+                ))
+                return cursor.fetchall()
         except Exception as e:
             self.db.logger.error(f"Error querying Bitcoin transactions for block {block_number}: {e}")
             return []
@@ -23,10 +24,11 @@ class BitcoinQueryOperations(BaseOperations):
         Query recent Bitcoin transactions.
         """
         try:
-            self.db.cursor.execute(QUERY_RECENT_BITCOIN_TRANSACTIONS, (
-                limit,
-            ))
-            return self.db.cursor.fetchall()
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_RECENT_BITCOIN_TRANSACTIONS, (
+                    limit,
+                ))
+                return cursor.fetchall()
         except Exception as e:
             self.db.logger.error(f"Error querying recent Bitcoin transactions: {e}")
             return []
\ No newline at end of file
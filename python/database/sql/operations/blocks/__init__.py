@@ -1,7 +1,11 @@
 from .insert import BlockInsertOperations
 from .query import BlockQueryOperations
+from .async_insert import AsyncBlockInsertOperations
+from .async_query import AsyncBlockQueryOperations
 
 __all__ = [
     BlockInsertOperations,
-    BlockQueryOperations
+    BlockQueryOperations,
+    AsyncBlockInsertOperations,
+    AsyncBlockQueryOperations
 ]
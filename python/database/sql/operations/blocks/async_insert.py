@@ -0,0 +1,38 @@
+from ..base import AsyncBaseOperations
+from ...queries.blocks.insert import INSERT_BLOCK
+from ...queries.blocks.delete import (DELETE_BLOCKS_BY_HASH, DELETE_EVM_TRANSACTIONS_BY_HASH,
+                                      DELETE_EVM_SWAPS_BY_TRANSACTION, DELETE_EVM_SYNCS_BY_TRANSACTION)
+from ...async_base import to_asyncpg
+
+class AsyncBlockInsertOperations(AsyncBaseOperations):
+    async def insert_block(self, chain, block_number, block_hash, parent_hash, timestamp) -> bool:
+        """
+        Insert a block into the PostgreSQL database.
+        """
+        try:
+            await self.db.execute(INSERT_BLOCK, chain, block_number, block_hash, parent_hash, timestamp)
+            self.db.logger.info(f"{chain} block {block_number} inserted successfully into PostgreSQL database...")
+            return True
+        except Exception as e:
+            self.db.logger.error(f"Error inserting {chain} block {block_number} into PostgreSQL database: {e}")
+            return False
+
+    async def rollback_blocks(self, chain, block_hashes, transaction_hashes, since) -> bool:
+        """
+        Delete orphaned blocks and the transactions, swaps and syncs they
+        produced in a single transaction. `since` is the oldest orphaned
+        block's timestamp.
+        """
+        try:
+            self.db.logger.info(f"Rolling back {len(block_hashes)} {chain} blocks ({len(transaction_hashes)} transactions)...")
+
+            transaction_hashes = list(transaction_hashes)
+            async with self.db.transaction() as conn:
+                await conn.execute(to_asyncpg(DELETE_EVM_SWAPS_BY_TRANSACTION), chain, transaction_hashes, since)
+                await conn.execute(to_asyncpg(DELETE_EVM_SYNCS_BY_TRANSACTION), chain, transaction_hashes, since)
+                await conn.execute(to_asyncpg(DELETE_EVM_TRANSACTIONS_BY_HASH), chain, transaction_hashes, since)
+                await conn.execute(to_asyncpg(DELETE_BLOCKS_BY_HASH), chain, list(block_hashes), since)
+            return True
+        except Exception as e:
+            self.db.logger.error(f"Error rolling back {chain} blocks {block_hashes}: {e}")
+            return False
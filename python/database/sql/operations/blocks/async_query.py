@@ -0,0 +1,14 @@
+from ..base import AsyncBaseOperations
+from ...queries.blocks.query import QUERY_LATEST_BLOCK_NUMBER
+
+class AsyncBlockQueryOperations(AsyncBaseOperations):
+    async def query_latest_block_number(self, chain: str):
+        """
+        Query the highest block number persisted for a chain.
+        """
+        try:
+            result = await self.db.fetchrow(QUERY_LATEST_BLOCK_NUMBER, chain)
+            return result['block_number'] if result else None
+        except Exception as e:
+            self.db.logger.error(f"Error querying latest block for {chain}: {e}")
+            return None
@@ -1,5 +1,7 @@
 from ..base import BaseOperations
 from ...queries.blocks.insert import INSERT_BLOCK
+from ...queries.blocks.delete import (DELETE_BLOCKS_BY_HASH, DELETE_EVM_TRANSACTIONS_BY_HASH,
+                                      DELETE_EVM_SWAPS_BY_TRANSACTION, DELETE_EVM_SYNCS_BY_TRANSACTION)
 
 class BlockInsertOperations(BaseOperations):
     def __init__(self, db):
@@ -13,12 +15,31 @@ class BlockInsertOperations(BaseOperations):
         try:
             self.db.logger.info(f"Inserting {chain} block {block_number} into PostgreSQL database...")
             
-            self.db.cursor.execute(INSERT_BLOCK, (chain, block_number, block_hash, parent_hash, timestamp))
-            self.db.conn.commit()
+            with self.db.transaction() as cursor:
+                cursor.execute(INSERT_BLOCK, (chain, block_number, block_hash, parent_hash, timestamp))
             
             self.db.logger.info(f"{chain} block {block_number} inserted successfully into PostgreSQL database...")
             return True
         except Exception as e:
             self.db.logger.error(f"Error inserting {chain} block {block_number} into PostgreSQL database: {e}")
-            self.db.conn.rollback()
-            return False
\ No newline at end of file
+            return False
+
+    def rollback_blocks(self, chain, block_hashes, transaction_hashes, since) -> bool:
+        """
+        Delete orphaned blocks and the transactions, swaps and syncs they
+        produced in a single transaction. `since` is the oldest orphaned
+        block's timestamp.
+        """
+        try:
+            self.db.logger.info(f"Rolling back {len(block_hashes)} {chain} blocks ({len(transaction_hashes)} transactions)...")
+
+            transaction_hashes = list(transaction_hashes)
+            with self.db.transaction() as cursor:
+                cursor.execute(DELETE_EVM_SWAPS_BY_TRANSACTION, (chain, transaction_hashes, since))
+                cursor.execute(DELETE_EVM_SYNCS_BY_TRANSACTION, (chain, transaction_hashes, since))
+                cursor.execute(DELETE_EVM_TRANSACTIONS_BY_HASH, (chain, transaction_hashes, since))
+                cursor.execute(DELETE_BLOCKS_BY_HASH, (chain, list(block_hashes), since))
+            return True
+        except Exception as e:
+            self.db.logger.error(f"Error rolling back {chain} blocks {block_hashes}: {e}")
+            return False
@@ -1,6 +1,6 @@
 from ..base import BaseOperations
-from ...queries.blocks.query import QUERY_BLOCKS_BY_TIME, QUERY_RECENT_BLOCKS, QUERY_BLOCKS_BY_NETWORK, QUERY_RECENT_BLOCKS_BY_NETWORK
-from typing import List, Dict, Any
+from ...queries.blocks.query import QUERY_BLOCKS_BY_TIME, QUERY_RECENT_BLOCKS, QUERY_BLOCKS_BY_NETWORK, QUERY_RECENT_BLOCKS_BY_NETWORK, QUERY_LATEST_BLOCK_NUMBER
+from typing import List, Dict, Any, Optional
 
 class BlockQueryOperations(BaseOperations):
     def __init__(self, db):
@@ -12,8 +12,9 @@ class BlockQueryOperations(BaseOperations):
         """
         try:
             self.db.logger.info(f"Querying blocks between {start_time} and {end_time}")
-            self.db.cursor.execute(QUERY_BLOCKS_BY_TIME, (start_time, end_time))
-            return self.db.cursor.fetchall()
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_BLOCKS_BY_TIME, (start_time, end_time))
+                return cursor.fetchall()
         except Exception as e:
             self.db.logger.error(f"Error querying blocks by time: {e}")
             return []
@@ -23,8 +24,9 @@ class BlockQueryOperations(BaseOperations):
         Query blocks by network.
         """
         try:
-            self.db.cursor.execute(QUERY_BLOCKS_BY_NETWORK, (network,))
-            return self.db.cursor.fetchall()
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_BLOCKS_BY_NETWORK, (network,))
+                return cursor.fetchall()
         except Exception as e:
             self.db.logger.error(f"Error querying blocks by network: {e}")
             return []
@@ -34,8 +36,9 @@ class BlockQueryOperations(BaseOperations):
         Query recent blocks across all networks.
         """
         try:
-            self.db.cursor.execute(QUERY_RECENT_BLOCKS, (limit,))
-            return self.db.cursor.fetchall()
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_RECENT_BLOCKS, (limit,))
+                return cursor.fetchall()
         except Exception as e:
             self.db.logger.error(f"Error querying recent blocks: {e}")
             return []
@@ -45,9 +48,23 @@ class BlockQueryOperations(BaseOperations):
         Query recent blocks by network.
         """
         try:
-            self.db.cursor.execute(QUERY_RECENT_BLOCKS_BY_NETWORK, (network, limit))
-            return self.db.cursor.fetchall()
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_RECENT_BLOCKS_BY_NETWORK, (network, limit))
+                return cursor.fetchall()
         except Exception as e:
             
             self.db.logger.error(f"Error querying recent blocks by network: {e}")
             return []
+
+    def query_latest_block_number(self, chain: str) -> Optional[int]:
+        """
+        Query the highest block number persisted for a chain.
+        """
+        try:
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_LATEST_BLOCK_NUMBER, (chain,))
+                result = cursor.fetchone()
+                return result['block_number'] if result else None
+        except Exception as e:
+            self.db.logger.error(f"Error querying latest block for {chain}: {e}")
+            return None
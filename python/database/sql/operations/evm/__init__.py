@@ -1,7 +1,11 @@
 from .insert import EVMInsertOperations
 from .query import EVMQueryOperations
+from .async_insert import AsyncEVMInsertOperations
+from .async_query import AsyncEVMQueryOperations
 
 __all__ = [
     EVMInsertOperations,
-    EVMQueryOperations
+    EVMQueryOperations,
+    AsyncEVMInsertOperations,
+    AsyncEVMQueryOperations
 ]
\ No newline at end of file
@@ -0,0 +1,199 @@
+from typing import Any, Dict, List
+from ..base import AsyncBaseOperations
+from ...queries import (
+    INSERT_EVM_EVENTS, INSERT_EVM_CONTRACT_ABI,
+    INSERT_EVM_SWAP_INFO, INSERT_EVM_TOKEN_INFO, INSERT_EVM_CONTRACT_TO_FACTORY,
+    INSERT_EVM_SWAP, INSERT_EVM_SYNC, INSERT_EVM_SWAPS, INSERT_EVM_SYNCS,
+    EVM_TRANSACTION_COPY_COLUMNS, CREATE_EVM_TRANSACTIONS_STAGE, INSERT_EVM_TRANSACTIONS_FROM_STAGE
+)
+from ...async_base import to_asyncpg
+from ...copy import column_records
+import json
+
+class AsyncEVMInsertOperations(AsyncBaseOperations):
+    async def transactions(self, chain: str, columns: Dict[str, Any], block_number: int) -> bool:
+        """
+        Bulk insert a block's EVM transactions, given column-wise, with
+        asyncpg's binary COPY into the stage table and one move into the
+        partitioned table skipping transactions already stored.
+        """
+        try:
+            rows = len(columns['transaction_hash'])
+            records = column_records([(kind, columns[name]) for name, kind in EVM_TRANSACTION_COPY_COLUMNS], rows)
+            async with self.db.transaction() as conn:
+                await conn.execute(CREATE_EVM_TRANSACTIONS_STAGE)
+                await conn.copy_records_to_table(
+                    'evm_transactions_stage',
+                    records=records,
+                    columns=[name for name, _ in EVM_TRANSACTION_COPY_COLUMNS]
+                )
+                await conn.execute(INSERT_EVM_TRANSACTIONS_FROM_STAGE)
+            self.db.logger.info(f"Successfully inserted {rows} {chain} transactions into PostgreSQL database from block {block_number}.")
+            return True
+        except Exception as e:
+            self.db.logger.error(f"Error inserting {chain} transactions into PostgreSQL database: {e}")
+            return False
+
+    async def event(self, chain: str, event_object) -> bool:
+        """
+        Insert or update an EVM event signature.
+        """
+        try:
+            await self.db.execute(
+                INSERT_EVM_EVENTS,
+                chain,
+                event_object.signature_hash,
+                event_object.event_name,
+                event_object.decoded_signature,
+                json.dumps(event_object.input_types),
+                json.dumps(event_object.indexed_inputs),
+                json.dumps(event_object.input_names),
+                json.dumps(event_object.inputs),
+            )
+            self.db.logger.info(f"Successfully inserted EVM event {event_object.event_name} for chain {chain}.")
+            return True
+        except Exception as e:
+            self.db.logger.error(f"Error inserting EVM event for chain {chain}: {e}")
+            return False
+
+    async def contract_abi(self, chain: str, contract_address: str, abi: dict) -> bool:
+        """
+        Insert or update an EVM contract ABI.
+        """
+        try:
+            await self.db.execute(INSERT_EVM_CONTRACT_ABI, chain, contract_address, json.dumps(abi))
+            return True
+        except Exception as e:
+            self.db.logger.error(f"Error inserting EVM contract ABI for chain {chain}: {e}")
+            return False
+
+    async def swap_info(self, chain: str, swap_info) -> bool:
+        """
+        Insert or update an EVM swap.
+        """
+        try:
+            await self.db.execute(
+                INSERT_EVM_SWAP_INFO,
+                swap_info.address,
+                swap_info.factory,
+                swap_info.fee,
+                swap_info.token0_name,
+                swap_info.token1_name,
+                swap_info.token0_symbol,
+                swap_info.token1_symbol,
+                swap_info.token0_decimals,
+                swap_info.token1_decimals,
+                swap_info.token0_address,
+                swap_info.token1_address,
+                swap_info.name,
+                chain
+            )
+            self.db.logger.info(f"Successfully inserted EVM swap - {swap_info.address} - from {swap_info.token0_name} to {swap_info.token1_name} for chain {chain}.")
+            return True
+        except Exception as e:
+            self.db.logger.error(f"Error inserting EVM swap for chain {chain}: {e}")
+            return False
+
+    async def token_info(self, chain: str, token_info) -> bool:
+        """
+        Insert or update an EVM token info.
+        """
+        try:
+            await self.db.execute(
+                INSERT_EVM_TOKEN_INFO,
+                token_info.address,
+                token_info.name,
+                token_info.symbol,
+                token_info.decimals,
+                chain,
+            )
+            self.db.logger.info(f"Successfully inserted {token_info.name} info for chain {chain}.")
+            return True
+        except Exception as e:
+            self.db.logger.error(f"Error inserting EVM token info for chain {chain}: {e}")
+            return False
+
+    async def contract_to_factory(self, chain: str, contract_address: str, factory_address: str) -> bool:
+        """
+        Insert an EVM contract to factory mapping.
+        """
+        try:
+            await self.db.execute(INSERT_EVM_CONTRACT_TO_FACTORY, contract_address, factory_address, chain, None)
+            self.db.logger.info(f"Successfully inserted EVM contract {contract_address} to factory {factory_address} mapping for chain {chain}.")
+            return True
+        except Exception as e:
+            self.db.logger.error(f"Error inserting EVM contract {contract_address} to factory {factory_address} mapping for chain {chain}: {e}")
+            return False
+
+    async def swap(self, chain: str, swap_info, address: str, transaction_hash: str, log_index: int, timestamp: int) -> bool:
+        """
+        Insert an EVM transaction swap.
+        """
+        try:
+            await self.db.execute(
+                INSERT_EVM_SWAP,
+                chain,
+                address,
+                transaction_hash,
+                log_index,
+                timestamp,
+                swap_info.amount0,
+                swap_info.amount1,
+                swap_info.token0_address,
+                swap_info.token1_address,
+                swap_info.token0_name,
+                swap_info.token1_name,
+                swap_info.token0_symbol,
+                swap_info.token1_symbol,
+                swap_info.factory_address,
+                swap_info.name
+            )
+            return True
+        except Exception as e:
+            self.db.logger.error(f"Error inserting EVM transaction swap for chain {chain}: {e}")
+            return False
+
+    async def swaps_and_syncs(self, chain: str, swaps: List[tuple], syncs: List[tuple]) -> bool:
+        """
+        Bulk insert a block's swap and sync rows in a single transaction.
+        Rows already present are skipped, so a block can be safely replayed.
+        """
+        try:
+            async with self.db.transaction() as conn:
+                if swaps:
+                    await conn.executemany(to_asyncpg(INSERT_EVM_SWAPS), swaps)
+                if syncs:
+                    await conn.executemany(to_asyncpg(INSERT_EVM_SYNCS), syncs)
+            self.db.logger.info(f"Successfully inserted {len(swaps)} swaps and {len(syncs)} syncs for chain {chain}.")
+            return True
+        except Exception as e:
+            self.db.logger.error(f"Error inserting EVM swaps and syncs for chain {chain}: {e}")
+            return False
+
+    async def sync(self, chain: str, sync_info, address: str, transaction_hash: str, log_index: int, timestamp: int) -> bool:
+        """
+        Insert an EVM transaction sync.
+        """
+        try:
+            await self.db.execute(
+                INSERT_EVM_SYNC,
+                chain,
+                address,
+                transaction_hash,
+                log_index,
+                timestamp,
+                sync_info.reserve0,
+                sync_info.reserve1,
+                sync_info.token0_address,
+                sync_info.token1_address,
+                sync_info.token0_name,
+                sync_info.token1_name,
+                sync_info.token0_symbol,
+                sync_info.token1_symbol,
+                sync_info.factory_address,
+                sync_info.name
+            )
+            return True
+        except Exception as e:
+            self.db.logger.error(f"Error inserting EVM transaction sync for chain {chain}: {e}")
+            return False
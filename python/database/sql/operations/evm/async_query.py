@@ -0,0 +1,99 @@
+from ..base import AsyncBaseOperations
+from typing import Dict, Any, Optional
+from ...queries import (QUERY_EVM_CONTRACT_ABI, QUERY_EVM_SWAP_INFO_BY_CHAIN, QUERY_EVM_TOKEN_INFO_BY_CHAIN,
+                        QUERY_EVM_FACTORY_CONTRACT, QUERY_EVM_EVENT_BY_CHAIN)
+from ..models import EventSignature, ContractInfo, TokenInfo
+import json
+
+
+class AsyncEVMQueryOperations(AsyncBaseOperations):
+    """
+    The lookups made while ingesting blocks. Reporting queries fall through
+    to EVMQueryOperations.
+    """
+    async def event_by_chain(self, chain: str, signature_hash: str) -> Optional[EventSignature]:
+        """
+        Query an EVM event by its network and signature hash.
+        """
+        try:
+            result = await self.db.fetchrow(QUERY_EVM_EVENT_BY_CHAIN, chain, signature_hash)
+            if result:
+                return EventSignature(
+                    signature_hash=result.get('signature_hash'),
+                    event_name=result.get('event_name'),
+                    decoded_signature=result.get('decoded_signature'),
+                    input_types=json.loads(result.get('input_types')),
+                    indexed_inputs=json.loads(result.get('indexed_inputs')),
+                    input_names=json.loads(result.get('input_names')),
+                    inputs=json.loads(result.get('inputs')),
+                )
+            return None
+        except Exception as e:
+            self.db.logger.error(f"Error querying EVM event for chain {chain}: {e}")
+            return None
+
+    async def query_contract_abi(self, chain: str, contract_address: str) -> Optional[Dict[str, Any]]:
+        """
+        Query an EVM contract ABI by its network and address.
+        """
+        try:
+            result = await self.db.fetchrow(QUERY_EVM_CONTRACT_ABI, chain, contract_address)
+            return dict(result) if result else None
+        except Exception as e:
+            self.db.logger.error(f"Error querying EVM contract ABI for network {chain}: {e}")
+            return None
+
+    async def swap_info_by_chain(self, chain: str, contract_address: str) -> Optional[ContractInfo]:
+        """
+        Query an EVM swap by its network and address.
+        """
+        try:
+            result = await self.db.fetchrow(QUERY_EVM_SWAP_INFO_BY_CHAIN, chain, contract_address)
+            if result:
+                return ContractInfo(
+                    address=result.get('contract_address'),
+                    factory=result.get('factory_address'),
+                    fee=result.get('fee', None),
+                    token0_name=result.get('token0_name', None),
+                    token1_name=result.get('token1_name', None),
+                    token0_symbol=result.get('token0_symbol', None),
+                    token1_symbol=result.get('token1_symbol', None),
+                    token0_decimals=result.get('token0_decimals', None),
+                    token1_decimals=result.get('token1_decimals', None),
+                    token0_address=result.get('token0_address', None),
+                    token1_address=result.get('token1_address', None),
+                    name=result.get('name', None)
+                )
+            return None
+        except Exception as e:
+            self.db.logger.error(f"Error querying EVM swap for chain {chain}: {e}")
+            return None
+
+    async def token_info_by_chain(self, chain: str, token_address: str) -> Optional[TokenInfo]:
+        """
+        Query an EVM token info by its network and address.
+        """
+        try:
+            result = await self.db.fetchrow(QUERY_EVM_TOKEN_INFO_BY_CHAIN, chain, token_address)
+            if result:
+                return TokenInfo(
+                    address=result.get('contract_address'),
+                    name=result.get('name'),
+                    symbol=result.get('symbol'),
+                    decimals=result.get('decimals')
+                )
+            return None
+        except Exception as e:
+            self.db.logger.error(f"Error querying EVM token info for chain {chain}: {e}")
+            return None
+
+    async def factory_contract(self, chain: str, contract_address: str) -> Optional[Dict[str, Any]]:
+        """
+        Query an EVM factory contract by its chain and address.
+        """
+        try:
+            result = await self.db.fetchrow(QUERY_EVM_FACTORY_CONTRACT, chain, contract_address)
+            return dict(result) if result else None
+        except Exception as e:
+            self.db.logger.error(f"Error querying EVM factory contract for chain {chain}: {e}")
+            return None
@@ -4,7 +4,8 @@ from ...queries import (QUERY_EVM_FACTORY_CONTRACT, QUERY_EVM_TRANSACTIONS, QUER
                         QUERY_EVM_EVENT, QUERY_EVM_CONTRACT_ABI, QUERY_EVM_SWAP_INFO, QUERY_EVM_TOKEN_INFO_BY_CHAIN, 
                         QUERY_EVM_FACTORY_CONTRACT, QUERY_RECENT_EVM_TRANSACTIONS, QUERY_EVM_EVENT_BY_CONTRACT_ADDRESS, 
                         QUERY_EVM_EVENT_BY_CONTRACT_ADDRESS_ALL_NETWORKS, QUERY_ALL_EVM_SWAP_INFO, QUERY_ALL_EVM_SWAP_INFO_BY_CHAIN, 
-                        QUERY_EVM_SWAP_INFO_BY_CHAIN, QUERY_EVM_TOKEN_INFO, QUERY_EVM_EVENT_BY_CHAIN)
+                        QUERY_EVM_SWAP_INFO_BY_CHAIN, QUERY_EVM_TOKEN_INFO, QUERY_EVM_EVENT_BY_CHAIN,
+                        QUERY_ALL_EVM_TOKEN_INFO_BY_CHAIN, QUERY_ALL_EVM_EVENTS, QUERY_EVM_ABI_MISSES_BY_CHAIN)
 from ..models import EventSignature, ContractInfo, TokenInfo
 import json
 
@@ -18,11 +19,12 @@ class EVMQueryOperations(BaseOperations):
         Query EVM transactions for a specific block.
         """
         try:
-            self.db.cursor.execute(QUERY_EVM_TRANSACTIONS, (
-                chain, 
-                block_number
-            ))
-            return self.db.cursor.fetchall()
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_EVM_TRANSACTIONS, (
+                    chain, 
+                    block_number
+                ))
+                return cursor.fetchall()
         except Exception as e:
             self.db.logger.error(f"Error querying transactions for chain {chain}: {e}")
             return []
@@ -32,11 +34,12 @@ class EVMQueryOperations(BaseOperations):
         Query recent EVM transactions.
         """
         try:
-            self.db.cursor.execute(QUERY_RECENT_EVM_TRANSACTIONS, (
-                chain,
-                limit
-            ))
-            return self.db.cursor.fetchall()
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_RECENT_EVM_TRANSACTIONS, (
+                    chain,
+                    limit
+                ))
+                return cursor.fetchall()
         except Exception as e:
             self.db.logger.error(f"Error querying recent transactions for chain {chain}: {e}")
             return []
@@ -46,13 +49,14 @@ class EVMQueryOperations(BaseOperations):
         Query transaction history for an address using covering indexes.
         """
         try:
-            self.db.cursor.execute(QUERY_ADDRESS_HISTORY, (
-                chain, 
-                start_time, 
-                end_time, 
-                address,
-                address))
-            return self.db.cursor.fetchall()
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_ADDRESS_HISTORY, (
+                    chain, 
+                    start_time, 
+                    end_time, 
+                    address,
+                    address))
+                return cursor.fetchall()
         except Exception as e:
             self.db.logger.error(f"Error querying address history for chain {chain}: {e}")
             return []
@@ -63,13 +67,35 @@ class EVMQueryOperations(BaseOperations):
         """
         try:
 
-            self.db.cursor.execute(QUERY_EVM_EVENT_BY_CHAIN, (
-                chain, 
-                signature_hash
-            ))
-            result = self.db.cursor.fetchone()
-            if result:
-                return EventSignature(
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_EVM_EVENT_BY_CHAIN, (
+                    chain, 
+                    signature_hash
+                ))
+                result = cursor.fetchone()
+                if result:
+                    return EventSignature(
+                        signature_hash=result.get('signature_hash'),
+                        event_name=result.get('event_name'),
+                        decoded_signature=result.get('decoded_signature'),
+                        input_types=json.loads(result.get('input_types')),
+                        indexed_inputs=json.loads(result.get('indexed_inputs')),
+                        input_names=json.loads(result.get('input_names')),
+                        inputs=json.loads(result.get('inputs')),
+                    )
+                return None
+        except Exception as e:
+            self.db.logger.error(f"Error querying EVM event for chain {chain}: {e}")
+            return None
+        
+    def all_events(self) -> List[EventSignature]:
+        """
+        Query every distinct EVM event signature stored across all chains.
+        """
+        try:
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_ALL_EVM_EVENTS)
+                return [EventSignature(
                     signature_hash=result.get('signature_hash'),
                     event_name=result.get('event_name'),
                     decoded_signature=result.get('decoded_signature'),
@@ -77,21 +103,21 @@ class EVMQueryOperations(BaseOperations):
                     indexed_inputs=json.loads(result.get('indexed_inputs')),
                     input_names=json.loads(result.get('input_names')),
                     inputs=json.loads(result.get('inputs')),
-                )
-            return None
+                ) for result in cursor.fetchall()]
         except Exception as e:
-            self.db.logger.error(f"Error querying EVM event for chain {chain}: {e}")
-            return None
-        
+            self.db.logger.error(f"Error querying all EVM events: {e}")
+            return []
+
     def event(self, signature_hash: str) -> Optional[EventSignature]:
         """
         Query all EVM events for a chain.
         """
         try:
 
-            self.db.cursor.execute(QUERY_EVM_EVENT, (signature_hash,))
-            result = self.db.cursor.fetchone()
-            return result
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_EVM_EVENT, (signature_hash,))
+                result = cursor.fetchone()
+                return result
         except Exception as e:
             self.db.logger.error(f"Error querying EVM event for signature hash {signature_hash}: {e}")
             return []
@@ -101,11 +127,12 @@ class EVMQueryOperations(BaseOperations):
         Query an EVM contract ABI by its network and address.
         """
         try:
-            self.db.cursor.execute(QUERY_EVM_CONTRACT_ABI, (
-                chain,
-                contract_address
-            ))
-            return self.db.cursor.fetchone()
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_EVM_CONTRACT_ABI, (
+                    chain,
+                    contract_address
+                ))
+                return cursor.fetchone()
         except Exception as e:
             # Make debug
             self.db.logger.error(f"Error querying EVM contract ABI for network {chain}: {e}")
@@ -117,27 +144,28 @@ class EVMQueryOperations(BaseOperations):
         """
         # Change query to * rather than specific columns
         try:
-            self.db.cursor.execute(QUERY_EVM_SWAP_INFO_BY_CHAIN, (
-                chain,
-                contract_address
-            ))
-            result = self.db.cursor.fetchone()
-            if result:
-                return ContractInfo(
-                    address=result.get('contract_address'),
-                    factory=result.get('factory_address'),
-                    fee=result.get('fee', None),
-                    token0_name=result.get('token0_name', None),
-                    token1_name=result.get('token1_name', None),
-                    token0_symbol=result.get('token0_symbol', None),
-                    token1_symbol=result.get('token1_symbol', None),
-                    token0_decimals=result.get('token0_decimals', None),
-                    token1_decimals=result.get('token1_decimals', None),
-                    token0_address=result.get('token0_address', None),
-                    token1_address=result.get('token1_address', None),
-                    name=result.get('name', None)
-                )
-            return None
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_EVM_SWAP_INFO_BY_CHAIN, (
+                    chain,
+                    contract_address
+                ))
+                result = cursor.fetchone()
+                if result:
+                    return ContractInfo(
+                        address=result.get('contract_address'),
+                        factory=result.get('factory_address'),
+                        fee=result.get('fee', None),
+                        token0_name=result.get('token0_name', None),
+                        token1_name=result.get('token1_name', None),
+                        token0_symbol=result.get('token0_symbol', None),
+                        token1_symbol=result.get('token1_symbol', None),
+                        token0_decimals=result.get('token0_decimals', None),
+                        token1_decimals=result.get('token1_decimals', None),
+                        token0_address=result.get('token0_address', None),
+                        token1_address=result.get('token1_address', None),
+                        name=result.get('name', None)
+                    )
+                return None
         except Exception as e:
             self.db.logger.error(f"Error querying EVM swap for chain {chain}: {e}")
             return None
@@ -147,22 +175,23 @@ class EVMQueryOperations(BaseOperations):
         Query an EVM swap by its contract address across all chains.
         """
         try:
-            self.db.cursor.execute(QUERY_EVM_SWAP_INFO, (
-                contract_address,
-            ))
-            result =  self.db.cursor.fetchone()
-            if result:
-                return ContractInfo(
-                    address=result.get('contract_address'),
-                    factory=result.get('factory_address'),
-                    fee=result.get('fee', None),
-                    token0_name=result.get('token0_name', None),
-                    token1_name=result.get('token1_name', None),
-                    token0_address=result.get('token0_address', None),
-                    token1_address=result.get('token1_address', None),
-                    name=result.get('name', None)
-                )
-            return None
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_EVM_SWAP_INFO, (
+                    contract_address,
+                ))
+                result =  cursor.fetchone()
+                if result:
+                    return ContractInfo(
+                        address=result.get('contract_address'),
+                        factory=result.get('factory_address'),
+                        fee=result.get('fee', None),
+                        token0_name=result.get('token0_name', None),
+                        token1_name=result.get('token1_name', None),
+                        token0_address=result.get('token0_address', None),
+                        token1_address=result.get('token1_address', None),
+                        name=result.get('name', None)
+                    )
+                return None
         except Exception as e:
             self.db.logger.error(f"Error querying EVM swap for contract address {contract_address}: {e}")
             return None
@@ -172,19 +201,20 @@ class EVMQueryOperations(BaseOperations):
         Query an EVM token info by its network and address.
         """
         try:
-            self.db.cursor.execute(QUERY_EVM_TOKEN_INFO_BY_CHAIN, (
-                chain,
-                token_address
-            ))
-            result = self.db.cursor.fetchone()
-            if result:
-                return TokenInfo(
-                    address=result.get('contract_address'),
-                    name=result.get('name'),
-                    symbol=result.get('symbol'),
-                    decimals=result.get('decimals')
-                )
-            return None
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_EVM_TOKEN_INFO_BY_CHAIN, (
+                    chain,
+                    token_address
+                ))
+                result = cursor.fetchone()
+                if result:
+                    return TokenInfo(
+                        address=result.get('contract_address'),
+                        name=result.get('name'),
+                        symbol=result.get('symbol'),
+                        decimals=result.get('decimals')
+                    )
+                return None
         except Exception as e:
             self.db.logger.error(f"Error querying EVM token info for chain {chain}: {e}")
             return None
@@ -194,16 +224,17 @@ class EVMQueryOperations(BaseOperations):
         Query an EVM token info by its address across all networks.
         """
         try:
-            self.db.cursor.execute(QUERY_EVM_TOKEN_INFO, (token_address,))
-            result = self.db.cursor.fetchone()
-            if result:
-                return TokenInfo(
-                    address=result.get('contract_address'),
-                    name=result.get('name'),
-                    symbol=result.get('symbol'),
-                    decimals=result.get('decimals')
-                )
-            return None
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_EVM_TOKEN_INFO, (token_address,))
+                result = cursor.fetchone()
+                if result:
+                    return TokenInfo(
+                        address=result.get('contract_address'),
+                        name=result.get('name'),
+                        symbol=result.get('symbol'),
+                        decimals=result.get('decimals')
+                    )
+                return None
         except Exception as e:
             self.db.logger.error(f"Error querying EVM token info for address {token_address}: {e}")
             return None
@@ -213,11 +244,12 @@ class EVMQueryOperations(BaseOperations):
         Query an EVM factory contract by its chain and address.
         """
         try:
-            self.db.cursor.execute(QUERY_EVM_FACTORY_CONTRACT, (
-                chain,
-                contract_address
-            ))
-            return self.db.cursor.fetchone()
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_EVM_FACTORY_CONTRACT, (
+                    chain,
+                    contract_address
+                ))
+                return cursor.fetchone()
         except Exception as e:
             self.db.logger.error(f"Error querying EVM factory contract for chain {chain}: {e}")
             return None
@@ -228,20 +260,21 @@ class EVMQueryOperations(BaseOperations):
         Returns a list of events associated with the contract address on the specified chain.
         """
         try:
-            self.db.cursor.execute(QUERY_EVM_EVENT_BY_CONTRACT_ADDRESS, (
-                chain,
-                contract_address
-            ))
-            results = self.db.cursor.fetchall()
-            return [EventSignature(
-                signature_hash=result.get('signature_hash'),
-                name=result.get('name'),
-                full_signature=result.get('full_signature'),
-                input_types=json.loads(result.get('input_types')),
-                indexed_inputs=json.loads(result.get('indexed_inputs')),
-                inputs=json.loads(result.get('inputs')),
-                contract_address=result.get('contract_address')
-            ) for result in results] if results else []
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_EVM_EVENT_BY_CONTRACT_ADDRESS, (
+                    chain,
+                    contract_address
+                ))
+                results = cursor.fetchall()
+                return [EventSignature(
+                    signature_hash=result.get('signature_hash'),
+                    name=result.get('name'),
+                    full_signature=result.get('full_signature'),
+                    input_types=json.loads(result.get('input_types')),
+                    indexed_inputs=json.loads(result.get('indexed_inputs')),
+                    inputs=json.loads(result.get('inputs')),
+                    contract_address=result.get('contract_address')
+                ) for result in results] if results else []
         except Exception as e:
             self.db.logger.error(f"Error querying EVM events by contract address for chain {chain}: {e}")
             return []
@@ -252,17 +285,18 @@ class EVMQueryOperations(BaseOperations):
         Returns a list of events associated with the contract address regardless of chain.
         """
         try:
-            self.db.cursor.execute(QUERY_EVM_EVENT_BY_CONTRACT_ADDRESS_ALL_NETWORKS, (contract_address,))
-            results = self.db.cursor.fetchall()
-            return [EventSignature(
-                signature_hash=result.get('signature_hash'),
-                name=result.get('name'),
-                full_signature=result.get('full_signature'),
-                input_types=json.loads(result.get('input_types')),
-                indexed_inputs=json.loads(result.get('indexed_inputs')),
-                inputs=json.loads(result.get('inputs')),
-                contract_address=result.get('contract_address')
-            ) for result in results] if results else []
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_EVM_EVENT_BY_CONTRACT_ADDRESS_ALL_NETWORKS, (contract_address,))
+                results = cursor.fetchall()
+                return [EventSignature(
+                    signature_hash=result.get('signature_hash'),
+                    name=result.get('name'),
+                    full_signature=result.get('full_signature'),
+                    input_types=json.loads(result.get('input_types')),
+                    indexed_inputs=json.loads(result.get('indexed_inputs')),
+                    inputs=json.loads(result.get('inputs')),
+                    contract_address=result.get('contract_address')
+                ) for result in results] if results else []
         except Exception as e:
             self.db.logger.error(f"Error querying EVM events by contract address across all networks: {e}")
             return []
@@ -273,21 +307,47 @@ class EVMQueryOperations(BaseOperations):
         """
         try:
 
-            self.db.cursor.execute(QUERY_ALL_EVM_SWAP_INFO_BY_CHAIN, (chain,))
-            results = self.db.cursor.fetchall()
-            return results
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_ALL_EVM_SWAP_INFO_BY_CHAIN, (chain,))
+                results = cursor.fetchall()
+                return results
         except Exception as e:
             self.db.logger.error(f"Error querying all EVM swaps by chain {chain}: {e}")
             return []
+
+    def all_evm_token_info_by_chain(self, chain: str) -> List[Dict[str, Any]]:
+        """
+        Query all EVM token info by chain.
+        """
+        try:
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_ALL_EVM_TOKEN_INFO_BY_CHAIN, (chain,))
+                return cursor.fetchall()
+        except Exception as e:
+            self.db.logger.error(f"Error querying all EVM token info by chain {chain}: {e}")
+            return []
+
+    def abi_misses_by_chain(self, chain: str) -> List[Dict[str, Any]]:
+        """
+        Query the contracts the block explorer had no ABI for, by chain.
+        """
+        try:
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_EVM_ABI_MISSES_BY_CHAIN, (chain,))
+                return cursor.fetchall()
+        except Exception as e:
+            self.db.logger.error(f"Error querying EVM ABI misses by chain {chain}: {e}")
+            return []
         
     def all_evm_swap_info(self) -> List[Dict[str, Any]]:
         """
         Query all EVM swaps.
         """
         try:
-            self.db.cursor.execute(QUERY_ALL_EVM_SWAP_INFO)
-            results = self.db.cursor.fetchall()
-            return results
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_ALL_EVM_SWAP_INFO)
+                results = cursor.fetchall()
+                return results
         except Exception as e:
             self.db.logger.error(f"Error querying all EVM swaps: {e}")
             return []
@@ -6,19 +6,18 @@ from .evm import EVMInsertOperations
 from .bitcoin import BitcoinInsertOperations
 from .solana import SolanaInsertOperations
 from .xrp import XRPInsertOperations
+from .backfill import BackfillInsertOperations
 
 
 class SQLInsertOperations:
     def __init__(self, db: SQLDatabase):
         self.db = db
-        # Configure the cursor for optimal bulk inserts
-        self.db.cursor.execute("SET synchronous_commit = OFF")
-        self.db.cursor.execute("SET work_mem = '1GB'")
         self.block = BlockInsertOperations(self.db)
         self.evm = EVMInsertOperations(self.db)
         self.bitcoin = BitcoinInsertOperations(self.db)
         self.solana = SolanaInsertOperations(self.db)
         self.xrp = XRPInsertOperations(self.db)
+        self.backfill = BackfillInsertOperations(self.db)
 
     def insert_block(self, network, block_number, block_hash, parent_hash, timestamp):
         return self.block.insert_block(network, block_number, block_hash, parent_hash, timestamp)
@@ -1,12 +1,12 @@
 from ..base import SQLDatabase
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from psycopg2.extras import RealDictCursor
 from .blocks import BlockQueryOperations
 from .evm import EVMQueryOperations
 from .bitcoin import BitcoinQueryOperations
 from .solana import SolanaQueryOperations
 from .xrp import XRPQueryOperations
+from .backfill import BackfillQueryOperations
 from .api import APIQueryOperations
 
 class SQLQueryOperations:
@@ -15,14 +15,13 @@ class SQLQueryOperations:
     """
     def __init__(self, db: SQLDatabase):
         self.db = db
-        # Use RealDictCursor for more convenient dictionary access
-        self.db.cursor = self.db.conn.cursor(cursor_factory=RealDictCursor)
         
         self.block = BlockQueryOperations(self.db)
         self.evm = EVMQueryOperations(self.db)
         self.bitcoin = BitcoinQueryOperations(self.db)
         self.solana = SolanaQueryOperations(self.db)
         self.xrp = XRPQueryOperations(self.db)
+        self.backfill = BackfillQueryOperations(self.db)
         self.api = APIQueryOperations(self.db)
 
     def query_blocks_by_time(self, start_time: int, end_time: int) -> List[Dict[str, Any]]:
@@ -68,24 +67,25 @@ class SQLQueryOperations:
         Query high-value transactions using the partial index.
         """
         try:
-            if network == 'bitcoin':
-                self.db.cursor.execute("""
-                    SELECT block_number, transaction_id, value_satoshis, timestamp, fee
-                    FROM base_bitcoin_transactions
-                    WHERE value_satoshis > %s
-                    ORDER BY value_satoshis DESC
-                    LIMIT 100
-                """, (min_value,))
-            elif network in ['ethereum', 'bsc']:
-                self.db.cursor.execute("""
-                    SELECT block_number, transaction_hash, from_address, to_address, 
-                           value_wei, timestamp
-                    FROM base_evm_transactions
-                    WHERE network = %s AND value_wei > %s
-                    ORDER BY value_wei DESC
-                    LIMIT 100
-                """, (network, min_value))
-            return self.db.cursor.fetchall()
+            with self.db.transaction() as cursor:
+                if network == 'bitcoin':
+                    cursor.execute("""
+                        SELECT block_number, transaction_id, value_satoshis, timestamp, fee
+                        FROM base_bitcoin_transactions
+                        WHERE value_satoshis > %s
+                        ORDER BY value_satoshis DESC
+                        LIMIT 100
+                    """, (min_value,))
+                elif network in ['ethereum', 'bsc']:
+                    cursor.execute("""
+                        SELECT block_number, transaction_hash, from_address, to_address, 
+                               value_wei, timestamp
+                        FROM base_evm_transactions
+                        WHERE network = %s AND value_wei > %s
+                        ORDER BY value_wei DESC
+                        LIMIT 100
+                    """, (network, min_value))
+                return cursor.fetchall()
         except Exception as e:
             self.db.logger.error(f"Error querying high-value transactions: {e}")
             return []
\ No newline at end of file
@@ -15,16 +15,15 @@ class SolanaInsertOperations(BaseOperations):
         try:
             self.db.logger.info(f"Inserting Solana {block_number} transaction into PostgreSQL database in bulk.")
             
-            execute_values(
-                self.db.cursor, 
-                INSERT_SOLANA_TRANSACTIONS, 
-                transactions, 
-                page_size=1000
-            )
-            self.db.conn.commit()
+            with self.db.transaction() as cursor:
+                execute_values(
+                    cursor, 
+                    INSERT_SOLANA_TRANSACTIONS, 
+                    transactions, 
+                    page_size=1000
+                )
             self.db.logger.info(f"{len(transactions)} Solana transactions inserted successfully in bulk.")
             return True
         except Exception as e:
             self.db.logger.error(f"Error inserting Solana transaction: {e}")
-            self.db.conn.rollback()
             return False
\ No newline at end of file
@@ -15,16 +15,15 @@ class XRPInsertOperations(BaseOperations):
         try:
             self.db.logger.info(f"Inserting XRP transaction {block_number} into PostgreSQL database in bulk.")
             
-            execute_values(self.db.cursor, 
-                           INSERT_XRP_TRANSACTIONS, 
-                           transactions, 
-                           page_size=1000
-                           )
-            self.db.conn.commit()
+            with self.db.transaction() as cursor:
+                execute_values(cursor, 
+                               INSERT_XRP_TRANSACTIONS, 
+                               transactions, 
+                               page_size=1000
+                               )
             
             self.db.logger.info(f"{len(transactions)} XRP transactions inserted successfully in bulk.")
             return True
         except Exception as e:
             self.db.logger.error(f"Error inserting XRP transactions: {e}")
-            self.db.conn.rollback()
             return False
@@ -8,20 +8,22 @@ class XRPQueryOperations(BaseOperations):
 
     def query_xrp_transactions(self, block_number: int) -> List[Dict[str, Any]]:
         try:
-            self.db.cursor.execute(QUERY_XRP_TRANSACTIONS, (
-                block_number,
-                ))
-            return self.db.cursor.fetchall()
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_XRP_TRANSACTIONS, (
+                    block_number,
+                    ))
+                return cursor.fetchall()
         except Exception as e:
             self.db.logger.error(f"Error querying XRP transactions for block {block_number}: {e}")
             return []
     
     def query_recent_xrp_transactions(self, limit: int = 10) -> List[Dict[str, Any]]:
         try:
-            self.db.cursor.execute(QUERY_RECENT_XRP_TRANSACTIONS, (
-                limit,
-                ))
-            return self.db.cursor.fetchall()
+            with self.db.transaction() as cursor:
+                cursor.execute(QUERY_RECENT_XRP_TRANSACTIONS, (
+                    limit,
+                    ))
+                return cursor.fetchall()
         except Exception as e:
             self.db.logger.error(f"Error querying recent XRP transactions: {e}")
             return []
@@ -1,8 +1,35 @@
+import asyncio
+import inspect
 from .base import SQLDatabase
-from .operations import SQLQueryOperations, SQLInsertOperations
+from .async_base import AsyncSQLDatabase
+from .operations import SQLQueryOperations, SQLInsertOperations, AsyncSQLQueryOperations, AsyncSQLInsertOperations
 
 class SQLOperator:
     def __init__(self, db: SQLDatabase):
         self.db = db
         self.query = SQLQueryOperations(self.db)
-        self.insert = SQLInsertOperations(self.db)
\ No newline at end of file
+        self.insert = SQLInsertOperations(self.db)
+
+
+class AsyncSQLOperator:
+    """
+    SQLOperator backed by asyncpg (Settings.SQL_BACKEND = 'asyncpg'). Exposes
+    the same query/insert layout; operations without an async implementation
+    use the psycopg2 operator.
+    """
+    def __init__(self, db: AsyncSQLDatabase, sql_db: SQLDatabase):
+        self.db = db
+        fallback = SQLOperator(sql_db)
+        self.query = AsyncSQLQueryOperations(self.db, fallback.query)
+        self.insert = AsyncSQLInsertOperations(self.db, fallback.insert)
+
+
+async def run_sql(operation, *args):
+    """
+    Await an SQL operation from either backend. asyncpg operations are
+    awaited directly, psycopg2 ones run in a worker thread on their own
+    pooled connection so they don't block the event loop.
+    """
+    if inspect.iscoroutinefunction(operation):
+        return await operation(*args)
+    return await asyncio.to_thread(operation, *args)
@@ -0,0 +1,270 @@
+import bisect
+import logging
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from psycopg2 import sql
+from config.settings import Settings
+from .queries.partitions import (
+    QUERY_PARTITION_KIND, QUERY_RANGE_PARTITIONS, CREATE_CHAIN_PARTITION, CREATE_RANGE_PARTITION,
+    DETACH_RANGE_PARTITION, CREATE_ARCHIVE_SCHEMA, ARCHIVE_RANGE_PARTITION, DROP_RANGE_PARTITION
+)
+
+logger = logging.getLogger(__name__)
+
+# Tables whose network partitions are split into timestamp ranges
+TIME_PARTITIONED_TABLES = ('blocks', 'evm_transactions', 'evm_swaps', 'evm_syncs')
+
+_BOUND = re.compile(r"FROM \('?(-?\d+|MINVALUE)'?\) TO \('?(-?\d+|MAXVALUE)'?\)")
+_MIN, _MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def parse_range_bound(bound: str):
+    """
+    (start, end) of a range partition's bound expression, None for any other bound.
+    """
+    match = _BOUND.search(bound or '')
+    if match is None:
+        return None
+    start, end = match.groups()
+    return (_MIN if start == 'MINVALUE' else int(start), _MAX if end == 'MAXVALUE' else int(end))
+
+
+def uncovered(start: int, end: int, ranges: list) -> list:
+    """
+    The parts of [start, end) that none of the sorted, non-overlapping (start, end, name) ranges cover.
+    """
+    gaps = []
+    for low, high, _ in ranges:
+        if high <= start:
+            continue
+        if low >= end:
+            break
+        if low > start:
+            gaps.append((start, low))
+        start = max(start, high)
+        if start >= end:
+            break
+    if start < end:
+        gaps.append((start, end))
+    return gaps
+
+
+class PartitionManager:
+    """
+    Keeps one chain's blocks, evm_transactions, evm_swaps and evm_syncs
+    network partitions split into timestamp ranges of `interval` seconds (a
+    week by default). Each range carries its own small indexes, and queries
+    bounded on timestamp only open the ranges they need.
+
+    `ensure` creates the range holding a block's timestamp before the block
+    is written, so DDL only runs the first time a range is seen, e.g. while
+    backfilling. `maintain` creates the `premake` ranges ahead of now and,
+    when `retention` is set, detaches the ranges that ended longer ago,
+    moving them to `archive_schema` or dropping them when it is empty. Once
+    started, a background thread runs it every `maintenance_interval` seconds.
+
+    Network partitions created before they were split by time are plain
+    tables and are left as they are.
+    """
+    def __init__(self, db, chain: str, interval: int = None, premake: int = None, retention: int = None,
+                 archive_schema: str = None, maintenance_interval: float = None):
+        self.db = db
+        self.chain = chain
+        self.interval = interval or Settings.PARTITION_INTERVAL
+        self.premake = Settings.PARTITION_PREMAKE if premake is None else premake
+        self.retention = Settings.PARTITION_RETENTION if retention is None else retention
+        self.archive_schema = Settings.PARTITION_ARCHIVE_SCHEMA if archive_schema is None else archive_schema
+        self.maintenance_interval = maintenance_interval or Settings.PARTITION_MAINTENANCE_INTERVAL
+        self.logger = logger
+
+        self._lock = threading.Lock()
+        self._ranges = None  # network partition -> sorted [(start, end, name)], loaded on first use
+        self._covered = set()  # interval starts every network partition has a range for
+        self._stop = threading.Event()
+        self._thread = None
+
+        # Metrics
+        self.created = 0
+        self.expired = 0
+        self.failures = 0
+        self.maintenance_runs = 0
+
+    def covers(self, timestamp: int) -> bool:
+        """
+        Whether the range holding `timestamp` is known to exist, without touching the database.
+        """
+        return timestamp - timestamp % self.interval in self._covered
+
+    def ensure(self, timestamp: int):
+        """
+        Create the range holding `timestamp` under each network partition, if missing.
+        """
+        self.ensure_range(timestamp, timestamp + 1)
+
+    def ensure_range(self, start: int, end: int):
+        """
+        Create the ranges covering timestamps [start, end) under each network partition, if missing.
+        """
+        first = start - start % self.interval
+        with self._lock:
+            ranges = self._loaded()
+            for low in range(first, end, self.interval):
+                if low in self._covered:
+                    continue
+                complete = True
+                for parent, existing in ranges.items():
+                    # Ranges made with another interval are kept, only the gaps they leave are filled
+                    for gap_start, gap_end in uncovered(low, low + self.interval, existing):
+                        complete &= self._create(parent, existing, gap_start, gap_end)
+                if complete:
+                    self._covered.add(low)
+
+    def expire(self, before: int):
+        """
+        Detach the ranges ending at or before `before`, then archive or drop them.
+        """
+        with self._lock:
+            for parent, existing in self._loaded().items():
+                for entry in [entry for entry in existing if entry[1] <= before]:
+                    if self._expire(parent, entry):
+                        existing.remove(entry)
+            self._covered = {low for low in self._covered if low + self.interval > before}
+
+    def maintain(self, now: int = None):
+        """
+        Create the current and `premake` upcoming ranges and expire the ones past retention.
+        """
+        now = int(time.time()) if now is None else now
+        current = now - now % self.interval
+        self.ensure_range(current, current + (self.premake + 1) * self.interval)
+        if self.retention:
+            self.expire(now - self.retention)
+        self.maintenance_runs += 1
+
+    def _loaded(self) -> dict:
+        """
+        The ranges of every network partition split by time, read from the catalog on first use.
+        Called with the lock held, raises if the catalog cannot be read so the next call retries.
+        """
+        if self._ranges is None:
+            loaded = {f"{table}_{self.chain}": self._load(table) for table in TIME_PARTITIONED_TABLES}
+            self._ranges = {parent: existing for parent, existing in loaded.items() if existing is not None}
+            self.logger.info(f"{self.chain} partitions split by time: {sorted(self._ranges) or 'none'}")
+        return self._ranges
+
+    def _load(self, table: str):
+        """
+        The sorted ranges under a table's network partition, None when it is a plain table.
+        """
+        parent = f"{table}_{self.chain}"
+        with self.db.transaction() as cursor:
+            cursor.execute(QUERY_PARTITION_KIND, (parent,))
+            row = cursor.fetchone()
+            if row is None or row['relkind'] != 'p':
+                children = None
+            else:
+                cursor.execute(QUERY_RANGE_PARTITIONS, (parent,))
+                children = cursor.fetchall()
+        if row is None:
+            return self._create_chain_partition(table, parent)
+        if children is None:
+            return None
+        existing = []
+        for child in children:
+            bound = parse_range_bound(child['bound'])
+            if bound is not None:
+                existing.append((*bound, child['name']))
+        return sorted(existing)
+
+    def _create_chain_partition(self, table: str, parent: str):
+        try:
+            with self.db.transaction() as cursor:
+                cursor.execute(sql.SQL(CREATE_CHAIN_PARTITION).format(
+                    partition=sql.Identifier(parent), table=sql.Identifier(table), chain=sql.Literal(self.chain)
+                ))
+        except Exception as e:
+            # Tables whose key lacks timestamp, from before the split, cannot hold one
+            self.failures += 1
+            self.logger.error(f"Error creating partition {parent} split by time: {e}")
+            return None
+        self.logger.info(f"Created partition {parent} split by time")
+        return []
+
+    def _create(self, parent: str, existing: list, start: int, end: int) -> bool:
+        day = datetime.fromtimestamp(start, timezone.utc)
+        name = f"{parent}_{day:%Y%m%d}" if start % 86400 == 0 else f"{parent}_{day:%Y%m%d_%H%M%S}"
+        try:
+            with self.db.transaction() as cursor:
+                cursor.execute(sql.SQL(CREATE_RANGE_PARTITION).format(
+                    partition=sql.Identifier(name), parent=sql.Identifier(parent),
+                    start=sql.Literal(start), end=sql.Literal(end)
+                ))
+        except Exception as e:
+            self.failures += 1
+            self.logger.error(f"Error creating partition {name} for timestamps [{start}, {end}): {e}")
+            return False
+        bisect.insort(existing, (start, end, name))
+        self.created += 1
+        self.logger.info(f"Created partition {name} for timestamps [{start}, {end})")
+        return True
+
+    def _expire(self, parent: str, entry: tuple) -> bool:
+        start, end, name = entry
+        try:
+            # Detaching and archiving in one transaction, a range is never left detached in place
+            with self.db.transaction() as cursor:
+                cursor.execute(sql.SQL(DETACH_RANGE_PARTITION).format(
+                    parent=sql.Identifier(parent), partition=sql.Identifier(name)
+                ))
+                if self.archive_schema:
+                    schema = sql.Identifier(self.archive_schema)
+                    cursor.execute(sql.SQL(CREATE_ARCHIVE_SCHEMA).format(schema=schema))
+                    cursor.execute(sql.SQL(ARCHIVE_RANGE_PARTITION).format(partition=sql.Identifier(name), schema=schema))
+                else:
+                    cursor.execute(sql.SQL(DROP_RANGE_PARTITION).format(partition=sql.Identifier(name)))
+        except Exception as e:
+            self.failures += 1
+            self.logger.error(f"Error expiring partition {name}: {e}")
+            return False
+        self.expired += 1
+        where = f"archived to {self.archive_schema}" if self.archive_schema else "dropped"
+        self.logger.info(f"Detached partition {name} for timestamps [{start}, {end}), {where}")
+        return True
+
+    def start(self):
+        """
+        Run `maintain` in a background thread every `maintenance_interval` seconds.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=f'partitions-{self.chain}', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.maintenance_interval):
+            try:
+                self.maintain()
+            except Exception as e:
+                self.logger.error(f"Error maintaining {self.chain} partitions: {e}")
+
+    def close(self):
+        """
+        Stop the maintenance thread.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def stats(self) -> dict:
+        """Snapshot of the time ranges managed and the DDL run for them."""
+        ranges = self._ranges or {}
+        return {
+            "chain": self.chain,
+            "split_tables": len(ranges),
+            "ranges": sum(len(existing) for existing in ranges.values()),
+            "created": self.created,
+            "expired": self.expired,
+            "failures": self.failures,
+            "maintenance_runs": self.maintenance_runs,
+        }
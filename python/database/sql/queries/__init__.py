@@ -1,12 +1,15 @@
-from .blocks import INSERT_BLOCK, QUERY_BLOCKS_BY_TIME, QUERY_RECENT_BLOCKS, QUERY_BLOCKS_BY_NETWORK, QUERY_RECENT_BLOCKS_BY_NETWORK
+from .blocks import INSERT_BLOCK, QUERY_BLOCKS_BY_TIME, QUERY_RECENT_BLOCKS, QUERY_BLOCKS_BY_NETWORK, QUERY_RECENT_BLOCKS_BY_NETWORK, QUERY_LATEST_BLOCK_NUMBER
+from .blocks import DELETE_BLOCKS_BY_HASH, DELETE_EVM_TRANSACTIONS_BY_HASH, DELETE_EVM_SWAPS_BY_TRANSACTION, DELETE_EVM_SYNCS_BY_TRANSACTION
 
 from .evm import (INSERT_EVM_TRANSACTIONS, INSERT_EVM_EVENTS, INSERT_EVM_CONTRACT_ABI, INSERT_EVM_SWAP_INFO, INSERT_EVM_TOKEN_INFO, 
-                  INSERT_EVM_CONTRACT_TO_FACTORY, INSERT_EVM_SWAP, INSERT_EVM_SYNC,
+                  INSERT_EVM_CONTRACT_TO_FACTORY, INSERT_EVM_SWAP, INSERT_EVM_SYNC, INSERT_EVM_SWAPS, INSERT_EVM_SYNCS, INSERT_EVM_ABI_MISS,
+                  EVM_TRANSACTION_COPY_COLUMNS, CREATE_EVM_TRANSACTIONS_STAGE, COPY_EVM_TRANSACTIONS_STAGE, INSERT_EVM_TRANSACTIONS_FROM_STAGE,
                   QUERY_EVM_FACTORY_CONTRACT, QUERY_EVM_TRANSACTIONS,QUERY_ADDRESS_HISTORY, QUERY_EVM_EVENT, 
                   QUERY_EVM_CONTRACT_ABI, QUERY_EVM_SWAP_INFO, QUERY_EVM_TOKEN_INFO, QUERY_EVM_FACTORY_CONTRACT, 
 
                   QUERY_RECENT_EVM_TRANSACTIONS, QUERY_EVM_EVENT_BY_CONTRACT_ADDRESS, QUERY_EVM_EVENT_BY_CONTRACT_ADDRESS_ALL_NETWORKS, 
-                  QUERY_ALL_EVM_SWAP_INFO, QUERY_ALL_EVM_SWAP_INFO_BY_CHAIN, QUERY_EVM_SWAP_INFO_BY_CHAIN, QUERY_EVM_TOKEN_INFO_BY_CHAIN, QUERY_EVM_EVENT_BY_CHAIN)
+                  QUERY_ALL_EVM_SWAP_INFO, QUERY_ALL_EVM_SWAP_INFO_BY_CHAIN, QUERY_EVM_SWAP_INFO_BY_CHAIN, QUERY_EVM_TOKEN_INFO_BY_CHAIN, QUERY_EVM_EVENT_BY_CHAIN,
+                  QUERY_ALL_EVM_TOKEN_INFO_BY_CHAIN, QUERY_ALL_EVM_EVENTS, QUERY_EVM_ABI_MISSES_BY_CHAIN, DELETE_EVM_ABI_MISS)
 
 
 from .bitcoin import INSERT_BITCOIN_TRANSACTIONS, QUERY_BITCOIN_TRANSACTIONS, QUERY_RECENT_BITCOIN_TRANSACTIONS
@@ -15,18 +18,26 @@ from .solana import INSERT_SOLANA_TRANSACTIONS, QUERY_SOLANA_TRANSACTIONS, QUERY
 
 from .xrp import INSERT_XRP_TRANSACTIONS, QUERY_XRP_TRANSACTIONS, QUERY_RECENT_XRP_TRANSACTIONS
 
+from .backfill import INSERT_BACKFILL_CHECKPOINT, QUERY_BACKFILL_CHECKPOINTS
+
+from .partitions import (QUERY_PARTITION_KIND, QUERY_RANGE_PARTITIONS, CREATE_CHAIN_PARTITION, CREATE_RANGE_PARTITION,
+                         DETACH_RANGE_PARTITION, CREATE_ARCHIVE_SCHEMA, ARCHIVE_RANGE_PARTITION, DROP_RANGE_PARTITION)
+
 from .api import (get_swaps, get_swaps_by_chain)
 
 __all__ = [
     # Block Queries
     INSERT_BLOCK,
-    QUERY_BLOCKS_BY_TIME, QUERY_RECENT_BLOCKS, QUERY_BLOCKS_BY_NETWORK, QUERY_RECENT_BLOCKS_BY_NETWORK,
+    QUERY_BLOCKS_BY_TIME, QUERY_RECENT_BLOCKS, QUERY_BLOCKS_BY_NETWORK, QUERY_RECENT_BLOCKS_BY_NETWORK, QUERY_LATEST_BLOCK_NUMBER,
+    DELETE_BLOCKS_BY_HASH, DELETE_EVM_TRANSACTIONS_BY_HASH, DELETE_EVM_SWAPS_BY_TRANSACTION, DELETE_EVM_SYNCS_BY_TRANSACTION,
     # EVM Queries
-    INSERT_EVM_TRANSACTIONS, INSERT_EVM_EVENTS, INSERT_EVM_CONTRACT_ABI, INSERT_EVM_SWAP_INFO, INSERT_EVM_TOKEN_INFO, INSERT_EVM_CONTRACT_TO_FACTORY, INSERT_EVM_SWAP,
+    INSERT_EVM_TRANSACTIONS, INSERT_EVM_EVENTS, INSERT_EVM_CONTRACT_ABI, INSERT_EVM_SWAP_INFO, INSERT_EVM_TOKEN_INFO, INSERT_EVM_CONTRACT_TO_FACTORY, INSERT_EVM_SWAP, INSERT_EVM_SYNC, INSERT_EVM_SWAPS, INSERT_EVM_SYNCS, INSERT_EVM_ABI_MISS,
+    EVM_TRANSACTION_COPY_COLUMNS, CREATE_EVM_TRANSACTIONS_STAGE, COPY_EVM_TRANSACTIONS_STAGE, INSERT_EVM_TRANSACTIONS_FROM_STAGE,
     QUERY_EVM_FACTORY_CONTRACT, QUERY_EVM_TRANSACTIONS, QUERY_ADDRESS_HISTORY, QUERY_EVM_EVENT, 
     QUERY_EVM_CONTRACT_ABI, QUERY_EVM_SWAP_INFO, QUERY_EVM_TOKEN_INFO, QUERY_EVM_FACTORY_CONTRACT, QUERY_RECENT_EVM_TRANSACTIONS, 
     QUERY_EVM_EVENT_BY_CONTRACT_ADDRESS, QUERY_EVM_EVENT_BY_CONTRACT_ADDRESS_ALL_NETWORKS, QUERY_ALL_EVM_SWAP_INFO, QUERY_ALL_EVM_SWAP_INFO_BY_CHAIN,
-    QUERY_EVM_SWAP_INFO_BY_CHAIN, QUERY_EVM_TOKEN_INFO_BY_CHAIN, QUERY_EVM_EVENT_BY_CHAIN,
+    QUERY_EVM_SWAP_INFO_BY_CHAIN, QUERY_EVM_TOKEN_INFO_BY_CHAIN, QUERY_EVM_EVENT_BY_CHAIN, QUERY_ALL_EVM_TOKEN_INFO_BY_CHAIN, QUERY_ALL_EVM_EVENTS,
+    QUERY_EVM_ABI_MISSES_BY_CHAIN, DELETE_EVM_ABI_MISS,
     # Bitcoin Queries
     INSERT_BITCOIN_TRANSACTIONS, 
     QUERY_BITCOIN_TRANSACTIONS, QUERY_RECENT_BITCOIN_TRANSACTIONS,
@@ -36,6 +47,11 @@ __all__ = [
     # XRP Queries
     INSERT_XRP_TRANSACTIONS,
     QUERY_XRP_TRANSACTIONS, QUERY_RECENT_XRP_TRANSACTIONS,
+    # Backfill Queries
+    INSERT_BACKFILL_CHECKPOINT, QUERY_BACKFILL_CHECKPOINTS,
+    # Partition Queries
+    QUERY_PARTITION_KIND, QUERY_RANGE_PARTITIONS, CREATE_CHAIN_PARTITION, CREATE_RANGE_PARTITION,
+    DETACH_RANGE_PARTITION, CREATE_ARCHIVE_SCHEMA, ARCHIVE_RANGE_PARTITION, DROP_RANGE_PARTITION,
     # API Queries
     get_swaps, get_swaps_by_chain
 
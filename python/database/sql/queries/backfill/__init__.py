@@ -0,0 +1,7 @@
+from .insert import INSERT_BACKFILL_CHECKPOINT
+from .query import QUERY_BACKFILL_CHECKPOINTS
+
+__all__ = [
+    INSERT_BACKFILL_CHECKPOINT,
+    QUERY_BACKFILL_CHECKPOINTS
+]
@@ -0,0 +1,5 @@
+INSERT_BACKFILL_CHECKPOINT = """
+    INSERT INTO backfill_checkpoints (chain, range_start, range_end, completed_at)
+    VALUES (%s, %s, %s, %s)
+    ON CONFLICT (chain, range_start, range_end) DO UPDATE SET completed_at = EXCLUDED.completed_at
+"""
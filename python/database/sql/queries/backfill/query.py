@@ -0,0 +1,6 @@
+QUERY_BACKFILL_CHECKPOINTS = """
+    SELECT range_start, range_end
+    FROM backfill_checkpoints
+    WHERE chain = %s AND range_end >= %s AND range_start <= %s
+    ORDER BY range_start ASC;
+"""
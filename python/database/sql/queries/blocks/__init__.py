@@ -1,8 +1,9 @@
 from .insert import INSERT_BLOCK
-from .query import QUERY_BLOCKS_BY_TIME, QUERY_RECENT_BLOCKS, QUERY_BLOCKS_BY_NETWORK, QUERY_RECENT_BLOCKS_BY_NETWORK
+from .query import QUERY_BLOCKS_BY_TIME, QUERY_RECENT_BLOCKS, QUERY_BLOCKS_BY_NETWORK, QUERY_RECENT_BLOCKS_BY_NETWORK, QUERY_LATEST_BLOCK_NUMBER
+from .delete import DELETE_BLOCKS_BY_HASH, DELETE_EVM_TRANSACTIONS_BY_HASH, DELETE_EVM_SWAPS_BY_TRANSACTION, DELETE_EVM_SYNCS_BY_TRANSACTION
 
 __all__ = [
     INSERT_BLOCK,
-    QUERY_BLOCKS_BY_TIME, QUERY_RECENT_BLOCKS, QUERY_BLOCKS_BY_NETWORK, QUERY_RECENT_BLOCKS_BY_NETWORK
+    QUERY_BLOCKS_BY_TIME, QUERY_RECENT_BLOCKS, QUERY_BLOCKS_BY_NETWORK, QUERY_RECENT_BLOCKS_BY_NETWORK, QUERY_LATEST_BLOCK_NUMBER,
+    DELETE_BLOCKS_BY_HASH, DELETE_EVM_TRANSACTIONS_BY_HASH, DELETE_EVM_SWAPS_BY_TRANSACTION, DELETE_EVM_SYNCS_BY_TRANSACTION
 ]
-
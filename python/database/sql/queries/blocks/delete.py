@@ -0,0 +1,21 @@
+# Orphaned rows are bounded by the oldest orphaned block's timestamp, so only the
+# latest time range of each network partition is searched
+DELETE_BLOCKS_BY_HASH = """
+    DELETE FROM blocks
+    WHERE chain = %s AND block_hash = ANY(%s) AND timestamp >= %s
+"""
+
+DELETE_EVM_TRANSACTIONS_BY_HASH = """
+    DELETE FROM evm_transactions
+    WHERE chain = %s AND transaction_hash = ANY(%s) AND timestamp >= %s
+"""
+
+DELETE_EVM_SWAPS_BY_TRANSACTION = """
+    DELETE FROM evm_swaps
+    WHERE chain = %s AND transaction_hash = ANY(%s) AND timestamp >= %s
+"""
+
+DELETE_EVM_SYNCS_BY_TRANSACTION = """
+    DELETE FROM evm_syncs
+    WHERE chain = %s AND transaction_hash = ANY(%s) AND timestamp >= %s
+"""
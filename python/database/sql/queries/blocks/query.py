@@ -26,3 +26,12 @@ QUERY_RECENT_BLOCKS_BY_NETWORK = """
     ORDER BY block_number DESC
     LIMIT %s;
 """
+
+# Ordered by timestamp first so a network split into time ranges reads only its newest one
+QUERY_LATEST_BLOCK_NUMBER = """
+    SELECT block_number
+    FROM blocks
+    WHERE chain = %s
+    ORDER BY timestamp DESC, block_number DESC
+    LIMIT 1;
+"""
@@ -1,11 +1,17 @@
-from .insert import INSERT_EVM_TRANSACTIONS, INSERT_EVM_EVENTS, INSERT_EVM_CONTRACT_ABI, INSERT_EVM_SWAP_INFO, INSERT_EVM_TOKEN_INFO, INSERT_EVM_CONTRACT_TO_FACTORY, INSERT_EVM_SWAP, INSERT_EVM_SYNC
+from .insert import (INSERT_EVM_TRANSACTIONS, INSERT_EVM_EVENTS, INSERT_EVM_CONTRACT_ABI, INSERT_EVM_SWAP_INFO, INSERT_EVM_TOKEN_INFO, INSERT_EVM_CONTRACT_TO_FACTORY, INSERT_EVM_SWAP, INSERT_EVM_SYNC, INSERT_EVM_SWAPS, INSERT_EVM_SYNCS, INSERT_EVM_ABI_MISS,
+                     EVM_TRANSACTION_COPY_COLUMNS, CREATE_EVM_TRANSACTIONS_STAGE, COPY_EVM_TRANSACTIONS_STAGE, INSERT_EVM_TRANSACTIONS_FROM_STAGE)
 from .query import (QUERY_EVM_TRANSACTIONS, QUERY_ADDRESS_HISTORY, QUERY_EVM_EVENT, QUERY_EVM_CONTRACT_ABI, QUERY_EVM_SWAP_INFO, 
                     QUERY_EVM_TOKEN_INFO, QUERY_EVM_FACTORY_CONTRACT, QUERY_RECENT_EVM_TRANSACTIONS, QUERY_EVM_EVENT_BY_CONTRACT_ADDRESS, 
                     QUERY_EVM_EVENT_BY_CONTRACT_ADDRESS_ALL_NETWORKS, QUERY_ALL_EVM_SWAP_INFO, QUERY_ALL_EVM_SWAP_INFO_BY_CHAIN, 
-                    QUERY_EVM_SWAP_INFO_BY_CHAIN, QUERY_EVM_TOKEN_INFO_BY_CHAIN, QUERY_EVM_EVENT_BY_CHAIN)
+                    QUERY_EVM_SWAP_INFO_BY_CHAIN, QUERY_EVM_TOKEN_INFO_BY_CHAIN, QUERY_EVM_EVENT_BY_CHAIN,
+                    QUERY_ALL_EVM_TOKEN_INFO_BY_CHAIN, QUERY_ALL_EVM_EVENTS, QUERY_EVM_ABI_MISSES_BY_CHAIN)
+from .delete import DELETE_EVM_ABI_MISS
 __all__ = [
-    INSERT_EVM_TRANSACTIONS, INSERT_EVM_EVENTS, INSERT_EVM_CONTRACT_ABI, INSERT_EVM_SWAP_INFO, INSERT_EVM_TOKEN_INFO, INSERT_EVM_CONTRACT_TO_FACTORY, INSERT_EVM_SWAP, INSERT_EVM_SYNC,
+    INSERT_EVM_TRANSACTIONS, INSERT_EVM_EVENTS, INSERT_EVM_CONTRACT_ABI, INSERT_EVM_SWAP_INFO, INSERT_EVM_TOKEN_INFO, INSERT_EVM_CONTRACT_TO_FACTORY, INSERT_EVM_SWAP, INSERT_EVM_SYNC, INSERT_EVM_SWAPS, INSERT_EVM_SYNCS, INSERT_EVM_ABI_MISS,
+    EVM_TRANSACTION_COPY_COLUMNS, CREATE_EVM_TRANSACTIONS_STAGE, COPY_EVM_TRANSACTIONS_STAGE, INSERT_EVM_TRANSACTIONS_FROM_STAGE,
     QUERY_EVM_TRANSACTIONS, QUERY_ADDRESS_HISTORY, QUERY_EVM_EVENT, QUERY_EVM_CONTRACT_ABI, QUERY_EVM_SWAP_INFO, QUERY_EVM_TOKEN_INFO, QUERY_EVM_FACTORY_CONTRACT, QUERY_RECENT_EVM_TRANSACTIONS, QUERY_EVM_EVENT_BY_CONTRACT_ADDRESS, 
-    QUERY_EVM_EVENT_BY_CONTRACT_ADDRESS_ALL_NETWORKS, QUERY_ALL_EVM_SWAP_INFO, QUERY_ALL_EVM_SWAP_INFO_BY_CHAIN, QUERY_EVM_SWAP_INFO_BY_CHAIN, QUERY_EVM_TOKEN_INFO_BY_CHAIN, QUERY_EVM_EVENT_BY_CHAIN
+    QUERY_EVM_EVENT_BY_CONTRACT_ADDRESS_ALL_NETWORKS, QUERY_ALL_EVM_SWAP_INFO, QUERY_ALL_EVM_SWAP_INFO_BY_CHAIN, QUERY_EVM_SWAP_INFO_BY_CHAIN, QUERY_EVM_TOKEN_INFO_BY_CHAIN, QUERY_EVM_EVENT_BY_CHAIN,
+    QUERY_ALL_EVM_TOKEN_INFO_BY_CHAIN, QUERY_ALL_EVM_EVENTS, QUERY_EVM_ABI_MISSES_BY_CHAIN,
+    DELETE_EVM_ABI_MISS
 ]
 
@@ -0,0 +1,4 @@
+DELETE_EVM_ABI_MISS = """
+    DELETE FROM evm_abi_misses
+    WHERE chain = %s AND contract_address = %s
+"""
@@ -5,6 +5,40 @@ INSERT_EVM_TRANSACTIONS = """
     ON CONFLICT (chain, timestamp, transaction_hash) DO NOTHING
 """
 
+# Transactions are streamed with binary COPY into a session-local stage table, then moved
+# over with the same conflict handling, since COPY itself cannot skip rows already stored
+EVM_TRANSACTION_COPY_COLUMNS = (
+    ('block_number', 'int8'),
+    ('chain', 'text'),
+    ('transaction_hash', 'text'),
+    ('chain_id', 'int8'),
+    ('from_address', 'text'),
+    ('to_address', 'text'),
+    ('amount', 'numeric'),
+    ('total_gas', 'int8'),
+    ('timestamp', 'int8'),
+)
+
+CREATE_EVM_TRANSACTIONS_STAGE = """
+    CREATE TEMP TABLE IF NOT EXISTS evm_transactions_stage
+    (LIKE evm_transactions INCLUDING DEFAULTS)
+    ON COMMIT DELETE ROWS
+"""
+
+COPY_EVM_TRANSACTIONS_STAGE = """
+    COPY evm_transactions_stage
+    (block_number, chain, transaction_hash, chain_id, from_address, to_address, amount, total_gas, timestamp)
+    FROM STDIN WITH (FORMAT binary)
+"""
+
+INSERT_EVM_TRANSACTIONS_FROM_STAGE = """
+    INSERT INTO evm_transactions
+    (block_number, chain, transaction_hash, chain_id, from_address, to_address, amount, total_gas, timestamp)
+    SELECT block_number, chain, transaction_hash, chain_id, from_address, to_address, amount, total_gas, timestamp
+    FROM evm_transactions_stage
+    ON CONFLICT (chain, timestamp, transaction_hash) DO NOTHING
+"""
+
 INSERT_EVM_EVENTS = """
     INSERT INTO evm_decoded_events
     (chain, signature_hash, event_name, decoded_signature, input_types, indexed_inputs, input_names, inputs)
@@ -61,18 +95,40 @@ INSERT_EVM_CONTRACT_TO_FACTORY = """
     ON CONFLICT (contract_address, chain) DO NOTHING
 """
 
+# Swaps, syncs and blocks skip duplicates on any key, as it includes timestamp once their
+# network partitions are split into time ranges and not in databases created before
 INSERT_EVM_SWAP = """
     INSERT INTO evm_swaps
     (chain, contract_address, transaction_hash, log_index, timestamp, amount0, amount1, token0_address, token1_address, token0_name, token1_name, token0_symbol, token1_symbol, factory_address, name)
     VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-    ON CONFLICT (chain, transaction_hash, log_index) DO NOTHING
+    ON CONFLICT DO NOTHING
 """
 
 INSERT_EVM_SYNC = """
     INSERT INTO evm_syncs
     (chain, contract_address, transaction_hash, log_index, timestamp, reserve0, reserve1, token0_address, token1_address, token0_name, token1_name, token0_symbol, token1_symbol, factory_address, name)
     VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-    ON CONFLICT (chain, transaction_hash, log_index) DO NOTHING
+    ON CONFLICT DO NOTHING
 """
 
+INSERT_EVM_SWAPS = """
+    INSERT INTO evm_swaps
+    (chain, contract_address, transaction_hash, log_index, timestamp, amount0, amount1, token0_address, token1_address, token0_name, token1_name, token0_symbol, token1_symbol, factory_address, name)
+    VALUES %s
+    ON CONFLICT DO NOTHING
+"""
 
+INSERT_EVM_SYNCS = """
+    INSERT INTO evm_syncs
+    (chain, contract_address, transaction_hash, log_index, timestamp, reserve0, reserve1, token0_address, token1_address, token0_name, token1_name, token0_symbol, token1_symbol, factory_address, name)
+    VALUES %s
+    ON CONFLICT DO NOTHING
+"""
+
+INSERT_EVM_ABI_MISS = """
+    INSERT INTO evm_abi_misses (chain, contract_address, attempts, retry_at)
+    VALUES (%s, %s, %s, %s)
+    ON CONFLICT (chain, contract_address) DO UPDATE SET
+        attempts = EXCLUDED.attempts,
+        retry_at = EXCLUDED.retry_at
+"""
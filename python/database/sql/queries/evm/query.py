@@ -35,6 +35,12 @@ QUERY_EVM_EVENT_BY_CHAIN = """
     FROM evm_decoded_events
     WHERE chain = %s and signature_hash = %s;
 """
+QUERY_ALL_EVM_EVENTS = """
+    SELECT DISTINCT ON (signature_hash, indexed_inputs)
+        signature_hash, event_name, decoded_signature, input_types, indexed_inputs, input_names, inputs
+    FROM evm_decoded_events;
+"""
+
 QUERY_EVM_EVENT_BY_NAME = """
     SELECT *
     FROM evm_decoded_events
@@ -100,3 +106,15 @@ QUERY_ALL_EVM_SWAP_INFO_BY_CHAIN = """
     FROM evm_swap_info
     WHERE chain = %s;
 """
+
+QUERY_ALL_EVM_TOKEN_INFO_BY_CHAIN = """
+    SELECT contract_address, name, symbol, decimals
+    FROM evm_token_info
+    WHERE chain = %s;
+"""
+
+QUERY_EVM_ABI_MISSES_BY_CHAIN = """
+    SELECT contract_address, attempts, retry_at
+    FROM evm_abi_misses
+    WHERE chain = %s;
+"""
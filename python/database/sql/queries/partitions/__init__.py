@@ -0,0 +1,9 @@
+from .query import QUERY_PARTITION_KIND, QUERY_RANGE_PARTITIONS
+from .ddl import (CREATE_CHAIN_PARTITION, CREATE_RANGE_PARTITION, DETACH_RANGE_PARTITION,
+                  CREATE_ARCHIVE_SCHEMA, ARCHIVE_RANGE_PARTITION, DROP_RANGE_PARTITION)
+
+__all__ = [
+    QUERY_PARTITION_KIND, QUERY_RANGE_PARTITIONS,
+    CREATE_CHAIN_PARTITION, CREATE_RANGE_PARTITION, DETACH_RANGE_PARTITION,
+    CREATE_ARCHIVE_SCHEMA, ARCHIVE_RANGE_PARTITION, DROP_RANGE_PARTITION
+]
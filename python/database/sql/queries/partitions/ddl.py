@@ -0,0 +1,28 @@
+# Templates for psycopg2.sql, identifiers and bounds are filled in with sql.Identifier / sql.Literal
+
+CREATE_CHAIN_PARTITION = """
+    CREATE TABLE IF NOT EXISTS {partition} PARTITION OF {table}
+    FOR VALUES IN ({chain})
+    PARTITION BY RANGE (timestamp)
+"""
+
+CREATE_RANGE_PARTITION = """
+    CREATE TABLE IF NOT EXISTS {partition} PARTITION OF {parent}
+    FOR VALUES FROM ({start}) TO ({end})
+"""
+
+DETACH_RANGE_PARTITION = """
+    ALTER TABLE {parent} DETACH PARTITION {partition}
+"""
+
+CREATE_ARCHIVE_SCHEMA = """
+    CREATE SCHEMA IF NOT EXISTS {schema}
+"""
+
+ARCHIVE_RANGE_PARTITION = """
+    ALTER TABLE {partition} SET SCHEMA {schema}
+"""
+
+DROP_RANGE_PARTITION = """
+    DROP TABLE IF EXISTS {partition}
+"""
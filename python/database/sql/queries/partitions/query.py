@@ -0,0 +1,13 @@
+# 'p' when the network partition is itself partitioned, 'r' for a plain table, no row if missing
+QUERY_PARTITION_KIND = """
+    SELECT relkind
+    FROM pg_class
+    WHERE oid = to_regclass(%s);
+"""
+
+QUERY_RANGE_PARTITIONS = """
+    SELECT child.relname AS name, pg_get_expr(child.relpartbound, child.oid) AS bound
+    FROM pg_inherits
+    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+    WHERE pg_inherits.inhparent = to_regclass(%s);
+"""
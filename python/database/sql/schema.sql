@@ -1,28 +1,30 @@
--- Blocks table - Partitioned by network
+-- Blocks table - Partitioned by network, EVM networks then by timestamp range
+-- The ranges under the blocks, evm_transactions, evm_swaps and evm_syncs network partitions
+-- are created and expired by database/sql/partitions.py, so their keys include timestamp
 CREATE TABLE IF NOT EXISTS blocks (
     chain VARCHAR(20) NOT NULL,
     block_number BIGINT NOT NULL,
     block_hash VARCHAR(128) NOT NULL,
     parent_hash VARCHAR(128),
     timestamp BIGINT NOT NULL,
-    PRIMARY KEY (chain, block_hash)
+    PRIMARY KEY (chain, timestamp, block_hash)
 ) PARTITION BY LIST (chain);
 
 -- Create partitions for each network
-CREATE TABLE IF NOT EXISTS blocks_ethereum PARTITION OF blocks FOR VALUES IN ('ethereum');
+CREATE TABLE IF NOT EXISTS blocks_ethereum PARTITION OF blocks FOR VALUES IN ('ethereum') PARTITION BY RANGE (timestamp);
 CREATE TABLE IF NOT EXISTS blocks_bitcoin PARTITION OF blocks FOR VALUES IN ('bitcoin');
 CREATE TABLE IF NOT EXISTS blocks_xrp PARTITION OF blocks FOR VALUES IN ('xrp');
 CREATE TABLE IF NOT EXISTS blocks_solana PARTITION OF blocks FOR VALUES IN ('solana');
-CREATE TABLE IF NOT EXISTS blocks_bnb PARTITION OF blocks FOR VALUES IN ('bnb');
-CREATE TABLE IF NOT EXISTS blocks_base PARTITION OF blocks FOR VALUES IN ('base');
-CREATE TABLE IF NOT EXISTS blocks_arbitrum PARTITION OF blocks FOR VALUES IN ('arbitrum');
-CREATE TABLE IF NOT EXISTS blocks_avalanche PARTITION OF blocks FOR VALUES IN ('avalanche');
-CREATE TABLE IF NOT EXISTS blocks_polygon PARTITION OF blocks FOR VALUES IN ('polygon');
-CREATE TABLE IF NOT EXISTS blocks_optimism PARTITION OF blocks FOR VALUES IN ('optimism');
-CREATE TABLE IF NOT EXISTS blocks_polygonzk PARTITION OF blocks FOR VALUES IN ('polygonzk');
-CREATE TABLE IF NOT EXISTS blocks_zksync PARTITION OF blocks FOR VALUES IN ('zksync');
-CREATE TABLE IF NOT EXISTS blocks_mantle PARTITION OF blocks FOR VALUES IN ('mantle');
-CREATE TABLE IF NOT EXISTS blocks_linea PARTITION OF blocks FOR VALUES IN ('linea');
+CREATE TABLE IF NOT EXISTS blocks_bnb PARTITION OF blocks FOR VALUES IN ('bnb') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS blocks_base PARTITION OF blocks FOR VALUES IN ('base') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS blocks_arbitrum PARTITION OF blocks FOR VALUES IN ('arbitrum') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS blocks_avalanche PARTITION OF blocks FOR VALUES IN ('avalanche') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS blocks_polygon PARTITION OF blocks FOR VALUES IN ('polygon') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS blocks_optimism PARTITION OF blocks FOR VALUES IN ('optimism') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS blocks_polygonzk PARTITION OF blocks FOR VALUES IN ('polygonzk') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS blocks_zksync PARTITION OF blocks FOR VALUES IN ('zksync') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS blocks_mantle PARTITION OF blocks FOR VALUES IN ('mantle') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS blocks_linea PARTITION OF blocks FOR VALUES IN ('linea') PARTITION BY RANGE (timestamp);
 
 -- Block-specific indexes
 CREATE INDEX IF NOT EXISTS idx_blocks_timestamp 
@@ -32,7 +34,7 @@ CREATE INDEX IF NOT EXISTS idx_blocks_timestamp
 CREATE INDEX IF NOT EXISTS idx_blocks_hash 
     ON blocks USING btree (block_hash, chain);
 
--- EVM Transactions - Partitioned by network
+-- EVM Transactions - Partitioned by network, then by timestamp range
 CREATE TABLE IF NOT EXISTS evm_transactions (
     block_number BIGINT NOT NULL,
     chain VARCHAR(20) NOT NULL,
@@ -46,18 +48,18 @@ CREATE TABLE IF NOT EXISTS evm_transactions (
     PRIMARY KEY (chain, timestamp, transaction_hash)
 ) PARTITION BY LIST (chain);
 
--- Create network partitions
-CREATE TABLE IF NOT EXISTS evm_transactions_ethereum PARTITION OF evm_transactions FOR VALUES IN ('ethereum');
-CREATE TABLE IF NOT EXISTS evm_transactions_bnb PARTITION OF evm_transactions FOR VALUES IN ('bnb');
-CREATE TABLE IF NOT EXISTS evm_transactions_base PARTITION OF evm_transactions FOR VALUES IN ('base');
-CREATE TABLE IF NOT EXISTS evm_transactions_arbitrum PARTITION OF evm_transactions FOR VALUES IN ('arbitrum');
-CREATE TABLE IF NOT EXISTS evm_transactions_avalanche PARTITION OF evm_transactions FOR VALUES IN ('avalanche');
-CREATE TABLE IF NOT EXISTS evm_transactions_polygon PARTITION OF evm_transactions FOR VALUES IN ('polygon');
-CREATE TABLE IF NOT EXISTS evm_transactions_optimism PARTITION OF evm_transactions FOR VALUES IN ('optimism');
-CREATE TABLE IF NOT EXISTS evm_transactions_polygonzk PARTITION OF evm_transactions FOR VALUES IN ('polygonzk');
-CREATE TABLE IF NOT EXISTS evm_transactions_zksync PARTITION OF evm_transactions FOR VALUES IN ('zksync');
-CREATE TABLE IF NOT EXISTS evm_transactions_mantle PARTITION OF evm_transactions FOR VALUES IN ('mantle');
-CREATE TABLE IF NOT EXISTS evm_transactions_linea PARTITION OF evm_transactions FOR VALUES IN ('linea');
+-- Create network partitions, each split into timestamp ranges
+CREATE TABLE IF NOT EXISTS evm_transactions_ethereum PARTITION OF evm_transactions FOR VALUES IN ('ethereum') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_transactions_bnb PARTITION OF evm_transactions FOR VALUES IN ('bnb') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_transactions_base PARTITION OF evm_transactions FOR VALUES IN ('base') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_transactions_arbitrum PARTITION OF evm_transactions FOR VALUES IN ('arbitrum') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_transactions_avalanche PARTITION OF evm_transactions FOR VALUES IN ('avalanche') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_transactions_polygon PARTITION OF evm_transactions FOR VALUES IN ('polygon') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_transactions_optimism PARTITION OF evm_transactions FOR VALUES IN ('optimism') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_transactions_polygonzk PARTITION OF evm_transactions FOR VALUES IN ('polygonzk') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_transactions_zksync PARTITION OF evm_transactions FOR VALUES IN ('zksync') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_transactions_mantle PARTITION OF evm_transactions FOR VALUES IN ('mantle') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_transactions_linea PARTITION OF evm_transactions FOR VALUES IN ('linea') PARTITION BY RANGE (timestamp);
 
 
 
@@ -192,6 +194,15 @@ CREATE TABLE IF NOT EXISTS evm_contract_abis_linea PARTITION OF evm_contract_abi
 CREATE INDEX IF NOT EXISTS idx_evm_contract_abis_address 
     ON evm_contract_abis USING btree (contract_address, chain);
 
+-- EVM ABI misses, contracts the block explorer had no ABI for and when to ask again
+CREATE TABLE IF NOT EXISTS evm_abi_misses (
+    chain VARCHAR(20) NOT NULL,
+    contract_address VARCHAR(64) NOT NULL,
+    attempts INT NOT NULL,
+    retry_at BIGINT NOT NULL,
+    PRIMARY KEY (chain, contract_address)
+);
+
 -- EVM Swap Info table
 
 CREATE TABLE IF NOT EXISTS evm_swap_info (
@@ -309,22 +320,22 @@ CREATE TABLE IF NOT EXISTS evm_swaps (
     token1_symbol VARCHAR(100),
     factory_address VARCHAR(64),
     name VARCHAR(100),
-    PRIMARY KEY (chain, transaction_hash, log_index)
+    PRIMARY KEY (chain, timestamp, transaction_hash, log_index)
 ) PARTITION BY LIST (chain);
 
 
 -- EVM Partitions
-CREATE TABLE IF NOT EXISTS evm_swaps_ethereum PARTITION OF evm_swaps FOR VALUES IN ('ethereum');
-CREATE TABLE IF NOT EXISTS evm_swaps_bnb PARTITION OF evm_swaps FOR VALUES IN ('bnb');
-CREATE TABLE IF NOT EXISTS evm_swaps_base PARTITION OF evm_swaps FOR VALUES IN ('base');
-CREATE TABLE IF NOT EXISTS evm_swaps_arbitrum PARTITION OF evm_swaps FOR VALUES IN ('arbitrum');
-CREATE TABLE IF NOT EXISTS evm_swaps_avalanche PARTITION OF evm_swaps FOR VALUES IN ('avalanche');
-CREATE TABLE IF NOT EXISTS evm_swaps_polygon PARTITION OF evm_swaps FOR VALUES IN ('polygon');
-CREATE TABLE IF NOT EXISTS evm_swaps_optimism PARTITION OF evm_swaps FOR VALUES IN ('optimism');
-CREATE TABLE IF NOT EXISTS evm_swaps_polygonzk PARTITION OF evm_swaps FOR VALUES IN ('polygonzk');
-CREATE TABLE IF NOT EXISTS evm_swaps_zksync PARTITION OF evm_swaps FOR VALUES IN ('zksync');
-CREATE TABLE IF NOT EXISTS evm_swaps_mantle PARTITION OF evm_swaps FOR VALUES IN ('mantle');
-CREATE TABLE IF NOT EXISTS evm_swaps_linea PARTITION OF evm_swaps FOR VALUES IN ('linea');
+CREATE TABLE IF NOT EXISTS evm_swaps_ethereum PARTITION OF evm_swaps FOR VALUES IN ('ethereum') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_swaps_bnb PARTITION OF evm_swaps FOR VALUES IN ('bnb') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_swaps_base PARTITION OF evm_swaps FOR VALUES IN ('base') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_swaps_arbitrum PARTITION OF evm_swaps FOR VALUES IN ('arbitrum') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_swaps_avalanche PARTITION OF evm_swaps FOR VALUES IN ('avalanche') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_swaps_polygon PARTITION OF evm_swaps FOR VALUES IN ('polygon') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_swaps_optimism PARTITION OF evm_swaps FOR VALUES IN ('optimism') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_swaps_polygonzk PARTITION OF evm_swaps FOR VALUES IN ('polygonzk') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_swaps_zksync PARTITION OF evm_swaps FOR VALUES IN ('zksync') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_swaps_mantle PARTITION OF evm_swaps FOR VALUES IN ('mantle') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_swaps_linea PARTITION OF evm_swaps FOR VALUES IN ('linea') PARTITION BY RANGE (timestamp);
 
 
 
@@ -354,18 +365,18 @@ CREATE TABLE IF NOT EXISTS evm_syncs (
     token1_symbol VARCHAR(100),
     factory_address VARCHAR(64),
     name VARCHAR(100),
-    PRIMARY KEY (chain, transaction_hash, log_index)
+    PRIMARY KEY (chain, timestamp, transaction_hash, log_index)
 ) PARTITION BY LIST (chain);
 
 
-CREATE TABLE IF NOT EXISTS evm_syncs_ethereum PARTITION OF evm_syncs FOR VALUES IN ('ethereum');
-CREATE TABLE IF NOT EXISTS evm_syncs_bnb PARTITION OF evm_syncs FOR VALUES IN ('bnb');
-CREATE TABLE IF NOT EXISTS evm_syncs_base PARTITION OF evm_syncs FOR VALUES IN ('base');
-CREATE TABLE IF NOT EXISTS evm_syncs_arbitrum PARTITION OF evm_syncs FOR VALUES IN ('arbitrum');
-CREATE TABLE IF NOT EXISTS evm_syncs_avalanche PARTITION OF evm_syncs FOR VALUES IN ('avalanche');
-CREATE TABLE IF NOT EXISTS evm_syncs_polygon PARTITION OF evm_syncs FOR VALUES IN ('polygon');
-CREATE TABLE IF NOT EXISTS evm_syncs_optimism PARTITION OF evm_syncs FOR VALUES IN ('optimism');
-CREATE TABLE IF NOT EXISTS evm_syncs_polygonzk PARTITION OF evm_syncs FOR VALUES IN ('polygonzk');
+CREATE TABLE IF NOT EXISTS evm_syncs_ethereum PARTITION OF evm_syncs FOR VALUES IN ('ethereum') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_syncs_bnb PARTITION OF evm_syncs FOR VALUES IN ('bnb') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_syncs_base PARTITION OF evm_syncs FOR VALUES IN ('base') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_syncs_arbitrum PARTITION OF evm_syncs FOR VALUES IN ('arbitrum') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_syncs_avalanche PARTITION OF evm_syncs FOR VALUES IN ('avalanche') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_syncs_polygon PARTITION OF evm_syncs FOR VALUES IN ('polygon') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_syncs_optimism PARTITION OF evm_syncs FOR VALUES IN ('optimism') PARTITION BY RANGE (timestamp);
+CREATE TABLE IF NOT EXISTS evm_syncs_polygonzk PARTITION OF evm_syncs FOR VALUES IN ('polygonzk') PARTITION BY RANGE (timestamp);
 
 
 
@@ -376,3 +387,12 @@ CREATE INDEX IF NOT EXISTS idx_evm_syncs_tx
 CREATE INDEX IF NOT EXISTS idx_evm_syncs_contract 
     ON evm_syncs USING btree (contract_address, chain);
 
+
+-- Backfill checkpoints, one row per completed block range
+CREATE TABLE IF NOT EXISTS backfill_checkpoints (
+    chain VARCHAR(20) NOT NULL,
+    range_start BIGINT NOT NULL,
+    range_end BIGINT NOT NULL,
+    completed_at BIGINT NOT NULL,
+    PRIMARY KEY (chain, range_start, range_end)
+);
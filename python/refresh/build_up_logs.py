@@ -6,16 +6,33 @@ from chains import (
     BaseChainQuerier, BaseChainProcessor, BaseChainPipeline,
     BNBQuerier, BNBProcessor, BNBPipeline
 )
+from chains.evm_models.rpc import format_log
 from database import SQLDatabase, MongoDatabase
 import logging
 
 logging.basicConfig(level=logging.INFO)
 
+def read_archived_blocks(archive, block_numbers: set) -> dict:
+    """Read the blocks of a batch held in the local archive, streaming the range once"""
+    if archive is None or not block_numbers:
+        return {}
+    return {
+        block_number: archived
+        for block_number, archived in archive.iter_range(min(block_numbers), max(block_numbers))
+        if block_number in block_numbers
+    }
+
 async def process_chain_blocks(processor, blocks: List[tuple]):
-    """Process blocks for a specific chain"""
+    """Process blocks for a specific chain, replaying archived blocks without calling the node"""
+    archived_blocks = await asyncio.to_thread(read_archived_blocks, processor.archive, {b[1] for b in blocks})
     tasks = []
     for block_tuple in blocks:
         try:
+            archived = archived_blocks.get(block_tuple[1])
+            if archived is not None:
+                logs = [format_log(log) for log in archived['logs']]
+                tasks.append(processor.process_block(archived['block'], logs, archive=False))
+                continue
             # Convert tuple to the format process_block expects
             # block_tuple format is (network, block_number, timestamp)
             block_dict = {
@@ -24,7 +41,7 @@ async def process_chain_blocks(processor, blocks: List[tuple]):
                 'hash': None,  # Add other required fields
                 'parentHash': None
             }
-            tasks.append(processor.process_block(block_dict))
+            tasks.append(processor.process_block(block_dict, archive=False))
         except Exception as e:
             logging.error(f"Error processing block {block_tuple[1]}: {e}")
     
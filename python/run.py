@@ -1,7 +1,7 @@
 import asyncio
 from chains import (EthereumPipeline, BNBPipeline, BitcoinPipeline, SolanaPipeline, XRPPipeline, BaseChainPipeline, ArbitrumPipeline,
                     PolygonChainPipeline, OptimismChainPipeline, AvalancheChainPipeline, PolygonZKPipeline, ZkSyncPipeline, MantlePipeline,
-                    LineaPipeline
+                    LineaPipeline, EVMPipeline
                     )
 from database import SQLDatabase, MongoDatabase
 import logging
@@ -21,6 +21,8 @@ logging.basicConfig(
 
 # Add a list to track active pipelines
 active_pipelines = []
+# Databases every pipeline shares, closed once after they have all stopped
+shared_databases = []
 
 async def cleanup(pipelines):
     """Cleanup function to properly close all pipeline connections"""
@@ -31,6 +33,12 @@ async def cleanup(pipelines):
             cleanup_tasks.append(pipeline.websocket_handler.stop())
     if cleanup_tasks:
         await asyncio.gather(*cleanup_tasks)
+    # Process-wide resources are closed once, after every pipeline has stopped
+    await EVMPipeline.close_shared()
+    while shared_databases:
+        database = shared_databases.pop()
+        # Closing Mongo flushes its buffered writes
+        await asyncio.to_thread(database.close)
     logging.info("Cleanup completed")  # Add debug print
 
 async def signal_handler(sig, frame):
@@ -46,6 +54,7 @@ async def main():
     try:
         sql_database = SQLDatabase()
         mongodb_database = MongoDatabase()
+        shared_databases.extend([sql_database, mongodb_database])
 
         # Initialize pipelines
         ethereum_pipeline = EthereumPipeline(sql_database, mongodb_database)